@@ -0,0 +1,115 @@
+"""Compare latency of ``SkillsGenerator._assign_skill_points`` with the
+previous ``while points`` loop.
+
+"characters" inputs are taken from real characters: skills lists drawn
+from occupation plans, occupation and hobby points from base
+characteristics. "few skills" inputs put many points into three skills,
+close to their total headroom.
+
+Usage::
+
+    python -m benchmarks.bench_assign_skill_points [n]
+"""
+import gc
+import random
+import statistics
+import sys
+import time
+
+import cochar
+import cochar.skill
+
+GENERATOR = cochar.SKILLS_GENERATOR
+
+
+def legacy_assign_skill_points(points, skills_list, skills, rng=random):
+    for skill in skills_list:
+        if skill in GENERATOR.skills_all:
+            skills.setdefault(skill, GENERATOR.skills_data[skill])
+        else:
+            skills.setdefault(skill, 1)
+
+    while points:
+        skill = rng.choice(skills_list)
+        if points <= cochar.MAX_SKILL_LEVEL - skills[skill]:
+            points_allocation = rng.randint(0, points)
+        elif sum(list(skills.values())) % 90 == 0:
+            break
+        elif skills[skill] >= cochar.MAX_SKILL_LEVEL:
+            continue
+        else:
+            points_allocation = rng.randint(0, cochar.MAX_SKILL_LEVEL - skills[skill])
+        skills[skill] += points_allocation
+        points -= points_allocation
+
+    return skills
+
+
+def sample_inputs(n: int, rng: random.Random) -> list:
+    inputs = []
+    for _ in range(n):
+        age = cochar.generate_age(1925, "M", rng=rng)
+        (
+            strength,
+            _,
+            _,
+            dexterity,
+            appearance,
+            education,
+            intelligence,
+            power,
+            _,
+            _,
+        ) = cochar.generate_base_characteristics(age, rng=rng)
+        characteristics = (education, power, dexterity, appearance, strength)
+        occupation = cochar.occup.generate_occupation(*characteristics, rng=rng)
+        occupation_points = cochar.skill.calc_skill_points(occupation, *characteristics)
+        skills_list = GENERATOR.get_skill_plan(occupation).draw(rng)
+        inputs.append((occupation_points, skills_list))
+        inputs.append((intelligence * 2, GENERATOR.hobby_skill_plan.draw(rng)))
+    return inputs
+
+
+def sample_few_skills_inputs(n: int, rng: random.Random) -> list:
+    return [
+        (rng.randint(150, 240), rng.sample(GENERATOR.skills_basic, k=3))
+        for _ in range(n)
+    ]
+
+
+def measure(func, inputs, rng) -> list:
+    timings = []
+    gc.disable()
+    try:
+        for points, skills_list in inputs:
+            start = time.perf_counter()
+            func(points, skills_list, cochar.skill.SkillsDict(), rng=rng)
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return timings
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rng = random.Random(1925)
+    scenarios = (
+        ("characters", sample_inputs(n, rng)),
+        ("few skills", sample_few_skills_inputs(n, rng)),
+    )
+    for scenario, inputs in scenarios:
+        for name, func in (
+            ("legacy loop", legacy_assign_skill_points),
+            ("_assign_skill_points", GENERATOR._assign_skill_points),
+        ):
+            timings = sorted(measure(func, inputs, rng))
+            p50 = statistics.median(timings)
+            p99 = timings[int(len(timings) * 0.99)]
+            print(
+                f"{scenario:<10} {name:<22} p50: {p50 * 1e6:8.1f} us  "
+                f"p99: {p99 * 1e6:8.1f} us  max: {timings[-1] * 1e6:8.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
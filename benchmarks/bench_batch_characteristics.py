@@ -0,0 +1,39 @@
+"""Compare vectorised base characteristics with the per character function.
+
+Usage::
+
+    python -m benchmarks.bench_batch_characteristics [n]
+"""
+import sys
+import time
+
+import numpy as np
+
+import cochar
+import cochar.batch
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    ages = cochar.sample_ages(1925, "M", n)
+
+    sample = ages[:10000]
+    start = time.perf_counter()
+    for age in sample:
+        cochar.generate_base_characteristics(age)
+    per_character = (time.perf_counter() - start) / len(sample)
+    print(
+        f"generate_base_characteristics    {n} characters: {per_character * n:.3f} s (extrapolated)"
+    )
+
+    ages = np.array(ages)
+    rng = np.random.default_rng()
+    start = time.perf_counter()
+    cochar.batch.generate_base_characteristics(ages, rng)
+    print(
+        f"batch.generate_base_characteristics {n} characters: {time.perf_counter() - start:.3f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare vectorised skill points allocation with the per character method.
+
+Skills lists come from occupation plans and the hobby plan, points from
+base characteristics. Batch time includes building candidate skills
+and both chained allocations. To keep input preparation short, lists are drawn
+for a pool of characters and repeated.
+
+Usage::
+
+    python -m benchmarks.bench_batch_skill_points [n ...]
+"""
+import random
+import sys
+import time
+
+import numpy as np
+
+import cochar
+import cochar.batch
+import cochar.skill
+
+from benchmarks.bench_assign_skill_points import sample_inputs
+
+GENERATOR = cochar.SKILLS_GENERATOR
+POOL_SIZE = 5_000
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1:]] or [10_000, 1_000_000]
+    rng = random.Random(1925)
+    pool = sample_inputs(POOL_SIZE, rng)
+
+    sample = pool[:10_000]
+    start = time.perf_counter()
+    for points, skills_list in sample:
+        GENERATOR._assign_skill_points(
+            points, skills_list, cochar.skill.SkillsDict(), rng=rng
+        )
+    per_allocation = (time.perf_counter() - start) / len(sample)
+
+    np_rng = np.random.default_rng(1925)
+    for n in sizes:
+        # Pool holds occupation and hobby inputs of each character in turn
+        choice = 2 * np_rng.integers(0, len(pool) // 2, n)
+        occupations = [pool[i] for i in choice]
+        hobbies = [pool[i + 1] for i in choice]
+
+        start = time.perf_counter()
+        cochar.batch.generate_skills(
+            GENERATOR,
+            [skills_list for _, skills_list in occupations],
+            [skills_list for _, skills_list in hobbies],
+            np.array([points for points, _ in occupations]),
+            np.array([points for points, _ in hobbies]),
+            rng=np_rng,
+        )
+        batch = time.perf_counter() - start
+
+        print(
+            f"_assign_skill_points       {n:>9} characters: "
+            f"{per_allocation * 2 * n:8.3f} s (extrapolated)"
+        )
+        print(f"batch.generate_skills      {n:>8} characters: {batch:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Show that ``calc_skill_points`` and building its index don't depend
+on the number of occupations.
+
+Occupations data is extended with synthetic occupations. The index is
+built with the same function that builds ``cochar.OCCUPATIONS_GROUPS_INDEX``
+on import, and compared with the previous quadratic build. Then
+``calc_skill_points`` is compared with the previous implementation
+that scanned every group of ``cochar.OCCUPATIONS_GROUPS``.
+
+Usage::
+
+    python -m benchmarks.bench_calc_skill_points
+"""
+import timeit
+from unittest.mock import patch
+
+import cochar
+import cochar.skill
+
+SIZES = (len(cochar.OCCUPATIONS_LIST), 1_000, 10_000)
+OCCUPATION = "software tester"
+
+
+def legacy_calc_skill_points(
+    occupation, education, power, dexterity, appearance, strength
+):
+    skill_points_groups = (
+        education * 4,
+        education * 2 + power * 2,
+        education * 2 + dexterity * 2,
+        education * 2 + appearance * 2,
+        education * 2 + strength * 2,
+    )
+    group_index = [
+        index
+        for index, group in enumerate(cochar.OCCUPATIONS_GROUPS)
+        if occupation in group
+    ]
+    return max(skill_points_groups[i] for i in group_index)
+
+
+def legacy_index(occupations_data):
+    groups = [
+        [key for key, value in occupations_data.items() if group in value["groups"]]
+        for group in cochar.SKILL_POINTS_GROUPS
+    ]
+    return groups, {
+        occupation: tuple(i for i, group in enumerate(groups) if occupation in group)
+        for occupation in occupations_data
+    }
+
+
+def extended_data(size: int) -> dict:
+    data = dict(cochar.OCCUPATIONS_DATA)
+    for i in range(size - len(data)):
+        group = cochar.SKILL_POINTS_GROUPS[i % len(cochar.SKILL_POINTS_GROUPS)]
+        data[f"synthetic occupation {i}"] = {"groups": [group]}
+    return data
+
+
+def main():
+    for size in SIZES:
+        data = extended_data(size)
+        for name, func in (
+            ("legacy index", legacy_index),
+            ("index", cochar._index_occupations_groups),
+        ):
+            seconds = min(timeit.repeat(lambda: func(data), number=1, repeat=3))
+            print(f"{name:<18} {size:>7} occupations: {seconds * 1e3:9.2f} ms build")
+
+        groups, index = cochar._index_occupations_groups(data)
+        with patch("cochar.OCCUPATIONS_GROUPS", groups), patch(
+            "cochar.OCCUPATIONS_GROUPS_INDEX", index
+        ):
+            for name, func in (
+                ("legacy", legacy_calc_skill_points),
+                ("calc_skill_points", cochar.skill.calc_skill_points),
+            ):
+                number = 100 if name == "legacy" else 100_000
+                seconds = min(
+                    timeit.repeat(
+                        lambda: func(OCCUPATION, 50, 50, 50, 50, 50),
+                        number=number,
+                        repeat=3,
+                    )
+                )
+                print(
+                    f"{name:<18} {size:>7} occupations: "
+                    f"{seconds / number * 1e6:9.2f} us per call"
+                )
+
+
+if __name__ == "__main__":
+    main()
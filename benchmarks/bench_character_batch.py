@@ -0,0 +1,45 @@
+"""Compare export of characters to columns through ``get_json_format``
+with ``CharacterBatch``.
+
+Usage::
+
+    python -m benchmarks.bench_character_batch [n]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+import cochar
+import cochar.batch
+
+
+def pivot(characters) -> dict:
+    rows = [character.get_json_format() for character in characters]
+    columns = {key: [] for key in rows[0] if key != "skills"}
+    for row in rows:
+        for key in columns:
+            columns[key].append(row[key])
+    return {key: np.array(values) for key, values in columns.items()}
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    characters = cochar.create_characters(n, 1925, "US", seed=1)
+    batch = cochar.batch.CharacterBatch.from_characters(characters)
+    for name, func in (
+        ("get_json_format pivot", lambda: pivot(characters)),
+        (
+            "CharacterBatch.from_characters",
+            lambda: cochar.batch.CharacterBatch.from_characters(characters),
+        ),
+        ("CharacterBatch.to_dict_of_columns", batch.to_dict_of_columns),
+        ("CharacterBatch.to_records", batch.to_records),
+        ("CharacterBatch row views", lambda: list(batch)),
+    ):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:<34} {n} characters: {seconds * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Compare construction of ``Character`` with and without validation.
+
+Usage::
+
+    python -m benchmarks.bench_character_construction
+"""
+import timeit
+
+import cochar
+import cochar.character
+
+NUMBER = 20_000
+
+
+def main():
+    characters = cochar.create_characters(100, 1925, "US", seed=1)
+    # Generator passes skills as SkillsDict
+    kwargs = [
+        {**character.get_json_format(), "skills": character.skills}
+        for character in characters
+    ]
+    for name, construct in (
+        ("Character", cochar.character.Character),
+        ("Character._from_trusted", cochar.character.Character._from_trusted),
+    ):
+        seconds = min(
+            timeit.repeat(
+                lambda: [construct(**character) for character in kwargs],
+                number=NUMBER // len(kwargs),
+                repeat=3,
+            )
+        )
+        print(f"{name:<24} {seconds / NUMBER * 1e6:8.2f} us per character")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare memory held by ``Character`` and ``CompactCharacter`` objects.
+
+Memory is measured with ``tracemalloc``, as memory still allocated
+after converting characters and dropping temporary objects.
+Name strings are shared with the names pool and are not counted.
+
+Usage::
+
+    python -m benchmarks.bench_compact_character [n]
+"""
+import gc
+import sys
+import tracemalloc
+
+import cochar
+import cochar.character
+
+YEAR = 1925
+COUNTRY = "US"
+
+
+def held_memory(func) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, held
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    characters = cochar.create_characters(n, YEAR, COUNTRY, seed=1)
+    # Characters are copied, so names pool and other caches
+    # filled during generation are not counted
+    json_characters = [character.get_json_format() for character in characters]
+    del characters
+    characters, character_memory = held_memory(
+        lambda: [
+            cochar.character.Character(**character) for character in json_characters
+        ]
+    )
+    compact, compact_memory = held_memory(
+        lambda: [
+            cochar.character.CompactCharacter.from_character(character)
+            for character in characters
+        ]
+    )
+    assert [character.to_character() for character in compact] == characters
+
+    for name, memory in (
+        ("Character", character_memory),
+        ("CompactCharacter", compact_memory),
+    ):
+        print(
+            f"{name:<16} {n} characters: {memory / 2**20:8.2f} MiB "
+            f"({memory / n:7.0f} B per character)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Compare batch generation with a loop of ``create_character`` calls.
+
+Usage::
+
+    python -m benchmarks.bench_create_characters [n]
+"""
+import sys
+import timeit
+
+import cochar
+
+YEAR = 1925
+COUNTRY = "US"
+
+
+def loop(n: int) -> list:
+    return [cochar.create_character(YEAR, COUNTRY) for _ in range(n)]
+
+
+def batch(n: int) -> list:
+    return cochar.create_characters(n, YEAR, COUNTRY)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    for name, func in (("create_character loop", loop), ("create_characters", batch)):
+        seconds = min(timeit.repeat(lambda: func(n), number=1, repeat=3))
+        print(f"{name:<22} {n} characters: {seconds:.3f} s ({n / seconds:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
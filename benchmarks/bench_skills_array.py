@@ -0,0 +1,66 @@
+"""Compare ``SkillsDict`` and ``SkillsArray`` containers.
+
+Measures skill points allocation, reads of every skill of a character
+and size of the containers.
+
+Usage::
+
+    python -m benchmarks.bench_skills_array [n]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+import cochar
+import cochar.skill
+
+from benchmarks.bench_assign_skill_points import sample_inputs
+
+GENERATOR = cochar.SKILLS_GENERATOR
+
+
+def allocate(container, inputs, rng) -> list:
+    result = []
+    for points, skills_list in inputs:
+        skills = GENERATOR._assign_skill_points(
+            points, skills_list, container(), rng=rng
+        )
+        result.append(skills)
+    return result
+
+
+def read(all_skills) -> None:
+    for skills in all_skills:
+        for skill in skills:
+            skills[skill]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    inputs = sample_inputs(n // 2, random.Random(1925))
+    for container in (cochar.skill.SkillsDict, cochar.skill.SkillsArray):
+        # Memory is measured in a separate run, tracemalloc slows allocation down
+        allocation = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            allocate(container, inputs, random.Random(1))
+            allocation = min(allocation, time.perf_counter() - start)
+
+        tracemalloc.start()
+        all_skills = allocate(container, inputs, random.Random(1))
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        read(all_skills)
+        reading = time.perf_counter() - start
+        print(
+            f"{container.__name__:<11} allocation: {allocation / len(inputs) * 1e6:6.1f} us  "
+            f"reads: {reading / len(inputs) * 1e6:6.1f} us  "
+            f"memory: {memory / len(inputs):6.0f} B per container"
+        )
+
+
+if __name__ == "__main__":
+    main()
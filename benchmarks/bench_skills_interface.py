@@ -0,0 +1,72 @@
+"""Compare lookups of skills interfaces.
+
+Redis interface is measured against an in-process fake server,
+if ``fakeredis`` is installed.
+
+Usage::
+
+    python -m benchmarks.bench_skills_interface
+"""
+import os
+import tempfile
+import timeit
+
+import cochar
+import cochar.interface
+
+NUMBER = 100_000
+CATEGORIES = ("basic", "language", "firearms", "interpersonal")
+
+
+def lookups(interface):
+    interface.get_skills()
+    interface.get_all_skills_names()
+    interface.get_categories_names()
+    interface.get_basic_skills_names()
+    for category in CATEGORIES:
+        interface.get_skills_from_category(category)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        sql_database = os.path.join(directory, "skills.db")
+        cochar.interface.import_skills_to_sql(cochar.SKILLS_DATABASE, sql_database)
+
+        json_interface = cochar.interface.SkillsJSONInterface(cochar.SKILLS_DATABASE)
+        sql_interface = cochar.interface.SkillsSQLInterface(sql_database)
+        interfaces = [
+            ("json", json_interface, NUMBER),
+            ("sql, cached", sql_interface, NUMBER),
+            ("sql, uncached", sql_interface, NUMBER // 100),
+        ]
+        try:
+            import fakeredis
+        except ImportError:
+            pass
+        else:
+            client = fakeredis.FakeRedis(decode_responses=True)
+            cochar.interface.import_skills_to_redis(cochar.SKILLS_DATABASE, client)
+            redis_interface = cochar.interface.SkillsRedisInterface(client=client)
+            interfaces.append(("redis, cached", redis_interface, NUMBER))
+            interfaces.append(("redis, reload", redis_interface, NUMBER // 100))
+
+        for name, interface, number in interfaces:
+            setup = None
+            if name == "sql, uncached":
+                setup = sql_interface.clear_cache
+            elif name == "redis, reload":
+                setup = interface.reload
+            seconds = min(
+                timeit.repeat(
+                    lambda: (setup and setup(), lookups(interface)),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            print(f"{name:<14} {seconds / number * 1e6:8.2f} us per lookups round")
+
+        sql_interface.close()
+
+
+if __name__ == "__main__":
+    main()
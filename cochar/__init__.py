@@ -17,7 +17,7 @@ import os
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Union, Set
+from typing import Dict, List, Set, Tuple, Union
 
 import randname
 
@@ -73,6 +73,28 @@ VALUE_MATRIX = {
     "damage_bonus": ["-2", "-1", "0", "+1K4", "+1K6", "+2K6", "+3K6", "+4K6", "+5K6"],
 }
 
+# Skill points groups, in order of OCCUPATIONS_GROUPS
+SKILL_POINTS_GROUPS: Tuple[str, ...] = ("edu", "edupow", "edudex", "eduapp", "edustr")
+
+
+def _index_occupations_groups(
+    occupations_data: Dict[str, dict]
+) -> Tuple[List[List[str]], Dict[str, Tuple[int, ...]]]:
+    """Return occupations divided on skill points groups and indexes
+    of groups of each occupation, built in one pass over occupations data.
+    """
+    group_ids = {group: i for i, group in enumerate(SKILL_POINTS_GROUPS)}
+    groups: List[List[str]] = [[] for _ in SKILL_POINTS_GROUPS]
+    index: Dict[str, Tuple[int, ...]] = {}
+    for occupation, data in occupations_data.items():
+        index[occupation] = tuple(
+            sorted({group_ids[group] for group in data["groups"] if group in group_ids})
+        )
+        for i in index[occupation]:
+            groups[i].append(occupation)
+    return groups, index
+
+
 with open(
     os.path.join(_THIS_FOLDER, "data", "occupations.json"), "r", encoding="utf-8"
 ) as json_file:
@@ -81,14 +103,13 @@ with open(
     # OCCUPATIONS_DATA.pop("test")
     # Just occupations names in the list
     OCCUPATIONS_LIST: List[str] = list(OCCUPATIONS_DATA.keys())
-    # Occupations divided on 5 categories depends on skill point calculation method
-    OCCUPATIONS_GROUPS: List[List[str]] = [
-        [key for key, value in OCCUPATIONS_DATA.items() if "edu" in value["groups"]],
-        [key for key, value in OCCUPATIONS_DATA.items() if "edupow" in value["groups"]],
-        [key for key, value in OCCUPATIONS_DATA.items() if "edudex" in value["groups"]],
-        [key for key, value in OCCUPATIONS_DATA.items() if "eduapp" in value["groups"]],
-        [key for key, value in OCCUPATIONS_DATA.items() if "edustr" in value["groups"]],
-    ]
+    # Occupations divided on 5 categories depends on skill point calculation method,
+    # and indexes of OCCUPATIONS_GROUPS that contain the occupation
+    OCCUPATIONS_GROUPS: List[List[str]]
+    OCCUPATIONS_GROUPS_INDEX: Dict[str, Tuple[int, ...]]
+    OCCUPATIONS_GROUPS, OCCUPATIONS_GROUPS_INDEX = _index_occupations_groups(
+        OCCUPATIONS_DATA
+    )
 
 with open(
     os.path.join(_THIS_FOLDER, "data", "settings.json"), "r", encoding="utf-8"
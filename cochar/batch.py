@@ -0,0 +1,816 @@
+# Cochar - create a random character for Call of Cthulhu RPG 7th ed.
+# Copyright (C) 2023  Adam Walkiewicz
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""**Batch generation**
+Vectorised counterparts of the character generation functions,
+meant for generating large amount of characters at once.
+
+This module requires ``numpy``. Install it with ``pip install cochar[batch]``.
+
+Functions accept ``rng`` in any form accepted by ``numpy.random.default_rng``:
+``None``, an integer seed or a ``numpy.random.Generator``.
+"""
+from typing import Callable, Dict, Hashable, Iterable, Iterator, Sequence, Tuple, Union
+
+import numpy as np
+
+import cochar
+import cochar.character
+import cochar.cochar
+import cochar.error
+import cochar.skill
+
+RandomState = Union[None, int, np.random.Generator]
+
+CHARACTERISTICS: Tuple[str, ...] = (
+    "strength",
+    "condition",
+    "size",
+    "dexterity",
+    "appearance",
+    "education",
+    "intelligence",
+    "power",
+    "luck",
+    "move_rate",
+)
+CHARACTERISTICS_DTYPE = np.dtype([(name, np.int16) for name in CHARACTERISTICS])
+
+# Columns of CharacterBatch, in order of Character.get_json_format()
+CHARACTER_COLUMNS: Tuple[str, ...] = (
+    "year",
+    "country",
+    "first_name",
+    "last_name",
+    "age",
+    "sex",
+    "occupation",
+    "strength",
+    "condition",
+    "size",
+    "dexterity",
+    "appearance",
+    "education",
+    "intelligence",
+    "power",
+    "move_rate",
+    "luck",
+    "damage_bonus",
+    "build",
+    "dodge",
+    "sanity_points",
+    "magic_points",
+    "hit_points",
+)
+ENCODED_COLUMNS = frozenset(
+    ("country", "first_name", "last_name", "sex", "occupation", "damage_bonus")
+)
+INT16_RANGE = np.iinfo(np.int16)
+
+
+def age_modifiers_index(ages: np.ndarray) -> np.ndarray:
+    """Return index of ``cochar.MODIFIERS`` age range for each age.
+
+    Vectorised ``cochar.utils.narrowed_bisect``.
+
+    :param ages: characters' ages
+    :type ages: np.ndarray
+    :return: indexes of age ranges
+    :rtype: np.ndarray
+    """
+    age_range = np.asarray(cochar.MODIFIERS["age_range"])
+    index = np.searchsorted(age_range, ages, side="left")
+    return np.minimum(index, len(age_range) - 1)
+
+
+def generate_base_characteristics(
+    ages: np.ndarray, rng: RandomState = None
+) -> np.ndarray:
+    """Return base characteristics for each age.
+
+    Vectorised :func:`cochar.cochar.generate_base_characteristics`,
+    for each character draws the same values with the same distribution.
+
+    :param ages: characters' ages
+    :type ages: np.ndarray
+    :param rng: random number generator or seed, defaults to None
+    :type rng: np.random.Generator, optional
+    :return: structured array with ``CHARACTERISTICS`` fields
+    :rtype: np.ndarray
+
+    >>> stats = generate_base_characteristics(np.array([20, 45, 85]), rng=1)
+    >>> stats["strength"].shape
+    (3,)
+    """
+    rng = np.random.default_rng(rng)
+    ages = np.asarray(ages)
+    n = len(ages)
+
+    result = np.empty(n, dtype=CHARACTERISTICS_DTYPE)
+    strength = rng.integers(15, 91, n)
+    condition = rng.integers(15, 91, n)
+    result["size"] = size = rng.integers(40, 91, n)
+    dexterity = rng.integers(15, 91, n)
+    appearance = rng.integers(15, 91, n)
+    education = rng.integers(40, 91, n)
+    result["intelligence"] = rng.integers(40, 91, n)
+    result["power"] = rng.integers(15, 91, n)
+    luck = rng.integers(15, 91, n)
+    young = ages <= 19
+    luck[young] = np.maximum(luck[young], rng.integers(15, 91, np.count_nonzero(young)))
+    result["luck"] = luck
+
+    index = age_modifiers_index(ages)
+    mod_char_points = np.asarray(cochar.MODIFIERS["mod_char_points"])[index]
+    mod_app = np.asarray(cochar.MODIFIERS["mod_app"])[index]
+    mod_move_rate = np.asarray(cochar.MODIFIERS["mod_move_rate"])[index]
+    mod_edu = np.asarray(cochar.MODIFIERS["mod_edu"])[index]
+
+    result["appearance"] = np.where(appearance > mod_app, appearance - mod_app, 1)
+    strength, condition, dexterity = subtract_points_from_str_con_dex(
+        strength, condition, dexterity, mod_char_points, rng
+    )
+    result["strength"] = strength
+    result["condition"] = condition
+    result["dexterity"] = dexterity
+    result["education"] = characteristic_test(education, mod_edu, rng)
+    result["move_rate"] = calc_move_rate(strength, dexterity, size) - mod_move_rate
+
+    return result
+
+
+def subtract_points_from_str_con_dex(
+    strength: np.ndarray,
+    condition: np.ndarray,
+    dexterity: np.ndarray,
+    subtract_points: np.ndarray,
+    rng: RandomState = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorised :func:`cochar.cochar.subtract_points_from_str_con_dex`.
+
+    :param strength: characters' strength
+    :type strength: np.ndarray
+    :param condition: characters' condition
+    :type condition: np.ndarray
+    :param dexterity: characters' dexterity
+    :type dexterity: np.ndarray
+    :param subtract_points: amount of points to subtract from each character
+    :type subtract_points: np.ndarray
+    :param rng: random number generator or seed, defaults to None
+    :type rng: np.random.Generator, optional
+    :return: (strength, condition, dexterity)
+    :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    rng = np.random.default_rng(rng)
+    values = np.stack([strength, condition, dexterity], axis=1)
+    points = np.array(np.broadcast_to(subtract_points, len(values)))
+
+    rows = np.flatnonzero((points > 0) & (values > 1).any(axis=1))
+    while len(rows):
+        headroom = np.maximum(values[rows] - 1, 0)
+        draws = uniform_multinomial(points[rows], headroom > 0, rng)
+        subtracted = np.minimum(draws, headroom)
+        values[rows] -= subtracted
+        points[rows] -= subtracted.sum(axis=1)
+        saturated = (headroom == subtracted).all(axis=1)
+        rows = rows[(points[rows] > 0) & ~saturated]
+
+    return values[:, 0], values[:, 1], values[:, 2]
+
+
+def uniform_multinomial(
+    n: np.ndarray, available: np.ndarray, rng: RandomState = None
+) -> np.ndarray:
+    """Spread `n` draws uniformly among available columns, row by row.
+
+    Multinomial draw with a different number of trials and different
+    set of equally likely outcomes in each row, done as a chain
+    of binomial draws.
+
+    :param n: number of draws in each row
+    :type n: np.ndarray
+    :param available: boolean matrix, True for columns that can be drawn
+    :type available: np.ndarray
+    :param rng: random number generator or seed, defaults to None
+    :type rng: np.random.Generator, optional
+    :return: matrix with number of draws for each column
+    :rtype: np.ndarray
+    """
+    rng = np.random.default_rng(rng)
+    remaining = np.array(n)
+    left = available.sum(axis=1)
+    result = np.zeros(available.shape, dtype=remaining.dtype)
+    for column in range(available.shape[1]):
+        p = np.divide(
+            available[:, column], left, out=np.zeros(len(left)), where=left > 0
+        )
+        result[:, column] = rng.binomial(remaining, p)
+        remaining -= result[:, column]
+        left -= available[:, column]
+    return result
+
+
+def characteristic_test(
+    tested_value: np.ndarray, repetition: np.ndarray, rng: RandomState = None
+) -> np.ndarray:
+    """Vectorised :func:`cochar.cochar.characteristic_test`.
+
+    :param tested_value: tested values
+    :type tested_value: np.ndarray
+    :param repetition: how many test to perform for each value
+    :type repetition: np.ndarray
+    :param rng: random number generator or seed, defaults to None
+    :type rng: np.random.Generator, optional
+    :return: unchanged or increased tested values, but not higher than 99
+    :rtype: np.ndarray
+    """
+    return draw_from_distributions(
+        tested_value,
+        repetition,
+        cochar.cochar.characteristic_test_distribution,
+        rng,
+    )
+
+
+def skill_test(
+    tested_value: np.ndarray, repetition: np.ndarray, rng: RandomState = None
+) -> np.ndarray:
+    """Vectorised :func:`cochar.skill.skill_test`.
+
+    :param tested_value: tested values
+    :type tested_value: np.ndarray
+    :param repetition: how many test to perform for each value
+    :type repetition: np.ndarray
+    :param rng: random number generator or seed, defaults to None
+    :type rng: np.random.Generator, optional
+    :return: unchanged or increased tested values
+    :rtype: np.ndarray
+    """
+    return draw_from_distributions(
+        tested_value, repetition, cochar.skill.skill_test_distribution, rng
+    )
+
+
+def draw_from_distributions(
+    tested_value: np.ndarray,
+    repetition: np.ndarray,
+    distribution: Callable[[int, int], Tuple[Tuple[int, ...], Tuple[int, ...]]],
+    rng: RandomState = None,
+) -> np.ndarray:
+    """Draw test outcome for each (tested value, repetition) pair.
+
+    Distribution tables are taken once per distinct pair, then every
+    outcome is a single lookup in the table.
+
+    :param tested_value: tested values
+    :type tested_value: np.ndarray
+    :param repetition: how many test to perform for each value
+    :type repetition: np.ndarray
+    :param distribution: function returning (outcomes, cumulative weights) for a pair
+    :type distribution: Callable
+    :param rng: random number generator or seed, defaults to None
+    :type rng: np.random.Generator, optional
+    :return: test outcomes
+    :rtype: np.ndarray
+    """
+    rng = np.random.default_rng(rng)
+    tested_value = np.asarray(tested_value, dtype=np.int64)
+    repetition = np.broadcast_to(repetition, tested_value.shape).astype(np.int64)
+    if not len(tested_value):
+        return tested_value.copy()
+
+    # Pairs are encoded as dense integer keys, which is much cheaper
+    # than np.unique(axis=0) over millions of rows.
+    min_value = tested_value.min()
+    span = repetition.max() + 1
+    keys = (tested_value - min_value) * span + repetition
+    present = np.flatnonzero(np.bincount(keys))
+    key_to_table = np.zeros(keys.max() + 1, dtype=np.int64)
+    key_to_table[present] = np.arange(len(present))
+    inverse = key_to_table[keys]
+    tables = [
+        distribution(int(key // span + min_value), int(key % span)) for key in present
+    ]
+    width = max((len(values) for values, _ in tables), default=0)
+
+    outcomes = np.zeros((len(tables), width), dtype=np.int64)
+    cdf = np.ones((len(tables), width))
+    for i, (values, cum_weights) in enumerate(tables):
+        outcomes[i, : len(values)] = values
+        outcomes[i, len(values) :] = values[-1]
+        cdf[i, : len(values)] = np.asarray(cum_weights) / cum_weights[-1]
+
+    # Shift each row's cdf by its row number so all tables can be
+    # searched at once in one flat, sorted array.
+    cdf[:, -1] = 1.0
+    offset_cdf = (cdf + np.arange(len(tables))[:, None]).reshape(-1)
+    inverse = inverse.reshape(-1)
+    u = rng.random(len(tested_value)) + inverse
+    index = np.searchsorted(offset_cdf, u, side="right")
+    index = np.minimum(index, (inverse + 1) * width - 1)
+    return outcomes.reshape(-1)[index]
+
+
+def calc_move_rate(
+    strength: np.ndarray, dexterity: np.ndarray, size: np.ndarray
+) -> np.ndarray:
+    """Vectorised :func:`cochar.cochar.calc_move_rate`.
+
+    :param strength: characters' strength
+    :type strength: np.ndarray
+    :param dexterity: characters' dexterity
+    :type dexterity: np.ndarray
+    :param size: characters' size
+    :type size: np.ndarray
+    :return: move rates
+    :rtype: np.ndarray
+    """
+    move_rate = np.full(np.shape(size), 8)
+    move_rate[(dexterity < size) & (strength < size)] = 7
+    move_rate[(strength >= size) & (dexterity >= size)] = 9
+    return move_rate
+
+
+def candidate_skills(
+    skills_generator: cochar.skill.SkillsGenerator,
+    skills_lists: Sequence[Sequence[str]],
+    dexterity: np.ndarray = None,
+    education: np.ndarray = None,
+) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray, np.ndarray]:
+    """Return matrices of candidate skills for many characters.
+
+    Row ``i`` holds unique skills of ``skills_lists[i]``, in order of
+    the first appearance, padded to the longest list. Base values
+    are taken like in :meth:`cochar.skill.SkillsGenerator._assign_skill_points`.
+    Base values of ``dodge`` and ``language (own)`` depend on the character,
+    like in :meth:`cochar.skill.SkillsGenerator.generate_skills`, they are
+    taken from `dexterity` and `education` if given.
+
+    :param skills_generator: skills generator with skills data
+    :type skills_generator: cochar.skill.SkillsGenerator
+    :param skills_lists: skills list for each character
+    :type skills_lists: Sequence[Sequence[str]]
+    :param dexterity: dexterity of each character, defaults to None
+    :type dexterity: np.ndarray, optional
+    :param education: education of each character, defaults to None
+    :type education: np.ndarray, optional
+    :return: skills names; ids of skills in names, -1 for padding;
+        base values; number of times each skill appears in the list, 0 for padding
+    :rtype: Tuple[Tuple[str, ...], np.ndarray, np.ndarray, np.ndarray]
+    """
+    skill_ids: Dict[str, int] = {}
+    rows = []
+    for skills_list in skills_lists:
+        row: Dict[int, int] = {}
+        for skill in skills_list:
+            skill_id = skill_ids.setdefault(skill, len(skill_ids))
+            row[skill_id] = row.get(skill_id, 0) + 1
+        rows.append(row)
+
+    width = max((len(row) for row in rows), default=0)
+    ids = np.full((len(rows), width), -1, dtype=np.int32)
+    multiplicity = np.zeros((len(rows), width), dtype=np.int16)
+    for i, row in enumerate(rows):
+        ids[i, : len(row)] = list(row)
+        multiplicity[i, : len(row)] = list(row.values())
+
+    names = tuple(skill_ids)
+    defaults = np.array(
+        [
+            skills_generator.skills_data[skill]
+            if skill in skills_generator.skills_all
+            else 1
+            for skill in names
+        ]
+        + [0],
+        dtype=np.int16,
+    )
+    base_values = defaults[ids]
+
+    # Character dependent default values
+    character_defaults = {}
+    if dexterity is not None:
+        character_defaults["dodge"] = np.asarray(dexterity) // 2
+    if education is not None:
+        character_defaults["language (own)"] = np.asarray(education)
+    for skill, column in character_defaults.items():
+        if skill in skill_ids:
+            mask = ids == skill_ids[skill]
+            base_values[mask] = np.broadcast_to(column[:, None], ids.shape)[mask]
+
+    return names, ids, base_values, multiplicity
+
+
+def allocate_skill_points(
+    base_values: np.ndarray,
+    multiplicity: np.ndarray,
+    points: np.ndarray,
+    rng: RandomState = None,
+    chunk_size: int = 65536,
+) -> np.ndarray:
+    """Vectorised :meth:`cochar.skill.SkillsGenerator._assign_skill_points`.
+
+    Points of each character are split with a Dirichlet draw
+    over its candidate skills, clamped to headroom below
+    ``cochar.MAX_SKILL_LEVEL``, and clamped points are split again.
+    Rows are processed in chunks of ``chunk_size`` characters
+    to keep temporary arrays small.
+
+    :param base_values: base values of candidate skills, characters x skills
+    :type base_values: np.ndarray
+    :param multiplicity: weight of candidate skills, 0 for no skill
+    :type multiplicity: np.ndarray
+    :param points: points to allocate for each character
+    :type points: np.ndarray
+    :param rng: random number generator or seed, defaults to None
+    :type rng: np.random.Generator, optional
+    :param chunk_size: number of characters processed at once, defaults to 65536
+    :type chunk_size: int, optional
+    :return: final values of candidate skills
+    :rtype: np.ndarray
+    """
+    rng = np.random.default_rng(rng)
+    values = np.array(base_values, dtype=np.int16)
+    points = np.broadcast_to(points, values.shape[:1])
+    for start in range(0, len(values), chunk_size):
+        stop = start + chunk_size
+        values[start:stop] = _allocate_skill_points(
+            values[start:stop],
+            np.asarray(multiplicity[start:stop]),
+            np.array(points[start:stop], dtype=np.int64),
+            rng,
+        )
+    return values
+
+
+def _allocate_skill_points(
+    values: np.ndarray,
+    multiplicity: np.ndarray,
+    points: np.ndarray,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    values = values.astype(np.int64)
+    rows = np.flatnonzero(points > 0)
+
+    # Every round but the last one fills up at least one skill of a row.
+    for _ in range(values.shape[1] + 1):
+        if not len(rows):
+            break
+        row_values = values[rows]
+        row_multiplicity = multiplicity[rows]
+        remaining = points[rows]
+        headroom = np.where(
+            row_multiplicity > 0,
+            np.maximum(cochar.MAX_SKILL_LEVEL - row_values, 0),
+            0,
+        )
+
+        fill_up = headroom.sum(axis=1) <= remaining
+        if fill_up.any():
+            row_values[fill_up] += headroom[fill_up]
+            remaining[fill_up] = 0
+            split = np.flatnonzero(~fill_up)
+            row_multiplicity = row_multiplicity[split]
+            headroom = headroom[split]
+        else:
+            split = slice(None)
+
+        # Dirichlet shares: gamma variates, exponential for weight 1
+        shares = rng.standard_exponential(headroom.shape)
+        repeated = row_multiplicity > 1
+        if repeated.any():
+            shares[repeated] = rng.gamma(row_multiplicity[repeated])
+        shares[headroom == 0] = 0
+        shares *= (remaining[split] / shares.sum(axis=1))[:, None]
+        allocation = np.minimum(shares.astype(np.int64), headroom)
+        filled_up = ((allocation == headroom) & (headroom > 0)).any(axis=1)
+        allocation_sum = allocation.sum(axis=1)
+
+        # Rows without filled up skill have only rounding remainder left,
+        # it goes to skills with the largest fractional shares.
+        fractions = np.where(headroom > 0, shares - allocation, -1)
+        ranks = np.argsort(np.argsort(-fractions, axis=1), axis=1)
+        rest = remaining[split] - allocation_sum
+        allocation += (ranks < rest[:, None]) & ~filled_up[:, None]
+
+        row_values[split] += allocation
+        remaining[split] = np.where(filled_up, rest, 0)
+
+        values[rows] = row_values
+        points[rows] = remaining
+        rows = rows[remaining > 0]
+
+    return values
+
+
+def generate_skills(
+    skills_generator: cochar.skill.SkillsGenerator,
+    occupation_skills_lists: Sequence[Sequence[str]],
+    hobby_skills_lists: Sequence[Sequence[str]],
+    occupation_points: np.ndarray,
+    hobby_points: np.ndarray,
+    dexterity: np.ndarray = None,
+    education: np.ndarray = None,
+    rng: RandomState = None,
+    chunk_size: int = 65536,
+) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorised skills allocation of
+    :meth:`cochar.skill.SkillsGenerator.generate_skills`.
+
+    Occupation points are allocated first, then hobby points are
+    allocated on top of the result, so a skill listed in both
+    occupation and hobby skills gets hobby points only up to its
+    headroom left after the occupation. Credit rating is not
+    allocated and skills with base value are not filtered out.
+
+    :param skills_generator: skills generator with skills data
+    :type skills_generator: cochar.skill.SkillsGenerator
+    :param occupation_skills_lists: occupation skills list for each character
+    :type occupation_skills_lists: Sequence[Sequence[str]]
+    :param hobby_skills_lists: hobby skills list for each character
+    :type hobby_skills_lists: Sequence[Sequence[str]]
+    :param occupation_points: occupation points of each character
+    :type occupation_points: np.ndarray
+    :param hobby_points: hobby points of each character
+    :type hobby_points: np.ndarray
+    :param dexterity: dexterity of each character, defaults to None
+    :type dexterity: np.ndarray, optional
+    :param education: education of each character, defaults to None
+    :type education: np.ndarray, optional
+    :param rng: random number generator or seed, defaults to None
+    :type rng: np.random.Generator, optional
+    :param chunk_size: number of characters processed at once, defaults to 65536
+    :type chunk_size: int, optional
+    :return: skills names; ids of skills in names, -1 for padding;
+        base values; final values
+    :rtype: Tuple[Tuple[str, ...], np.ndarray, np.ndarray, np.ndarray]
+    """
+    if len(occupation_skills_lists) != len(hobby_skills_lists):
+        raise ValueError("occupation and hobby skills lists differ in length")
+
+    rng = np.random.default_rng(rng)
+    names, ids, base_values, _ = candidate_skills(
+        skills_generator,
+        [
+            list(occupation_skills) + list(hobby_skills)
+            for occupation_skills, hobby_skills in zip(
+                occupation_skills_lists, hobby_skills_lists
+            )
+        ],
+        dexterity,
+        education,
+    )
+
+    # Both passes share columns of candidate skills, each pass has
+    # its own weights, 0 for skills missing from its list.
+    skill_ids = {skill: i for i, skill in enumerate(names)}
+    occupation_rows = []
+    hobby_rows = []
+    for row, occupation_skills, hobby_skills in zip(
+        ids.tolist(), occupation_skills_lists, hobby_skills_lists
+    ):
+        columns = {skill_id: column for column, skill_id in enumerate(row)}
+        for skills_list, rows in (
+            (occupation_skills, occupation_rows),
+            (hobby_skills, hobby_rows),
+        ):
+            counts = [0] * len(row)
+            for skill in skills_list:
+                counts[columns[skill_ids[skill]]] += 1
+            rows.append(counts)
+    occupation_multiplicity = np.array(occupation_rows, dtype=np.int16).reshape(
+        ids.shape
+    )
+    hobby_multiplicity = np.array(hobby_rows, dtype=np.int16).reshape(ids.shape)
+
+    values = allocate_skill_points(
+        base_values, occupation_multiplicity, occupation_points, rng, chunk_size
+    )
+    values = allocate_skill_points(
+        values, hobby_multiplicity, hobby_points, rng, chunk_size
+    )
+    return names, ids, base_values, values
+
+
+def _check_int16_range(column: str, values: Sequence[int]) -> None:
+    if not values:
+        return
+    for value in (min(values), max(values)):
+        if not INT16_RANGE.min <= value <= INT16_RANGE.max:
+            raise cochar.error.BatchValueNotInRange(
+                column, value, INT16_RANGE.min, INT16_RANGE.max
+            )
+
+
+class CharacterBatch:
+    """Characters stored column by column.
+
+    Numbers are ``int16`` columns. Strings, like names and occupations,
+    are dictionary encoded: ``columns`` holds ``int32`` codes of values
+    in ``categories``. Skills are a sparse matrix in CSR format: skills
+    of character ``i`` are ``skill_names[skills_indices[j]]`` with
+    values ``skills_values[j]``, for ``j`` in
+    ``range(skills_indptr[i], skills_indptr[i + 1])``.
+
+    Batch is meant to be read only, row views don't see changes
+    of ``columns`` made after the first row has been read.
+
+    :param columns: numeric columns and codes of encoded columns
+    :type columns: Dict[str, np.ndarray]
+    :param categories: values of encoded columns
+    :type categories: Dict[str, Tuple[Hashable, ...]]
+    :param skill_names: names of skills
+    :type skill_names: Tuple[str, ...]
+    :param skills_indptr: CSR index pointer, ``int64``
+    :type skills_indptr: np.ndarray
+    :param skills_indices: CSR column indices, ``int32``
+    :type skills_indices: np.ndarray
+    :param skills_values: CSR values, ``int16``
+    :type skills_values: np.ndarray
+
+    >>> batch = CharacterBatch.from_characters(
+    ...     cochar.create_characters(10, 1925, "US", seed=1)
+    ... )
+    >>> len(batch), batch[0] == cochar.create_characters(10, 1925, "US", seed=1)[0]
+    (10, True)
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        categories: Dict[str, Tuple[Hashable, ...]],
+        skill_names: Tuple[str, ...],
+        skills_indptr: np.ndarray,
+        skills_indices: np.ndarray,
+        skills_values: np.ndarray,
+    ):
+        self.columns = columns
+        self.categories = categories
+        self.skill_names = skill_names
+        self.skills_indptr = skills_indptr
+        self.skills_indices = skills_indices
+        self.skills_values = skills_values
+        # Row major copy of columns, built on first row access
+        self._rows: np.ndarray = None
+
+    @classmethod
+    def from_characters(
+        cls, characters: Iterable[cochar.character.Character]
+    ) -> "CharacterBatch":
+        """Return batch of characters.
+
+        :param characters: characters
+        :type characters: Iterable[cochar.character.Character]
+        :raises BatchValueNotInRange: when a number doesn't fit in ``int16``
+        :return: batch
+        :rtype: CharacterBatch
+        """
+        values = {column: [] for column in CHARACTER_COLUMNS}
+        codes = {column: {} for column in ENCODED_COLUMNS}
+        skill_ids: Dict[str, int] = {}
+        skills_indptr = [0]
+        skills_indices = []
+        skills_values = []
+
+        for character in characters:
+            for column in CHARACTER_COLUMNS:
+                value = getattr(character, column)
+                if column in ENCODED_COLUMNS:
+                    value = codes[column].setdefault(value, len(codes[column]))
+                values[column].append(value)
+            skills = character.skills
+            skills_indices.extend(
+                skill_ids.setdefault(skill, len(skill_ids)) for skill in skills
+            )
+            skills_values.extend(skills.values())
+            skills_indptr.append(len(skills_indices))
+
+        # Depending on numpy version, encoding an out of range value
+        # raises or silently wraps it, so ranges are checked first.
+        for column in CHARACTER_COLUMNS:
+            if column not in ENCODED_COLUMNS:
+                _check_int16_range(column, values[column])
+        _check_int16_range("skills", skills_values)
+
+        return cls(
+            columns={
+                column: np.array(
+                    values[column],
+                    dtype=np.int32 if column in ENCODED_COLUMNS else np.int16,
+                )
+                for column in CHARACTER_COLUMNS
+            },
+            categories={column: tuple(codes[column]) for column in ENCODED_COLUMNS},
+            skill_names=tuple(skill_ids),
+            skills_indptr=np.array(skills_indptr, dtype=np.int64),
+            skills_indices=np.array(skills_indices, dtype=np.int32),
+            skills_values=np.array(skills_values, dtype=np.int16),
+        )
+
+    def __len__(self) -> int:
+        return len(self.skills_indptr) - 1
+
+    def __getitem__(self, index: int) -> cochar.character.Character:
+        index = range(len(self))[index]
+        if self._rows is None:
+            self._rows = np.column_stack(
+                [self.columns[column] for column in CHARACTER_COLUMNS]
+            ).astype(np.int32)
+        fields = {
+            column: self.categories[column][value]
+            if column in ENCODED_COLUMNS
+            else value
+            for column, value in zip(CHARACTER_COLUMNS, self._rows[index].tolist())
+        }
+        return cochar.character.Character._from_trusted(
+            skills=self.skills(index), **fields
+        )
+
+    def __iter__(self) -> Iterator[cochar.character.Character]:
+        return (self[index] for index in range(len(self)))
+
+    def skills(self, index: int) -> Dict[str, int]:
+        """Return skills of the character.
+
+        :param index: index of the character
+        :type index: int
+        :return: skills
+        :rtype: Dict[str, int]
+        """
+        index = range(len(self))[index]
+        start = int(self.skills_indptr[index])
+        stop = int(self.skills_indptr[index + 1])
+        return dict(
+            zip(
+                map(
+                    self.skill_names.__getitem__,
+                    self.skills_indices[start:stop].tolist(),
+                ),
+                self.skills_values[start:stop].tolist(),
+            )
+        )
+
+    def column(self, name: str) -> np.ndarray:
+        """Return decoded column.
+
+        :param name: column name, one of ``CHARACTER_COLUMNS``
+        :type name: str
+        :return: values of the column
+        :rtype: np.ndarray
+        """
+        if name not in ENCODED_COLUMNS:
+            return self.columns[name]
+        categories = np.empty(len(self.categories[name]), dtype=object)
+        categories[:] = self.categories[name]
+        values = categories[self.columns[name]]
+        if all(isinstance(value, str) for value in self.categories[name]):
+            return values.astype(str)
+        return values
+
+    def skills_matrix(self) -> np.ndarray:
+        """Return skills as a dense matrix, characters x ``skill_names``,
+        with -1 for skills a character doesn't have.
+
+        :return: skills values
+        :rtype: np.ndarray
+        """
+        matrix = np.full((len(self), len(self.skill_names)), -1, dtype=np.int16)
+        rows = np.repeat(np.arange(len(self)), np.diff(self.skills_indptr))
+        matrix[rows, self.skills_indices] = self.skills_values
+        return matrix
+
+    def to_dict_of_columns(self) -> Dict[str, np.ndarray]:
+        """Return decoded columns. Each skill is a separate column,
+        named like ``"skills.spot hidden"``, with -1 for characters
+        that don't have the skill.
+
+        :return: columns
+        :rtype: Dict[str, np.ndarray]
+        """
+        result = {column: self.column(column) for column in CHARACTER_COLUMNS}
+        matrix = self.skills_matrix()
+        for skill_id, skill in enumerate(self.skill_names):
+            result[f"skills.{skill}"] = matrix[:, skill_id]
+        return result
+
+    def to_records(self) -> np.recarray:
+        """Return characters as a record array with columns
+        of :meth:`to_dict_of_columns`.
+
+        :return: records
+        :rtype: np.recarray
+        """
+        columns = self.to_dict_of_columns()
+        return np.rec.fromarrays(list(columns.values()), names=list(columns))
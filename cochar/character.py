@@ -15,14 +15,15 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """"This module contains classes related with Character object itself."""
 
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Union
-
-import randname
+from array import array
+from typing import Dict, Hashable, List, Union
 
 import cochar
 import cochar.cochar
 import cochar.error
+import cochar.name
 import cochar.skill
 
 
@@ -186,7 +187,7 @@ class Country(Validator):
     Country also defines what dataset will be used for generating character's
     name.
 
-    See ``randname.available_countries()``.
+    See ``cochar.name.available_countries()``.
     """
 
     def validate(self, new_country: str) -> None:
@@ -195,12 +196,14 @@ class Country(Validator):
 
         :param new_country: character's new country
         :type new_country: str
-        :raises InvalidCountryValue: "Country not available: {new_country} -> {randname.available_countries()}
+        :raises InvalidCountryValue: "Country not available: {new_country} -> {cochar.name.available_countries()}
         """
 
-        available_countries = randname.available_countries()
+        available_countries = cochar.name.available_countries()
         if new_country not in available_countries:
-            raise cochar.error.InvalidCountryValue(new_country, available_countries)
+            raise cochar.error.InvalidCountryValue(
+                new_country, set(available_countries)
+            )
 
 
 class Occupation(Validator):
@@ -361,14 +364,96 @@ class Character:
         self.luck = luck
         self.damage_bonus = damage_bonus
         self.build = build
-        self.skills = cochar.skill.SkillsDict(skills)
+        if isinstance(skills, cochar.skill.SkillsArray):
+            self.skills = skills.copy()
+        else:
+            self.skills = cochar.skill.SkillsDict(skills)
         self.dodge = dodge
         self.sanity_points = sanity_points
         self.magic_points = magic_points
         self.hit_points = hit_points
 
+    @classmethod
+    def _from_trusted(
+        cls,
+        year: int,
+        country: str,
+        first_name: str,
+        last_name: str,
+        age: int,
+        sex: str,
+        occupation: str,
+        strength: int,
+        condition: int,
+        size: int,
+        dexterity: int,
+        appearance: int,
+        education: int,
+        intelligence: int,
+        power: int,
+        luck: int,
+        move_rate: int,
+        damage_bonus: str,
+        build: int,
+        dodge: int,
+        skills: cochar.skill.SkillsDict,
+        sanity_points: int,
+        magic_points: int,
+        hit_points: int,
+    ) -> "Character":
+        """Create character without validation, from values produced by
+        the generator. ``skills`` is used as is if it is a ``SkillsDict``
+        or ``SkillsArray``, otherwise copied without validation.
+
+        Attributes are set in the same order as in ``__init__``, so
+        ``vars()`` and ``get_json_format()`` keep the order of keys.
+        User input must be validated first, see :meth:`_validate_fields`.
+        """
+        character = cls.__new__(cls)
+        if not isinstance(skills, (cochar.skill.SkillsDict, cochar.skill.SkillsArray)):
+            skills_dict = cochar.skill.SkillsDict()
+            skills_dict.data = dict(skills)
+            skills = skills_dict
+        character.__dict__.update(
+            _year=year,
+            _country=country,
+            _first_name=str(first_name),
+            _last_name=str(last_name),
+            _age=age,
+            _sex=sex,
+            _occupation=occupation,
+            _strength=strength,
+            _condition=condition,
+            _size=size,
+            _dexterity=dexterity,
+            _appearance=appearance,
+            _education=education,
+            _intelligence=intelligence,
+            _power=power,
+            _move_rate=move_rate,
+            _luck=luck,
+            _damage_bonus=damage_bonus,
+            _build=build,
+            _skills=skills,
+            _dodge=dodge,
+            _sanity_points=sanity_points,
+            _magic_points=magic_points,
+            _hit_points=hit_points,
+        )
+        return character
+
+    @classmethod
+    def _validate_fields(cls, **fields) -> None:
+        """Validate values of fields with their validators,
+        without creating character.
+
+        >>> Character._validate_fields(country="US", age=40)
+        """
+        for field, value in fields.items():
+            vars(cls)[field].validate(value)
+
     @property
-    def skills(self) -> cochar.skill.SkillsDict:
+    def skills(self) -> Union[cochar.skill.SkillsDict, cochar.skill.SkillsArray]:
         """Character's skills.
 
         :return: character's skills
@@ -377,8 +462,11 @@ class Character:
         return self._skills
 
     @skills.setter
-    def skills(self, new_skills: Union[dict, cochar.skill.SkillsDict]) -> None:
-        if isinstance(new_skills, cochar.skill.SkillsDict):
+    def skills(
+        self,
+        new_skills: Union[dict, cochar.skill.SkillsDict, cochar.skill.SkillsArray],
+    ) -> None:
+        if isinstance(new_skills, (cochar.skill.SkillsDict, cochar.skill.SkillsArray)):
             self._skills = new_skills
         elif isinstance(new_skills, dict):
             self._skills = cochar.skill.SkillsDict(new_skills)
@@ -438,3 +526,212 @@ class Character:
             f"Skills:\n"
             f"{skills}"
         )
+
+
+class SymbolTable:
+    """Append-only table that gives distinct values, like occupations,
+    countries or skill names, small integer ids. Ids are never reused.
+
+    >>> table = SymbolTable()
+    >>> table.id("farmer"), table.id("doctor"), table.id("farmer")
+    (0, 1, 0)
+    >>> table.value(1)
+    'doctor'
+    """
+
+    def __init__(self):
+        self._values: List[Hashable] = []
+        self._ids: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def id(self, value: Hashable) -> int:
+        """Return id of the value, add value to the table if it is new.
+
+        :param value: value
+        :type value: Hashable
+        :return: id of the value
+        :rtype: int
+        """
+        try:
+            return self._ids[value]
+        except KeyError:
+            with self._lock:
+                if value not in self._ids:
+                    self._ids[value] = len(self._values)
+                    self._values.append(value)
+                return self._ids[value]
+
+    def value(self, symbol_id: int) -> Hashable:
+        """Return value of the id.
+
+        :param symbol_id: id returned by :meth:`id`
+        :type symbol_id: int
+        :return: value
+        :rtype: Hashable
+        """
+        return self._values[symbol_id]
+
+
+SYMBOLS = SymbolTable()
+
+
+class _CompactField:
+    """Read only field of :class:`CompactCharacter`."""
+
+    def __set_name__(self, owner, name):
+        self.index = owner._FIELDS.index(name)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj._data[self.index]
+
+
+class _CompactSymbol(_CompactField):
+    """Read only field of :class:`CompactCharacter` stored as id in ``SYMBOLS``."""
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return SYMBOLS.value(obj._data[self.index])
+
+
+class CompactCharacter:
+    """Read only, memory efficient version of :class:`Character`,
+    for holding many characters in memory.
+
+    Numbers, ids of country, sex, occupation and damage bonus and
+    (skill id, value) pairs are kept in a single array of 32 bit
+    integers. Ids come from ``SYMBOLS``, shared by all compact
+    characters. Only first and last name are separate objects.
+
+    To change character, convert it to :class:`Character`, with
+    :meth:`to_character`, and back with :meth:`from_character`.
+
+    >>> character = cochar.create_character(1925, "US")
+    >>> CompactCharacter.from_character(character).to_character() == character
+    True
+    """
+
+    __slots__ = ("first_name", "last_name", "_data")
+
+    _INT_FIELDS = (
+        "year",
+        "age",
+        "strength",
+        "condition",
+        "size",
+        "dexterity",
+        "appearance",
+        "education",
+        "intelligence",
+        "power",
+        "luck",
+        "move_rate",
+        "build",
+        "dodge",
+        "sanity_points",
+        "magic_points",
+        "hit_points",
+    )
+    _SYMBOL_FIELDS = ("country", "sex", "occupation", "damage_bonus")
+    _FIELDS = _INT_FIELDS + _SYMBOL_FIELDS
+
+    year = _CompactField()
+    age = _CompactField()
+    strength = _CompactField()
+    condition = _CompactField()
+    size = _CompactField()
+    dexterity = _CompactField()
+    appearance = _CompactField()
+    education = _CompactField()
+    intelligence = _CompactField()
+    power = _CompactField()
+    luck = _CompactField()
+    move_rate = _CompactField()
+    build = _CompactField()
+    dodge = _CompactField()
+    sanity_points = _CompactField()
+    magic_points = _CompactField()
+    hit_points = _CompactField()
+
+    country = _CompactSymbol()
+    sex = _CompactSymbol()
+    occupation = _CompactSymbol()
+    damage_bonus = _CompactSymbol()
+
+    def __init__(self, first_name: str, last_name: str, data: array) -> None:
+        self.first_name = first_name
+        self.last_name = last_name
+        self._data = data
+
+    @classmethod
+    def from_character(cls, character: Character) -> "CompactCharacter":
+        """Return compact version of the character.
+
+        :param character: character
+        :type character: Character
+        :raises OverflowError: when a number doesn't fit in 32 bit integer
+        :return: compact character
+        :rtype: CompactCharacter
+        """
+        data = array("i", [getattr(character, field) for field in cls._INT_FIELDS])
+        data.extend(
+            SYMBOLS.id(getattr(character, field)) for field in cls._SYMBOL_FIELDS
+        )
+        for skill, value in character.skills.items():
+            data.append(SYMBOLS.id(skill))
+            data.append(value)
+        return cls(character.first_name, character.last_name, data)
+
+    def to_character(self) -> Character:
+        """Return :class:`Character` equal to the one this compact
+        character was created from.
+
+        :return: character
+        :rtype: Character
+        """
+        return Character(
+            first_name=self.first_name,
+            last_name=self.last_name,
+            skills=self.skills,
+            **{field: getattr(self, field) for field in self._FIELDS},
+        )
+
+    @property
+    def skills(self) -> cochar.skill.SkillsDict:
+        """Copy of character's skills.
+
+        :return: character's skills
+        :rtype: cochar.skill.SkillsDict
+        """
+        start = len(self._FIELDS)
+        return cochar.skill.SkillsDict(
+            zip(
+                map(SYMBOLS.value, self._data[start::2]),
+                self._data[start + 1 :: 2],
+            )
+        )
+
+    def get_json_format(self) -> dict:
+        """Return character's full characteristics as a dictionary.
+
+        :return: full characteristics
+        :rtype: dict
+        """
+        return self.to_character().get_json_format()
+
+    def __eq__(self, o: object) -> bool:
+        if not isinstance(o, CompactCharacter):
+            return NotImplemented
+        return (
+            self._data == o._data
+            and self.first_name == o.first_name
+            and self.last_name == o.last_name
+        )
+
+    def __repr__(self) -> str:
+        return f"Compact{self.to_character()!r}"
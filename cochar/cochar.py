@@ -14,14 +14,15 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """**Cochar - main module**"""
+import functools
+import itertools
 import json
 import random
-from typing import List, Tuple, Union
-
-import randname
+from typing import Dict, List, Tuple, Union
 
 import cochar
 import cochar.character
+import cochar.name
 import cochar.occup
 import cochar.skill
 import cochar.utils
@@ -50,6 +51,8 @@ def create_character(
     era: str = cochar.ERA,
     tags: List[str] = cochar.TAGS,
     skills_generator: cochar.skill.SkillsGenerator = SKILLS_GENERATOR,
+    rng: random.Random = None,
+    seed: int = None,
 ) -> cochar.character.Character:
     """Main function for creating Character.
     Use this function instead of instantiating Character class.
@@ -70,7 +73,9 @@ def create_character(
     :type random_mode: bool, optional
     :param occupation: character's occupation return provided occupation as character's occupation if it exists, defaults to "None"
     :type occupation: str, optional
-    :param skills: character's skills, defaults to {}
+    :param skills: character's skills, pass an empty ``SkillsArray``
+        to generate skills into ``SkillsArray`` instead of ``SkillsDict``,
+        defaults to {}
     :type skills: Skills, optional
     :param occup_type: occupation type, defaults to None
     :type occup_type: str, optional
@@ -78,22 +83,76 @@ def create_character(
     :type era: str, optional
     :param tags: occupation tags, defaults to None
     :type tags: List[str], optional
+    :param rng: random number generator used for every draw, give each thread
+        its own instance, defaults to ``random`` module
+    :type rng: random.Random, optional
+    :param seed: seed for a new random number generator, the same seed
+        always gives the same character, overrides `rng`, defaults to None
+    :type seed: int, optional
     :raises ValueError: raise if sex is incorrect
     :return: generated character
     :rtype: Character
     """
+    if seed is not None:
+        rng = random.Random(seed)
+    rng = rng or random
+
     weights = cochar.WEIGHTS
 
-    sex = generate_sex(sex)
+    # Year, sex, occupation and skills are validated by the generator,
+    # values it produces are trusted
+    cochar.character.Character._validate_fields(country=country)
+    if age:
+        cochar.character.Character._validate_fields(age=age)
 
-    age: int = generate_age(year, sex, age)
+    sex = generate_sex(sex, rng=rng)
+
+    age: int = generate_age(year, sex, age, rng=rng)
 
     if not first_name:
-        first_name = generate_first_name(year, sex, country, weights)
+        first_name = generate_first_name(year, sex, country, weights, rng=rng)
 
     if not last_name:
-        last_name = generate_last_name(year, sex, country, weights)
+        last_name = generate_last_name(year, sex, country, weights, rng=rng)
+
+    return _generate_character(
+        year=year,
+        country=country,
+        first_name=first_name,
+        last_name=last_name,
+        age=age,
+        sex=sex,
+        random_mode=random_mode,
+        occupation=occupation,
+        skills=skills,
+        occup_type=occup_type,
+        era=era,
+        tags=tags,
+        skills_generator=skills_generator,
+        rng=rng,
+    )
+
 
+def _generate_character(
+    year: int,
+    country: str,
+    first_name: str,
+    last_name: str,
+    age: int,
+    sex: str,
+    random_mode: bool,
+    occupation: str,
+    skills: cochar.skill.SkillsDict,
+    occup_type: str,
+    era: str,
+    tags: List[str],
+    skills_generator: cochar.skill.SkillsGenerator,
+    rng: random.Random,
+) -> cochar.character.Character:
+    """Generate the rest of the character for already validated
+    country, age and sex, and already drawn names.
+    Shared by :func:`create_character` and :func:`create_characters`.
+    """
     (
         strength,
         condition,
@@ -105,7 +164,7 @@ def create_character(
         power,
         luck,
         move_rate,
-    ) = generate_base_characteristics(age=age)
+    ) = generate_base_characteristics(age=age, rng=rng)
 
     occupation = cochar.occup.generate_occupation(
         education=education,
@@ -118,6 +177,7 @@ def create_character(
         occup_type=occup_type,
         era=era,
         tags=tags,
+        rng=rng,
     )
 
     sanity_points, magic_points, hit_points = calc_derived_attributes(
@@ -132,12 +192,18 @@ def create_character(
     hobby_points = cochar.occup.calc_hobby_points(intelligence)
 
     skills = skills_generator.generate_skills(
-        occupation, occupation_points, hobby_points, dexterity, education, skills
+        occupation,
+        occupation_points,
+        hobby_points,
+        dexterity,
+        education,
+        skills,
+        rng=rng,
     )
 
     dodge = skills.get("dodge", dodge)
 
-    return cochar.character.Character(
+    return cochar.character.Character._from_trusted(
         year=year,
         country=country,
         first_name=first_name,
@@ -165,7 +231,174 @@ def create_character(
     )
 
 
-def generate_age(year: int, sex: str, age: int = False) -> int:
+def create_characters(
+    n: int,
+    year: int,
+    country: str,
+    first_name: str = cochar.FIRST_NAME,
+    last_name: str = cochar.LAST_NAME,
+    age: int = cochar.AGE,
+    sex: str = cochar.SEX,
+    random_mode: bool = False,
+    occupation: str = cochar.OCCUPATION,
+    skills: cochar.skill.SkillsDict = {},
+    occup_type: str = cochar.OCCUPATION_TYPE,
+    era: str = cochar.ERA,
+    tags: List[str] = cochar.TAGS,
+    skills_generator: cochar.skill.SkillsGenerator = SKILLS_GENERATOR,
+    rng: random.Random = None,
+    seed: int = None,
+) -> List[cochar.character.Character]:
+    """Create `n` characters sharing the same criteria.
+
+    Accepts the same parameters as :func:`create_character`. Criteria are
+    validated once for the whole batch, so invalid input fails before
+    any character is generated. Sexes, ages and names are drawn in bulk,
+    one draw per data set, before the rest of each character is generated.
+    Generating skills takes most of the time of each character, so
+    throughput is about the same as calling :func:`create_character`
+    in a loop.
+
+    :param n: number of characters to create
+    :type n: int
+    :param year: year of the game
+    :type year: int
+    :param country: country of character's origin
+    :type country: str
+    :param rng: random number generator shared by the whole batch, defaults to ``random`` module
+    :type rng: random.Random, optional
+    :param seed: seed for a new random number generator, the same seed
+        always gives the same batch, overrides `rng`, defaults to None
+    :type seed: int, optional
+    :raises ValueError: raise if `n` is negative or sex is incorrect
+    :raises InvalidYearValue: raise if year is not an integer
+    :raises InvalidCountryValue: raise if country is not available
+    :raises InvalidAgeValue: raise if age is not an integer
+    :raises AgeNotInRange: raise if age is out of range
+    :return: list of generated characters
+    :rtype: List[Character]
+
+    >>> characters = create_characters(100, 1925, "US", occup_type="classic")
+    >>> len(characters)
+    100
+    """
+    if n < 0:
+        raise ValueError(f"number of characters cannot be negative: {n}")
+
+    # Year, country and age are validated like in create_character(),
+    # but once for the whole batch
+    cochar.character.Character._validate_fields(year=year, country=country)
+    if age:
+        cochar.character.Character._validate_fields(age=age)
+
+    if sex not in cochar.SEX_OPTIONS:
+        raise ValueError(f"incorrect sex value: {sex} -> ['M', 'F', None]")
+
+    if seed is not None:
+        rng = random.Random(seed)
+    rng = rng or random
+
+    if sex is None:
+        sexes = [rng.choice(("M", "F")) for _ in range(n)]
+    else:
+        sexes = [sex.upper()] * n
+
+    if age:
+        ages = [age] * n
+    else:
+        # Draw ages in bulk, one alias table per sex
+        ages_by_sex = {
+            character_sex: iter(
+                sample_ages(year, character_sex, sexes.count(character_sex), rng=rng)
+            )
+            for character_sex in sorted(set(sexes))
+        }
+        ages = [next(ages_by_sex[character_sex]) for character_sex in sexes]
+
+    weights = cochar.WEIGHTS
+    first_names = (
+        [first_name] * n
+        if first_name
+        else _draw_names("first_names", year, sexes, country, weights, rng=rng)
+    )
+    last_names = (
+        [last_name] * n
+        if last_name
+        else _draw_names("last_names", year, sexes, country, weights, rng=rng)
+    )
+
+    return [
+        _generate_character(
+            year=year,
+            country=country,
+            first_name=first,
+            last_name=last,
+            age=character_age,
+            sex=character_sex,
+            random_mode=random_mode,
+            occupation=occupation,
+            skills=skills,
+            occup_type=occup_type,
+            era=era,
+            tags=tags,
+            skills_generator=skills_generator,
+            rng=rng,
+        )
+        for character_sex, character_age, first, last in zip(
+            sexes, ages, first_names, last_names
+        )
+    ]
+
+
+def _draw_names(
+    name_type: str,
+    year: int,
+    sexes: List[str],
+    country: str,
+    weights: bool,
+    rng: random.Random = None,
+) -> List[str]:
+    """Return one random name for each of the given sexes,
+    drawn in bulk, one draw per data set.
+
+    :param name_type: "first_names" or "last_names"
+    :type name_type: str
+    :param year: year of the data set with names
+    :type year: int
+    :param sexes: characters' sexes
+    :type sexes: List[str]
+    :param country: name country
+    :type country: str
+    :param weights: if true, take under account popularity of names
+    :type weights: bool
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
+    :return: names, in order of `sexes`
+    :rtype: List[str]
+    """
+    name_sexes = [
+        _verify_and_return_sex(sex, country, name=name_type, rng=rng) for sex in sexes
+    ]
+    names_by_sex = {
+        name_sex: iter(
+            cochar.name.NAME_POOL.draw_many(
+                name_sexes.count(name_sex),
+                name_type,
+                year,
+                name_sex,
+                country,
+                weights,
+                rng=rng,
+            )
+        )
+        for name_sex in sorted(set(name_sexes))
+    }
+    return [next(names_by_sex[name_sex]) for name_sex in name_sexes]
+
+
+def generate_age(
+    year: int, sex: str, age: int = False, rng: random.Random = None
+) -> int:
     """Generate characters age, based on year and sex.
     Return age if age is provided.
 
@@ -175,6 +408,8 @@ def generate_age(year: int, sex: str, age: int = False) -> int:
     :type sex: str
     :param age: character's age, defaults to False
     :type age: int, optional
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
     :return: character's age
     :rtype: int
     """
@@ -184,31 +419,127 @@ def generate_age(year: int, sex: str, age: int = False) -> int:
     if age:
         return age
 
+    return get_age_sampler(correct_pyramid_year(year), sex).sample(rng)
+
+
+class AgeSampler:
+    """Draw character's age from the population pyramid
+    of a single year and sex.
+
+    Age ranges above ``cochar.MAX_AGE`` are cut off. Age range is drawn
+    from an alias table in constant time, then the age is drawn
+    uniformly from that range.
+
+    :param age_ranges: age ranges, see ``cochar.utils.AGE_RANGE``
+    :type age_ranges: Tuple[Tuple[int, int]]
+    :param weights: population of each age range
+    :type weights: List[int]
+    """
+
+    def __init__(self, age_ranges: Tuple[Tuple[int, int]], weights: List[int]):
+        self.age_ranges = tuple(age_ranges)
+        self.alias_table = cochar.utils.AliasTable(weights)
+
+    def sample(self, rng: random.Random = None) -> int:
+        """Return random age.
+
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :return: character's age
+        :rtype: int
+        """
+        rng = rng or random
+        return rng.randint(*self.age_ranges[self.alias_table.sample(rng)])
+
+    def sample_many(self, k: int, rng: random.Random = None) -> List[int]:
+        """Return `k` random ages.
+
+        :param k: number of ages to draw
+        :type k: int
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :return: characters' ages
+        :rtype: List[int]
+        """
+        rng = rng or random
+        age_ranges = self.age_ranges
+        return [
+            rng.randint(*age_ranges[i]) for i in self.alias_table.sample_many(k, rng)
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pop_pyramid(path: str) -> Dict[str, dict]:
+    with open(path, "r", encoding="utf-8") as json_file:
+        return json.load(json_file)
+
+
+def correct_pyramid_year(year: int) -> int:
+    """Return the closest year available in population pyramid data.
+
+    >>> correct_pyramid_year(1925)
+    1950
+    >>> correct_pyramid_year(1952)
+    1955
+    """
     if year < 1950:
-        corrected_year = 1950
-    else:
-        year_index = cochar.utils.narrowed_bisect(cochar.utils.YEAR_RANGE, year)
-        corrected_year = cochar.utils.YEAR_RANGE[year_index]
+        return 1950
+    year_index = cochar.utils.narrowed_bisect(cochar.utils.YEAR_RANGE, year)
+    return cochar.utils.YEAR_RANGE[year_index]
 
-    file_name = f"pop{corrected_year}"
 
-    with open(cochar.POP_PYRAMID_PATH, "r", encoding="utf-8") as json_file:
+@functools.lru_cache(maxsize=None)
+def get_age_sampler(corrected_year: int, sex: str) -> AgeSampler:
+    """Return age sampler for given year and sex.
 
-        def correct_age_range(age_range: Tuple[int, int], max_age: int):
-            for i, elem in enumerate(age_range):
-                if elem[1] > max_age:
-                    return i
-            return len(age_range) + 1
+    Samplers are built on first use and kept in memory. After changing
+    ``cochar.POP_PYRAMID_PATH`` or ``cochar.MAX_AGE`` call
+    ``get_age_sampler.cache_clear()``.
 
-        max_age_index = correct_age_range(cochar.utils.AGE_RANGE, cochar.MAX_AGE)
-        age_population = cochar.utils.AGE_RANGE[:max_age_index]
+    :param corrected_year: year available in data, see :func:`correct_pyramid_year`
+    :type corrected_year: int
+    :param sex: character's sex, "M" or "F"
+    :type sex: str
+    :return: age sampler
+    :rtype: AgeSampler
+    """
+
+    def correct_age_range(age_range: Tuple[int, int], max_age: int):
+        for i, elem in enumerate(age_range):
+            if elem[1] > max_age:
+                return i
+        return len(age_range) + 1
+
+    max_age_index = correct_age_range(cochar.utils.AGE_RANGE, cochar.MAX_AGE)
+    age_population = cochar.utils.AGE_RANGE[:max_age_index]
+
+    pyramid = _load_pop_pyramid(cochar.POP_PYRAMID_PATH)
+    age_weights = pyramid[f"pop{corrected_year}"][sex][3 : 3 + max_age_index]
 
-        age_weights = json.load(json_file)[file_name][sex][3 : 3 + max_age_index]
-        age_range = random.choices(age_population, weights=age_weights)[0]
+    return AgeSampler(age_population, age_weights)
 
-        age = random.randint(*age_range)
 
-    return age
+def sample_ages(year: int, sex: str, n: int, rng: random.Random = None) -> List[int]:
+    """Return `n` ages drawn for given year and sex.
+
+    Bulk version of :func:`generate_age`.
+
+    :param year: year of the game
+    :type year: int
+    :param sex: character's sex, "M" or "F"
+    :type sex: str
+    :param n: number of ages to draw
+    :type n: int
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
+    :raises InvalidYearValue: raise if year is not an integer
+    :return: characters' ages
+    :rtype: List[int]
+    """
+    if not isinstance(year, int):
+        raise cochar.error.InvalidYearValue(year)
+
+    return get_age_sampler(correct_pyramid_year(year), sex).sample_many(n, rng)
 
 
 def generate_base_characteristics(
@@ -223,6 +554,7 @@ def generate_base_characteristics(
     power: int = 0,
     luck: int = 0,
     move_rate: int = 0,
+    rng: random.Random = None,
 ) -> tuple:
     """Return base characteristics based on age as a tuple.
 
@@ -260,31 +592,35 @@ def generate_base_characteristics(
     :type move_rate: int, optional
     :param luck: luck, defaults to 0
     :type luck: int, optional
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
     :return: (strength, condition, size, dexterity, appearance, education, intelligence, power, luck, move_rate)
     :rtype: tuple
     """
+    rng = rng or random
+
     if strength == 0:
-        strength = random.randint(15, 90)
+        strength = rng.randint(15, 90)
     if condition == 0:
-        condition = random.randint(15, 90)
+        condition = rng.randint(15, 90)
     if size == 0:
-        size = random.randint(40, 90)
+        size = rng.randint(40, 90)
     if dexterity == 0:
-        dexterity = random.randint(15, 90)
+        dexterity = rng.randint(15, 90)
     if appearance == 0:
-        appearance = random.randint(15, 90)
+        appearance = rng.randint(15, 90)
     if education == 0:
-        education = random.randint(40, 90)
+        education = rng.randint(40, 90)
     if intelligence == 0:
-        intelligence = random.randint(40, 90)
+        intelligence = rng.randint(40, 90)
     if power == 0:
-        power = random.randint(15, 90)
+        power = rng.randint(15, 90)
     if move_rate == 0:
         move_rate = 0
     if luck == 0:
-        luck = random.randint(15, 90)
+        luck = rng.randint(15, 90)
     if age <= 19:
-        luck = max(luck, random.randint(15, 90))
+        luck = max(luck, rng.randint(15, 90))
 
     age_range = cochar.utils.narrowed_bisect(cochar.MODIFIERS["age_range"], age)
     mod_char_points = cochar.MODIFIERS["mod_char_points"][age_range]
@@ -294,9 +630,9 @@ def generate_base_characteristics(
 
     appearance = subtract_points_from_characteristic(appearance, mod_app)
     strength, condition, dexterity = subtract_points_from_str_con_dex(
-        strength, condition, dexterity, mod_char_points
+        strength, condition, dexterity, mod_char_points, rng=rng
     )
-    education = characteristic_test(education, mod_edu)
+    education = characteristic_test_from_table(education, mod_edu, rng=rng)
     move_rate = calc_move_rate(strength, dexterity, size) - mod_move_rate
 
     return (
@@ -507,12 +843,23 @@ def subtract_points_from_characteristic(
 
 
 def subtract_points_from_str_con_dex(
-    strength: int, condition: int, dexterity: int, subtract_points: int
+    strength: int,
+    condition: int,
+    dexterity: int,
+    subtract_points: int,
+    rng: random.Random = None,
 ) -> Tuple[int, int, int]:
     """Subtract certain amount of points from strength, condition and
     dexterity, but prevent each of the characteristics to be
     lower than 1.
 
+    Each point is subtracted from a characteristic chosen uniformly
+    from those above 1. Instead of drawing point by point, all remaining
+    points are drawn at once among characteristics above 1, and points
+    that land on a characteristic already at 1 are drawn again in the next
+    phase. Every phase brings at least one characteristic down to 1,
+    so there are at most four draws.
+
     :param strength: character's strength
     :type strength: int
     :param condition: character's condition
@@ -521,34 +868,33 @@ def subtract_points_from_str_con_dex(
     :type dexterity: int
     :param subtract_points: amount of points to subtract
     :type subtract_points: int
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
     :return: (strength, condition, dexterity)
     :rtype: Tuple[int, int, int]
     """
-    characteristics = {
-        "strength": strength,
-        "condition": condition,
-        "dexterity": dexterity,
-    }
-    for _ in range(subtract_points):
-        characteristic_to_subtract = [
-            characteristic
-            for characteristic, value in characteristics.items()
-            if value != 1
-        ]
-        if characteristic_to_subtract:
-            characteristic = random.choice(characteristic_to_subtract)
-            characteristics[characteristic] -= 1
-        else:
+    rng = rng or random
+    characteristics = [strength, condition, dexterity]
+
+    while subtract_points > 0:
+        available = [i for i, value in enumerate(characteristics) if value > 1]
+        if sum(characteristics[i] - 1 for i in available) <= subtract_points:
+            for i in available:
+                characteristics[i] = 1
             break
 
-    return (
-        characteristics["strength"],
-        characteristics["condition"],
-        characteristics["dexterity"],
-    )
+        draws = rng.choices(available, k=subtract_points)
+        for i in available:
+            subtracted = min(draws.count(i), characteristics[i] - 1)
+            characteristics[i] -= subtracted
+            subtract_points -= subtracted
+
+    return tuple(characteristics)
 
 
-def characteristic_test(tested_value: int, repetition: int = 1) -> int:
+def characteristic_test(
+    tested_value: int, repetition: int = 1, rng: random.Random = None
+) -> int:
     """Perform characteristic test.
 
     Roll number between 1 to 100,
@@ -564,16 +910,69 @@ def characteristic_test(tested_value: int, repetition: int = 1) -> int:
     :type tested_value: int
     :param repetition: how many test to perform
     :type repetition: int
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
     :return: unchanged or increased tested value, but not higher than 99
     :rtype: int
     """
+    rng = rng or random
     for _ in range(repetition):
-        test = random.randint(1, 100)
+        test = rng.randint(1, 100)
         if tested_value < test:
-            tested_value += random.randint(1, 10)
+            tested_value += rng.randint(1, 10)
     return tested_value if tested_value <= 99 else 99
 
 
+@functools.lru_cache(maxsize=4096)
+def characteristic_test_distribution(
+    tested_value: int, repetition: int
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Return exact distribution of :func:`characteristic_test` outcomes.
+
+    Tables are computed on first use and cached.
+
+    :param tested_value: tested value
+    :type tested_value: int
+    :param repetition: how many test to perform
+    :type repetition: int
+    :return: (outcomes, cumulative weights)
+    :rtype: Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+    >>> characteristic_test_distribution(98, 1)
+    ((98, 99), (980, 1000))
+    """
+    distribution = cochar.utils.improvement_test_distribution(
+        tested_value, repetition, lambda value: min(max(100 - value, 0), 100)
+    )
+    capped = {}
+    for value, weight in distribution.items():
+        capped[min(value, 99)] = capped.get(min(value, 99), 0) + weight
+
+    return tuple(capped), tuple(itertools.accumulate(capped.values()))
+
+
+def characteristic_test_from_table(
+    tested_value: int, repetition: int = 1, rng: random.Random = None
+) -> int:
+    """Perform characteristic test with a single draw.
+
+    Gives the same results as :func:`characteristic_test`, but draws the
+    final value from :func:`characteristic_test_distribution` instead of
+    simulating each round.
+
+    :param tested_value: tested value
+    :type tested_value: int
+    :param repetition: how many test to perform
+    :type repetition: int
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
+    :return: unchanged or increased tested value, but not higher than 99
+    :rtype: int
+    """
+    values, cum_weights = characteristic_test_distribution(tested_value, repetition)
+    return (rng or random).choices(values, cum_weights=cum_weights)[0]
+
+
 def calc_move_rate(strength: int, dexterity: int, size: int) -> int:
     """Return move rate base on relations between
     strength, dexterity and size
@@ -604,7 +1003,9 @@ def calc_move_rate(strength: int, dexterity: int, size: int) -> int:
 
 
 # TODO: write unit test
-def generate_last_name(year: int, sex: str, country: str, weights: bool) -> str:
+def generate_last_name(
+    year: int, sex: str, country: str, weights: bool, rng: random.Random = None
+) -> str:
     """Return random last name based on the given parameters
 
     .. note:
@@ -618,22 +1019,19 @@ def generate_last_name(year: int, sex: str, country: str, weights: bool) -> str:
     :type country: str
     :param weights: If true, take under account popularity of names. [default: True]
     :type weights: bool
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
     :return: last name
     :rtype: str
     """
-    sex = _verify_and_return_sex(sex, country, name="last_names")
-    return randname.last_name(
-        year,
-        sex,
-        country,
-        weights,
-        database=cochar.DATABASE,
-        show_warnings=cochar.SHOW_WARNINGS,
-    )
+    sex = _verify_and_return_sex(sex, country, name="last_names", rng=rng)
+    return _generate_name("last_names", year, sex, country, weights, rng=rng)
 
 
 # TODO: write unit test
-def generate_first_name(year: int, sex: str, country: str, weights: bool) -> str:
+def generate_first_name(
+    year: int, sex: str, country: str, weights: bool, rng: random.Random = None
+) -> str:
     """Return random first name based on given parameters.
 
     .. note:
@@ -647,22 +1045,51 @@ def generate_first_name(year: int, sex: str, country: str, weights: bool) -> str
     :type country: str
     :param weights: if true, take under account popularity of names. [default: True]
     :type weights: bool
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
     :return: first name
     :rtype: str
     """
-    sex = _verify_and_return_sex(sex, country, name="first_names")
-    return randname.first_name(
-        year,
-        sex,
-        country,
-        weights,
-        database=cochar.DATABASE,
-        show_warnings=cochar.SHOW_WARNINGS,
-    )
+    sex = _verify_and_return_sex(sex, country, name="first_names", rng=rng)
+    return _generate_name("first_names", year, sex, country, weights, rng=rng)
+
+
+def _generate_name(
+    name_type: str,
+    year: int,
+    sex: str,
+    country: str,
+    weights: bool,
+    rng: random.Random = None,
+) -> str:
+    """Return random name from ``cochar.DATABASE``.
+
+    Works like ``randname.first_name()`` and ``randname.last_name()``,
+    but draws with the given random number generator from data sets
+    kept in ``cochar.name.NAME_POOL``.
+
+    :param name_type: "first_names" or "last_names"
+    :type name_type: str
+    :param year: year of the data set with names
+    :type year: int
+    :param sex: name gender, one of available options for the country
+    :type sex: str
+    :param country: name country
+    :type country: str
+    :param weights: if true, take under account popularity of names
+    :type weights: bool
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
+    :return: name
+    :rtype: str
+    """
+    return cochar.name.NAME_POOL.draw(name_type, year, sex, country, weights, rng)
 
 
 # TODO: write unit test
-def _verify_and_return_sex(sex: str, country: str, name: str) -> str:
+def _verify_and_return_sex(
+    sex: str, country: str, name: str, rng: random.Random = None
+) -> str:
     """Return valid sex, based on sex, country and name.
     if provided sex is invalid, it will be overridden, and
     function return valid sex.
@@ -673,23 +1100,28 @@ def _verify_and_return_sex(sex: str, country: str, name: str) -> str:
     :type country: str
     :param name: _description_
     :type name: str
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
     :return: _description_
     :rtype: str
     """
-    available_sex = randname.show_data()[country][name]
+    available_sex = cochar.name.show_data()[country][name]
     if sex not in available_sex:
         if "N" in available_sex:
             sex = "N"
         else:
-            sex = random.choice(available_sex)
+            sex = (rng or random).choice(available_sex)
     return sex
 
 
-def generate_sex(sex: Union[str, bool] = None) -> str:
+def generate_sex(sex: Union[str, bool] = None, rng: random.Random = None) -> str:
     """Generate character's sex
 
     :param sex: Character's sex, if provided return that value
     :type sex: Union[str, bool]
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
+
     :raises ValueError: If provided sex is not in {"M", "F", None}, raise this error
     :return: Character's sex as "M" or "F"
     :rtype: str
@@ -697,4 +1129,4 @@ def generate_sex(sex: Union[str, bool] = None) -> str:
     if sex not in cochar.SEX_OPTIONS:
         raise ValueError(f"incorrect sex value: {sex} -> ['M', 'F', None]")
 
-    return random.choice(("M", "F")) if sex is None else sex.upper()
+    return (rng or random).choice(("M", "F")) if sex is None else sex.upper()
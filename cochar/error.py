@@ -259,3 +259,18 @@ class OccupationPointsBelowZero(CocharError):
     """Raise when provided occupation points are below 0"""
 
     pass
+
+
+class BatchValueNotInRange(CocharError):
+    """Raise when a value doesn't fit in a column of a batch"""
+
+    def __init__(self, column: str, value: int, min_value: int, max_value: int):
+        self.column = column
+        self.value = value
+        self.min_value = min_value
+        self.max_value = max_value
+        self.message = f"'{self.column}' value {self.value} not in range [{self.min_value}, {self.max_value}]"
+        super().__init__(self.message)
+
+    def __str__(self):
+        return self.message
@@ -15,11 +15,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from abc import ABC, abstractmethod, abstractproperty
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple, Union
 
 import os
 import json
 import itertools
+import sqlite3
+import time
 
 
 class SkillsDataInterface(ABC):
@@ -49,36 +51,53 @@ class SkillsDataInterface(ABC):
 
 
 class SkillsJSONInterface(SkillsDataInterface):
+    """Skills data read from JSON file.
+
+    Skills available in the era are indexed once, after loading
+    data and whenever ``era`` is assigned, so all getters are
+    simple lookups. Changing ``era`` set in place doesn't rebuild
+    indexes, assign a new value instead.
+    """
+
     def __init__(self, database: Path, era: set = None):
-        super().__init__(database, era)
         self.load_data(database)
-        self.database = database
-        if not era:
-            self.era = {"classic-1920", "modern"}
-        else:
-            self.era = set(era)
+        super().__init__(database, era or {"classic-1920", "modern"})
+
+    @property
+    def era(self) -> Set[str]:
+        return self._era
+
+    @era.setter
+    def era(self, era: Iterable[str]) -> None:
+        self._era = set(era)
+        self._build_indexes()
 
     def load_data(self, database) -> None:
         with open(database, "r", encoding="utf-8") as json_file:
             self.skills_data: Dict = json.load(json_file)
+        if hasattr(self, "_era"):
+            self._build_indexes()
 
-    def get_skills(self) -> Dict[str, int]:
-        return {
-            skill: item["value"]
+    def _build_indexes(self) -> None:
+        skills = {
+            skill: item
             for skill, item in self.skills_data.items()
-            if set(item["era"]).issuperset(self.era)
+            if set(item["era"]).issuperset(self._era)
         }
+        categories: Dict[str, List[str]] = {}
+        for skill, item in skills.items():
+            for category in item["categories"]:
+                categories.setdefault(category, []).append(skill)
 
-    def get_all_skills_names(self) -> List[str]:
-        return [
-            skill
-            for skill, item in self.skills_data.items()
-            if set(item["era"]).issuperset(self.era)
-        ]
-
-    # TODO: filter out categories that are not in current era
-    def get_categories_names(self) -> List[str]:
-        return list(
+        self._skills: Dict[str, int] = {
+            skill: item["value"] for skill, item in skills.items()
+        }
+        self._all_skills_names: FrozenSet[str] = frozenset(skills)
+        self._categories: Dict[str, Tuple[str, ...]] = {
+            category: tuple(skills) for category, skills in categories.items()
+        }
+        # TODO: filter out categories that are not in current era
+        self._categories_names: Tuple[str, ...] = tuple(
             set(
                 itertools.chain(
                     *map(lambda item: item["categories"], self.skills_data.values())
@@ -86,29 +105,415 @@ class SkillsJSONInterface(SkillsDataInterface):
             )
         )
 
-    def get_basic_skills_names(self) -> List:
-        skills_basic = [
-            skill
-            for skill, item in self.skills_data.items()
-            if "basic" in self.skills_data[skill]["categories"]
-            and set(item["era"]).issuperset(self.era)
-        ]
-        return skills_basic
-
-    def get_skills_from_category(self, category) -> List[str]:
-        return [
-            skill
-            for skill, item in self.skills_data.items()
-            if category in self.skills_data[skill]["categories"]
-            and set(item["era"]).issuperset(self.era)
-        ]
+    def get_skills(self) -> Dict[str, int]:
+        return self._skills.copy()
+
+    def get_all_skills_names(self) -> FrozenSet[str]:
+        return self._all_skills_names
+
+    def get_categories_names(self) -> Tuple[str, ...]:
+        return self._categories_names
+
+    def get_basic_skills_names(self) -> Tuple[str, ...]:
+        return self._categories.get("basic", ())
+
+    def get_skills_from_category(self, category) -> Tuple[str, ...]:
+        return self._categories.get(category, ())
+
+
+SQL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS skill_eras (
+    skill_id INTEGER NOT NULL REFERENCES skills (id) ON DELETE CASCADE,
+    era TEXT NOT NULL,
+    PRIMARY KEY (skill_id, era)
+);
+CREATE TABLE IF NOT EXISTS skill_categories (
+    skill_id INTEGER NOT NULL REFERENCES skills (id) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    PRIMARY KEY (skill_id, category)
+);
+CREATE INDEX IF NOT EXISTS skill_eras_era ON skill_eras (era, skill_id);
+CREATE INDEX IF NOT EXISTS skill_categories_category
+    ON skill_categories (category, skill_id);
+"""
+
+# Ids of skills available in all eras from temp.current_era
+_SQL_ERA_SKILLS = """
+    SELECT skill_id FROM skill_eras
+    WHERE era IN (SELECT era FROM temp.current_era)
+    GROUP BY skill_id
+    HAVING COUNT(*) = (SELECT COUNT(*) FROM temp.current_era)
+"""
+_SQL_SKILLS = (
+    f"SELECT name, value FROM skills WHERE id IN ({_SQL_ERA_SKILLS}) ORDER BY id"
+)
+_SQL_SKILLS_FROM_CATEGORY = f"""
+    SELECT skills.name FROM skill_categories
+    JOIN skills ON skills.id = skill_categories.skill_id
+    WHERE skill_categories.category = ? AND skills.id IN ({_SQL_ERA_SKILLS})
+    ORDER BY skills.id
+"""
+_SQL_CATEGORIES_NAMES = (
+    "SELECT DISTINCT category FROM skill_categories ORDER BY category"
+)
+
+
+def import_skills_to_sql(
+    json_database: Path, sql_database: Union[Path, sqlite3.Connection]
+) -> None:
+    """Import skills from JSON file, like ``skills.json``, to SQLite
+    database. Skills that already exist are updated and keep their
+    position in the order of skills.
+
+    :param json_database: path to JSON file with skills
+    :type json_database: Path
+    :param sql_database: path to SQLite database or open connection
+    :type sql_database: Union[Path, sqlite3.Connection]
+    """
+    with open(json_database, "r", encoding="utf-8") as json_file:
+        skills_data: Dict = json.load(json_file)
+
+    if isinstance(sql_database, sqlite3.Connection):
+        connection = sql_database
+    else:
+        connection = sqlite3.connect(sql_database)
+
+    try:
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.executescript(SQL_SCHEMA)
+        with connection:
+            for skill, item in skills_data.items():
+                connection.execute(
+                    "INSERT INTO skills (name, value) VALUES (?, ?) "
+                    "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+                    (skill, item["value"]),
+                )
+                (skill_id,) = connection.execute(
+                    "SELECT id FROM skills WHERE name = ?", (skill,)
+                ).fetchone()
+                connection.execute(
+                    "DELETE FROM skill_eras WHERE skill_id = ?", (skill_id,)
+                )
+                connection.execute(
+                    "DELETE FROM skill_categories WHERE skill_id = ?", (skill_id,)
+                )
+                connection.executemany(
+                    "INSERT INTO skill_eras (skill_id, era) VALUES (?, ?)",
+                    [(skill_id, era) for era in set(item["era"])],
+                )
+                connection.executemany(
+                    "INSERT INTO skill_categories (skill_id, category) VALUES (?, ?)",
+                    [(skill_id, category) for category in set(item["categories"])],
+                )
+    finally:
+        if connection is not sql_database:
+            connection.close()
 
 
 class SkillsSQLInterface(SkillsDataInterface):
-    # TODO: implement SQL interface
-    pass
+    """Skills data read from SQLite database.
+
+    Create database with :func:`import_skills_to_sql`. Results of queries
+    are cached until ``era`` is assigned again or :meth:`clear_cache`
+    is called, e.g. after the database has been changed.
+    """
+
+    def __init__(self, database: Path, era: set = None):
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        self.connection.executescript(
+            "CREATE TEMP TABLE IF NOT EXISTS current_era (era TEXT PRIMARY KEY)"
+        )
+        self._categories: Dict[str, Tuple[str, ...]] = {}
+        super().__init__(database, era or {"classic-1920", "modern"})
+
+    @property
+    def era(self) -> Set[str]:
+        return self._era
+
+    @era.setter
+    def era(self, era: Iterable[str]) -> None:
+        self._era = set(era)
+        with self.connection:
+            self.connection.execute("DELETE FROM temp.current_era")
+            self.connection.executemany(
+                "INSERT INTO temp.current_era (era) VALUES (?)",
+                [(era,) for era in self._era],
+            )
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Forget cached results of queries."""
+        self._skills: Dict[str, int] = None
+        self._all_skills_names: FrozenSet[str] = None
+        self._categories_names: Tuple[str, ...] = None
+        self._categories.clear()
+
+    def close(self) -> None:
+        """Close connection to the database."""
+        self.connection.close()
+
+    def get_skills(self) -> Dict[str, int]:
+        if self._skills is None:
+            self._skills = dict(self.connection.execute(_SQL_SKILLS).fetchall())
+        return self._skills.copy()
+
+    def get_all_skills_names(self) -> FrozenSet[str]:
+        if self._all_skills_names is None:
+            self._all_skills_names = frozenset(self.get_skills())
+        return self._all_skills_names
+
+    def get_categories_names(self) -> Tuple[str, ...]:
+        if self._categories_names is None:
+            self._categories_names = tuple(
+                category for category, in self.connection.execute(_SQL_CATEGORIES_NAMES)
+            )
+        return self._categories_names
+
+    def get_basic_skills_names(self) -> Tuple[str, ...]:
+        return self.get_skills_from_category("basic")
+
+    def get_skills_from_category(self, category) -> Tuple[str, ...]:
+        skills = self._categories.get(category)
+        if skills is None:
+            skills = self._categories[category] = tuple(
+                skill
+                for skill, in self.connection.execute(
+                    _SQL_SKILLS_FROM_CATEGORY, (category,)
+                )
+            )
+        return skills
+
+
+REDIS_PREFIX = "cochar:skills"
+
+
+def _import_redis():
+    try:
+        import redis
+    except ImportError as error:
+        raise ImportError(
+            "Redis interface requires redis, install it with "
+            "``pip install cochar[redis]``"
+        ) from error
+    return redis
+
+
+class _RedisKeys:
+    def __init__(self, prefix: str):
+        self.version = f"{prefix}:version"
+        self.next_order = f"{prefix}:next_order"
+        self.categories = f"{prefix}:categories"
+        self._skill = f"{prefix}:skill:"
+        self._era = f"{prefix}:era:"
+        self._category = f"{prefix}:category:"
+
+    def skill(self, skill: str) -> str:
+        return self._skill + skill
+
+    def era(self, era: str) -> str:
+        return self._era + era
+
+    def category(self, category: str) -> str:
+        return self._category + category
+
+
+def import_skills_to_redis(
+    json_database: Path, client, prefix: str = REDIS_PREFIX
+) -> None:
+    """Import skills from JSON file, like ``skills.json``, to Redis.
+
+    Every skill is a hash ``<prefix>:skill:<name>`` with its base value
+    and position in the order of skills. Sets ``<prefix>:era:<era>`` and
+    ``<prefix>:category:<category>`` index skills by era and category.
+    Skills that already exist are updated and keep their position.
+    ``<prefix>:version`` is incremented, so interfaces reading the same
+    prefix reload their data.
+
+    :param json_database: path to JSON file with skills
+    :type json_database: Path
+    :param client: Redis client, created with ``decode_responses=True``
+    :type client: redis.Redis
+    :param prefix: prefix of keys, defaults to REDIS_PREFIX
+    :type prefix: str, optional
+    """
+    redis = _import_redis()
+    keys = _RedisKeys(prefix)
+    with open(json_database, "r", encoding="utf-8") as json_file:
+        skills_data: Dict = json.load(json_file)
+
+    with client.pipeline() as transaction:
+        while True:
+            try:
+                transaction.watch(keys.version)
+                reads = client.pipeline(transaction=False)
+                reads.get(keys.next_order)
+                for skill in skills_data:
+                    reads.hmget(keys.skill(skill), "order", "era", "categories")
+                next_order, *existing = reads.execute()
+                next_order = int(next_order or 0)
+
+                transaction.multi()
+                for (skill, item), (order, eras, categories) in zip(
+                    skills_data.items(), existing
+                ):
+                    key = keys.skill(skill)
+                    for era in json.loads(eras or "[]"):
+                        transaction.srem(keys.era(era), skill)
+                    for category in json.loads(categories or "[]"):
+                        transaction.srem(keys.category(category), skill)
+                    if order is None:
+                        order, next_order = next_order, next_order + 1
+                    transaction.hset(
+                        key,
+                        mapping={
+                            "value": item["value"],
+                            "order": order,
+                            "era": json.dumps(item["era"]),
+                            "categories": json.dumps(item["categories"]),
+                        },
+                    )
+                    for era in item["era"]:
+                        transaction.sadd(keys.era(era), skill)
+                    for category in item["categories"]:
+                        transaction.sadd(keys.category(category), skill)
+                        transaction.sadd(keys.categories, category)
+                transaction.set(keys.next_order, next_order)
+                transaction.incr(keys.version)
+                # Fails with WatchError if the version changed after WATCH
+                transaction.execute()
+                return
+            except redis.WatchError:
+                # Another import ran meanwhile, read existing skills again
+                continue
 
 
 class SkillsRedisInterface(SkillsDataInterface):
-    # TODO: implement Redis interface
-    pass
+    """Skills data read from Redis, see :func:`import_skills_to_redis`
+    for the layout of keys.
+
+    Data of the era is fetched with two pipelined round trips and kept
+    in a local cache, so getters are simple lookups. At most once every
+    ``check_interval`` seconds a getter reads ``<prefix>:version`` and
+    reloads data if it has changed. With ``check_interval=None`` data is
+    reloaded only when ``era`` is assigned or :meth:`reload` is called.
+
+    Reloading updates only the interface. :class:`cochar.skill.SkillsGenerator`
+    copies skills data and compiles skill plans in ``set_interface``, so
+    a generator keeps using the old data until ``set_interface`` is called
+    again, or a new generator is built, after a new version is imported.
+
+    :param database: Redis URL, ignored if ``client`` is given
+    :type database: str
+    :param era: skills era, defaults to {"classic-1920", "modern"}
+    :type era: set, optional
+    :param client: Redis client, created with ``decode_responses=True``
+    :type client: redis.Redis, optional
+    :param prefix: prefix of keys, defaults to REDIS_PREFIX
+    :type prefix: str, optional
+    :param check_interval: seconds between version checks, defaults to 1.0
+    :type check_interval: float, optional
+    """
+
+    def __init__(
+        self,
+        database: str = "redis://localhost:6379/0",
+        era: set = None,
+        client=None,
+        prefix: str = REDIS_PREFIX,
+        check_interval: float = 1.0,
+    ):
+        if client is None:
+            client = _import_redis().Redis.from_url(database, decode_responses=True)
+        self.client = client
+        self.keys = _RedisKeys(prefix)
+        self.check_interval = check_interval
+        super().__init__(database, era or {"classic-1920", "modern"})
+
+    @property
+    def era(self) -> Set[str]:
+        return self._era
+
+    @era.setter
+    def era(self, era: Iterable[str]) -> None:
+        self._era = set(era)
+        self.reload()
+
+    def reload(self) -> None:
+        """Fetch data of the era from Redis."""
+        while True:
+            reads = self.client.pipeline(transaction=False)
+            reads.get(self.keys.version)
+            reads.smembers(self.keys.categories)
+            if self._era:
+                reads.sinter([self.keys.era(era) for era in self._era])
+                version, categories_names, skills_names = reads.execute()
+            else:
+                # No era, no skills, SINTER requires at least one key
+                version, categories_names = reads.execute()
+                skills_names = set()
+
+            categories_names = sorted(categories_names)
+            reads = self.client.pipeline(transaction=False)
+            for skill in skills_names:
+                reads.hmget(self.keys.skill(skill), "value", "order")
+            for category in categories_names:
+                reads.smembers(self.keys.category(category))
+            reads.get(self.keys.version)
+            *results, current_version = reads.execute()
+            # Both round trips read the same version, otherwise data was
+            # imported between them and is read again
+            if current_version == version:
+                break
+
+        values = results[: len(skills_names)]
+        skills = sorted(
+            (int(order), skill, int(value))
+            for skill, (value, order) in zip(skills_names, values)
+        )
+        self._skills: Dict[str, int] = {skill: value for _, skill, value in skills}
+        self._all_skills_names: FrozenSet[str] = frozenset(self._skills)
+        self._categories: Dict[str, Tuple[str, ...]] = {}
+        for category, members in zip(categories_names, results[len(skills_names) :]):
+            skills_in_category = tuple(
+                skill for skill in self._skills if skill in members
+            )
+            if skills_in_category:
+                self._categories[category] = skills_in_category
+        self._categories_names: Tuple[str, ...] = tuple(categories_names)
+        self._version = version
+        self._next_check = time.monotonic() + (self.check_interval or 0)
+
+    def _check_version(self) -> None:
+        if self.check_interval is None:
+            return
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        if self.client.get(self.keys.version) != self._version:
+            self.reload()
+        else:
+            self._next_check = now + self.check_interval
+
+    def get_skills(self) -> Dict[str, int]:
+        self._check_version()
+        return self._skills.copy()
+
+    def get_all_skills_names(self) -> FrozenSet[str]:
+        self._check_version()
+        return self._all_skills_names
+
+    def get_categories_names(self) -> Tuple[str, ...]:
+        self._check_version()
+        return self._categories_names
+
+    def get_basic_skills_names(self) -> Tuple[str, ...]:
+        return self.get_skills_from_category("basic")
+
+    def get_skills_from_category(self, category) -> Tuple[str, ...]:
+        self._check_version()
+        return self._categories.get(category, ())
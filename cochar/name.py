@@ -0,0 +1,335 @@
+# Cochar - create a random character for Call of Cthulhu RPG 7th ed.
+# Copyright (C) 2023  Adam Walkiewicz
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""**Names**
+Names is a module that keeps name data sets from ``cochar.DATABASE``
+in memory, so names can be drawn without reading files every time.
+
+:param DEFAULT_MEMORY_BUDGET: default memory budget of a pool in bytes
+:param NAME_POOL: default pool used by ``generate_first_name()``
+    and ``generate_last_name()``
+
+Metadata of the database (available countries and sexes) is also
+read once per database path, see :func:`show_data` and
+:func:`invalidate_metadata`.
+"""
+import functools
+import json
+import os
+import random
+import sys
+import threading
+import warnings
+from array import array
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Tuple
+
+import cochar
+import cochar.utils
+
+DEFAULT_MEMORY_BUDGET: int = 32 * 1024 * 1024
+
+
+class NameDataset:
+    """Names and cumulative weights of one data set.
+
+    Names are kept in a tuple of interned strings, cumulative
+    weights in a flat array of 64 bit integers.
+
+    :param names: names
+    :type names: List[str]
+    :param cum_weights: cumulative weights of names
+    :type cum_weights: List[int]
+    """
+
+    __slots__ = ("names", "cum_weights", "size")
+
+    def __init__(self, names: List[str], cum_weights: List[int]):
+        self.names: Tuple[str, ...] = tuple(sys.intern(name) for name in names)
+        self.cum_weights: array = array("q", cum_weights)
+        self.size: int = (
+            sys.getsizeof(self.names)
+            + sum(sys.getsizeof(name) for name in self.names)
+            + sys.getsizeof(self.cum_weights)
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def draw(self, weights: bool, rng: random.Random = None) -> str:
+        """Return random name.
+
+        :param weights: if true, take under account popularity of names
+        :type weights: bool
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :return: name
+        :rtype: str
+        """
+        rng = rng or random
+        if weights:
+            return rng.choices(self.names, cum_weights=self.cum_weights)[0]
+        return rng.choice(self.names)
+
+    def draw_many(self, k: int, weights: bool, rng: random.Random = None) -> List[str]:
+        """Return ``k`` random names.
+
+        :param k: number of names
+        :type k: int
+        :param weights: if true, take under account popularity of names
+        :type weights: bool
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :return: names
+        :rtype: List[str]
+        """
+        rng = rng or random
+        if weights:
+            return rng.choices(self.names, cum_weights=self.cum_weights, k=k)
+        return rng.choices(self.names, k=k)
+
+
+class NamePool:
+    """Least recently used cache of name data sets.
+
+    Data sets are loaded once per (database, country, name type,
+    data set year, sex) and evicted, least recently used first,
+    when their total size exceeds ``memory_budget``. The most
+    recently used data set is always kept, even if it alone
+    exceeds the budget. The pool is safe to share between threads.
+
+    :param memory_budget: memory budget in bytes, defaults to DEFAULT_MEMORY_BUDGET
+    :type memory_budget: int, optional
+
+    >>> pool = NamePool()
+    >>> pool.draw("last_names", 1925, "N", "US", True) in pool.dataset(
+    ...     "last_names", 1925, "N", "US"
+    ... ).names
+    True
+    """
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        self.memory_budget = memory_budget
+        self.memory_usage: int = 0
+        self._datasets: OrderedDict = OrderedDict()
+        self._years: dict = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._datasets)
+
+    def clear(self) -> None:
+        """Remove all data sets from the pool."""
+        with self._lock:
+            self._datasets.clear()
+            self._years.clear()
+            self.memory_usage = 0
+
+    def available_years(self, name_type: str, country: str) -> Tuple[int, ...]:
+        """Return sorted years of data sets available for the country.
+
+        :param name_type: "first_names" or "last_names"
+        :type name_type: str
+        :param country: name country
+        :type country: str
+        :return: years of available data sets
+        :rtype: Tuple[int, ...]
+        """
+        key = (cochar.DATABASE, country, name_type)
+        if key not in self._years:
+            names_folder = os.path.join(cochar.DATABASE, country, name_type)
+            self._years[key] = tuple(
+                sorted({int(file.split("_")[0]) for file in os.listdir(names_folder)})
+            )
+        return self._years[key]
+
+    def dataset(self, name_type: str, year: int, sex: str, country: str) -> NameDataset:
+        """Return data set closest to the given year.
+
+        :param name_type: "first_names" or "last_names"
+        :type name_type: str
+        :param year: year of the data set with names
+        :type year: int
+        :param sex: name gender, one of available options for the country
+        :type sex: str
+        :param country: name country
+        :type country: str
+        :return: data set
+        :rtype: NameDataset
+        """
+        data_range = self.available_years(name_type, country)
+
+        if cochar.SHOW_WARNINGS and not data_range[0] <= year <= data_range[-1]:
+            warnings.warn(f"{year} -> {year} not in range {data_range}")
+
+        data_year = data_range[cochar.utils.narrowed_bisect(data_range, year)]
+        key = (cochar.DATABASE, country, name_type, data_year, sex)
+
+        with self._lock:
+            dataset = self._datasets.get(key)
+            if dataset is not None:
+                self._datasets.move_to_end(key)
+                return dataset
+
+        path_to_dataset = os.path.join(
+            cochar.DATABASE, country, name_type, f"{data_year}_{sex}"
+        )
+        with open(path_to_dataset, "r", encoding="utf-8") as json_file:
+            data_set = json.load(json_file)
+        loaded = NameDataset(data_set["Names"], data_set["Totals"])
+
+        with self._lock:
+            # Another thread may have loaded the same data set meanwhile.
+            dataset = self._datasets.get(key)
+            if dataset is not None:
+                self._datasets.move_to_end(key)
+                return dataset
+            self._datasets[key] = loaded
+            self.memory_usage += loaded.size
+            self._evict()
+            return loaded
+
+    def draw(
+        self,
+        name_type: str,
+        year: int,
+        sex: str,
+        country: str,
+        weights: bool,
+        rng: random.Random = None,
+    ) -> str:
+        """Return random name.
+
+        :param name_type: "first_names" or "last_names"
+        :type name_type: str
+        :param year: year of the data set with names
+        :type year: int
+        :param sex: name gender, one of available options for the country
+        :type sex: str
+        :param country: name country
+        :type country: str
+        :param weights: if true, take under account popularity of names
+        :type weights: bool
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :return: name
+        :rtype: str
+        """
+        return self.dataset(name_type, year, sex, country).draw(weights, rng)
+
+    def draw_many(
+        self,
+        k: int,
+        name_type: str,
+        year: int,
+        sex: str,
+        country: str,
+        weights: bool,
+        rng: random.Random = None,
+    ) -> List[str]:
+        """Return ``k`` random names.
+
+        :param k: number of names
+        :type k: int
+        :param name_type: "first_names" or "last_names"
+        :type name_type: str
+        :param year: year of the data set with names
+        :type year: int
+        :param sex: name gender, one of available options for the country
+        :type sex: str
+        :param country: name country
+        :type country: str
+        :param weights: if true, take under account popularity of names
+        :type weights: bool
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :return: names
+        :rtype: List[str]
+        """
+        return self.dataset(name_type, year, sex, country).draw_many(k, weights, rng)
+
+    def _evict(self) -> None:
+        while self.memory_usage > self.memory_budget and len(self._datasets) > 1:
+            _, dataset = self._datasets.popitem(last=False)
+            self.memory_usage -= dataset.size
+
+
+NAME_POOL = NamePool()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_metadata(database: str) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+    result = {}
+    for country in sorted(os.listdir(database)):
+        path_to_info_json = os.path.join(database, country, "info.json")
+        with open(path_to_info_json, "r", encoding="utf-8") as info_file:
+            info_dict = json.load(info_file)
+        result.setdefault(
+            info_dict["country"],
+            {
+                "first_names": tuple(info_dict["first_names"]),
+                "last_names": tuple(info_dict["last_names"]),
+            },
+        )
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _load_available_countries(database: str) -> FrozenSet[str]:
+    return frozenset(os.listdir(database))
+
+
+def show_data(database: str = None) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+    """Return information about database, like ``randname.show_data()``.
+
+    Database is scanned only once, next calls return the same
+    snapshot. It must not be modified.
+
+    :param database: path to names database, defaults to ``cochar.DATABASE``
+    :type database: str, optional
+    :return: available sexes of first and last names for each country
+    :rtype: Dict[str, Dict[str, Tuple[str, ...]]]
+
+    >>> show_data()["US"]
+    {'first_names': ('M', 'F'), 'last_names': ('N',)}
+    """
+    return _load_metadata(database or cochar.DATABASE)
+
+
+def available_countries(database: str = None) -> FrozenSet[str]:
+    """Return available countries, like ``randname.available_countries()``.
+
+    Database is scanned only once, next calls return the same snapshot.
+
+    :param database: path to names database, defaults to ``cochar.DATABASE``
+    :type database: str, optional
+    :return: available countries
+    :rtype: FrozenSet[str]
+
+    >>> sorted(available_countries())
+    ['ES', 'PL', 'US']
+    """
+    return _load_available_countries(database or cochar.DATABASE)
+
+
+def invalidate_metadata() -> None:
+    """Forget database metadata snapshots, so the next call
+    to :func:`show_data` or :func:`available_countries` reads
+    the database again. Use it after adding countries or data sets
+    to the database.
+    """
+    _load_metadata.cache_clear()
+    _load_available_countries.cache_clear()
+    NAME_POOL.clear()
@@ -17,15 +17,126 @@
 Occupations is a module that contains functions related
 with occupations
 """
-import copy
+import functools
 import random
-from itertools import compress
-from typing import List, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Tuple, Union
 
 import cochar
 import cochar.skill
 import cochar.error
 
+SKILL_POINTS_GROUPS: Tuple[str, ...] = cochar.SKILL_POINTS_GROUPS
+
+
+class OccupationIndex:
+    """Bitset index of occupations.
+
+    Each occupation gets an id, its position in ``occupations_data``.
+    For every type, era, tag and skill points group there is an integer
+    mask with bits of matching occupations set, so any combination
+    of criteria is resolved with bitwise AND.
+
+    :param occupations_data: occupations data, like ``cochar.OCCUPATIONS_DATA``
+    :type occupations_data: Dict[str, dict]
+
+    >>> index = OccupationIndex(cochar.OCCUPATIONS_DATA)
+    >>> index.count(occup_type="custom")
+    1
+    >>> index.occupations(index.query(occup_type="custom"))
+    ('software tester',)
+    """
+
+    def __init__(self, occupations_data: Dict[str, dict]):
+        self.names: Tuple[str, ...] = tuple(occupations_data)
+        self.all: int = (1 << len(self.names)) - 1
+        self.types: Dict[str, int] = {}
+        self.eras: Dict[str, int] = {}
+        self.tags: Dict[str, int] = {}
+        self.groups: Tuple[int, ...]
+
+        groups = [0] * len(SKILL_POINTS_GROUPS)
+        for i, (name, data) in enumerate(occupations_data.items()):
+            bit = 1 << i
+            self.types[data["type"]] = self.types.get(data["type"], 0) | bit
+            self.eras[data["era"]] = self.eras.get(data["era"], 0) | bit
+            for tag in data["tags"]:
+                self.tags[tag] = self.tags.get(tag, 0) | bit
+            for j, group in enumerate(SKILL_POINTS_GROUPS):
+                if group in data["groups"]:
+                    groups[j] |= bit
+        self.groups = tuple(groups)
+
+    def query(
+        self,
+        occup_type: str = None,
+        era: Union[str, Iterable[str]] = None,
+        tags: Iterable[str] = None,
+    ) -> int:
+        """Return mask of occupations that meet the criteria.
+
+        Like in ``generate_occupation()``, occupation meets ``era``
+        if its era is ``in era``, and meets ``tags`` if it has all of them.
+
+        :param occup_type: type of occupation, defaults to None
+        :type occup_type: str, optional
+        :param era: era or eras of occupation, defaults to None
+        :type era: Union[str, Iterable[str]], optional
+        :param tags: tags that occupation must have, defaults to None
+        :type tags: Iterable[str], optional
+        :return: mask of occupations
+        :rtype: int
+        """
+        mask = self.all
+        if occup_type:
+            mask &= self.types.get(occup_type, 0)
+        if era:
+            era_mask = 0
+            for name, bits in self.eras.items():
+                if name in era:
+                    era_mask |= bits
+            mask &= era_mask
+        if tags:
+            for tag in tags:
+                mask &= self.tags.get(tag, 0)
+        return mask
+
+    def count(
+        self,
+        occup_type: str = None,
+        era: Union[str, Iterable[str]] = None,
+        tags: Iterable[str] = None,
+    ) -> int:
+        """Return number of occupations that meet the criteria.
+
+        :param occup_type: type of occupation, defaults to None
+        :type occup_type: str, optional
+        :param era: era or eras of occupation, defaults to None
+        :type era: Union[str, Iterable[str]], optional
+        :param tags: tags that occupation must have, defaults to None
+        :type tags: Iterable[str], optional
+        :return: number of occupations
+        :rtype: int
+        """
+        return bin(self.query(occup_type, era, tags)).count("1")
+
+    def occupations(self, mask: int) -> Tuple[str, ...]:
+        """Return names of occupations in the mask, in ids order.
+
+        :param mask: mask of occupations
+        :type mask: int
+        :return: occupations names
+        :rtype: Tuple[str, ...]
+        """
+        names = []
+        while mask:
+            lowest_bit = mask & -mask
+            names.append(self.names[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return tuple(names)
+
+
+OCCUPATIONS_INDEX = OccupationIndex(cochar.OCCUPATIONS_DATA)
+
 
 def generate_occupation(
     education: int = 1,
@@ -38,6 +149,7 @@ def generate_occupation(
     occup_type: str = None,
     era: List[str] = None,
     tags: List[str] = None,
+    rng: random.Random = None,
 ) -> str:
     """Return occupation based on:
     education, power, dexterity, appearance and strength.
@@ -62,76 +174,130 @@ def generate_occupation(
     :type era: str, optional
     :param tags: return occupation with defined tags, defaults to None
     :type tags: List[str], optional
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
     :raises cochar.error.IncorrectOccupation: when occupation is not in the list of available occupations
     :raises cochar.error.NoneOccupationMeetsCriteria: when searching criteria are not met by any occupation
     :return: occupation name
     :rtype: str
     """
     # TODO: What happen if user provide illegal values, strings or below 0?
-    skill_points_groups: List[int] = [
-        education * 4,  # 1
-        education * 2 + power * 2,  # 2
-        education * 2 + dexterity * 2,  # 3
-        education * 2 + appearance * 2,  # 4
-        education * 2 + strength * 2,  # 5
-    ]
-
+    rng = rng or random
     if random_mode:
-        return random.choice(cochar.OCCUPATIONS_LIST)
+        return rng.choice(cochar.OCCUPATIONS_LIST)
 
     if occupation:
         if occupation not in cochar.OCCUPATIONS_LIST:
             raise cochar.error.IncorrectOccupation(occupation)
         return occupation
 
-    occupation_groups = copy.deepcopy(cochar.OCCUPATIONS_GROUPS)
-
-    if occup_type:
-        for i, group in enumerate(occupation_groups):
-            occupation_groups[i] = [
-                occup
-                for occup in group
-                if cochar.OCCUPATIONS_DATA[occup]["type"] == occup_type
-            ]
-
-    if era:
-        for i, group in enumerate(occupation_groups):
-            occupation_groups[i] = [
-                occup for occup in group if cochar.OCCUPATIONS_DATA[occup]["era"] in era
-            ]
-
-    if tags:
-        for i, group in enumerate(occupation_groups):
-            occupation_groups[i] = [
-                occup
-                for occup in group
-                if set(tags).issubset(set(cochar.OCCUPATIONS_DATA[occup]["tags"]))
-            ]
-
-    filtered_occupation_groups = [
-        e for e in compress(occupation_groups, occupation_groups)
-    ]
-    filtered_skill_points_group = [
-        e for e in compress(skill_points_groups, occupation_groups)
-    ]
-
-    if not filtered_occupation_groups:
+    candidates = candidate_occupation_groups(
+        *_normalise_criteria(occup_type, era, tags)
+    )
+    if not candidates:
         raise cochar.error.NoneOccupationMeetsCriteria(
             f"None occupation meets following criteria: "
             f"type: {occup_type}, era: {era}, tags: {tags}"
         )
 
-    skill_points: int = max(filtered_skill_points_group)
-    candidates_for_occupation: List[str] = random.choice(
-        [
-            group
-            for group, points in zip(
-                filtered_occupation_groups, filtered_skill_points_group
-            )
-            if points == skill_points
-        ]
+    skill_points_groups: Tuple[int, ...] = (
+        education * 4,  # 1
+        education * 2 + power * 2,  # 2
+        education * 2 + dexterity * 2,  # 3
+        education * 2 + appearance * 2,  # 4
+        education * 2 + strength * 2,  # 5
+    )
+    points = [skill_points_groups[group_id] for group_id, _ in candidates]
+    skill_points: int = max(points)
+    candidates_for_occupation: Tuple[str, ...] = rng.choice(
+        [group for (_, group), p in zip(candidates, points) if p == skill_points]
+    )
+    return rng.choice(candidates_for_occupation)
+
+
+def _normalise_criteria(
+    occup_type: str, era: Union[str, List[str]], tags: List[str]
+) -> Tuple[str, Union[str, Tuple[str, ...]], FrozenSet[str]]:
+    """Return hashable version of occupation criteria.
+
+    Era provided as a string is kept as it is, because it's
+    matched with ``in`` operator, just like a list.
+
+    :param occup_type: type of occupation
+    :type occup_type: str
+    :param era: era or eras of occupation
+    :type era: Union[str, List[str]]
+    :param tags: occupation tags
+    :type tags: List[str]
+    :return: occupation type, era and tags
+    :rtype: Tuple[str, Union[str, Tuple[str, ...]], FrozenSet[str]]
+    """
+    if era and not isinstance(era, str):
+        era = tuple(sorted(set(era)))
+    return occup_type or None, era or None, frozenset(tags) if tags else None
+
+
+@functools.lru_cache(maxsize=256)
+def filter_occupation_groups(
+    occup_type: str = None,
+    era: Union[str, Tuple[str, ...]] = None,
+    tags: FrozenSet[str] = None,
+) -> Tuple[Tuple[str, ...], ...]:
+    """Return ``cochar.OCCUPATIONS_GROUPS`` with occupations
+    that meet the criteria. Groups are never removed, they can be
+    empty instead.
+
+    Results are cached, so arguments must be hashable.
+
+    :param occup_type: type of occupation, defaults to None
+    :type occup_type: str, optional
+    :param era: era or eras of occupation, defaults to None
+    :type era: Union[str, Tuple[str, ...]], optional
+    :param tags: tags that occupation must have, defaults to None
+    :type tags: FrozenSet[str], optional
+    :return: five groups of occupations
+    :rtype: Tuple[Tuple[str, ...], ...]
+
+    >>> filter_occupation_groups("custom")
+    (('software tester',), (), (), (), ())
+    """
+    mask = OCCUPATIONS_INDEX.query(occup_type, era, tags)
+    return tuple(
+        OCCUPATIONS_INDEX.occupations(mask & group)
+        for group in OCCUPATIONS_INDEX.groups
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def candidate_occupation_groups(
+    occup_type: str = None,
+    era: Union[str, Tuple[str, ...]] = None,
+    tags: FrozenSet[str] = None,
+) -> Tuple[Tuple[int, Tuple[str, ...]], ...]:
+    """Return non empty groups of :func:`filter_occupation_groups`,
+    each with its index in ``SKILL_POINTS_GROUPS``.
+
+    Results are cached, so arguments must be hashable.
+
+    :param occup_type: type of occupation, defaults to None
+    :type occup_type: str, optional
+    :param era: era or eras of occupation, defaults to None
+    :type era: Union[str, Tuple[str, ...]], optional
+    :param tags: tags that occupation must have, defaults to None
+    :type tags: FrozenSet[str], optional
+    :return: pairs of group index and occupations
+    :rtype: Tuple[Tuple[int, Tuple[str, ...]], ...]
+
+    >>> candidate_occupation_groups("custom")
+    ((0, ('software tester',)),)
+    """
+    return tuple(
+        (group_id, group)
+        for group_id, group in enumerate(
+            filter_occupation_groups(occup_type, era, tags)
+        )
+        if group
     )
-    return random.choice(candidates_for_occupation)
 
 
 def calc_occupation_points(
@@ -18,9 +18,24 @@ Skills module contains all functions related with skills
 and Skills object, which is a container for skills
 
 """
+import functools
+import itertools
 import random
+import threading
+from array import array
 from collections import UserDict
-from typing import Dict, List
+from collections.abc import Mapping, MutableMapping
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import cochar
 import cochar.error
@@ -54,18 +69,240 @@ class SkillsDict(UserDict):
         :raises SkillPointsBelowZero: when value is less than 0
         """
         key = str(key)
-        if not isinstance(value, int):
-            raise cochar.error.SkillValueNotAnInt(
-                f"Invalid {key.lower()} points. {key.capitalize()} points must be an integer"
-            )
-        if value < 0:
-            raise cochar.error.SkillPointsBelowZero(
-                f"{key.capitalize()} points cannot be less than 0"
-            )
+        _validate_skill_value(key, value)
         self.data[key] = value
 
 
+def _validate_skill_value(key: str, value: int) -> None:
+    if not isinstance(value, int):
+        raise cochar.error.SkillValueNotAnInt(
+            f"Invalid {key.lower()} points. {key.capitalize()} points must be an integer"
+        )
+    if value < 0:
+        raise cochar.error.SkillPointsBelowZero(
+            f"{key.capitalize()} points cannot be less than 0"
+        )
+
+
+# Skill names interned to one character codes shared by all ``SkillsArray``
+# instances, so ``str.find`` can look up a skill in a string of codes
+_SKILL_CODES: Dict[str, str] = {}
+_SKILL_NAMES: Dict[str, str] = {}
+_SKILL_CODES_LOCK = threading.Lock()
+# Never found in codes of a container, each code appears there at most once
+_MISSING_CODE = "\0\0"
+
+
+def _skill_code(skill: str) -> str:
+    """Return code of the skill, interning new skill names."""
+    code = _SKILL_CODES.get(skill)
+    if code is None:
+        with _SKILL_CODES_LOCK:
+            code = _SKILL_CODES.get(skill)
+            if code is None:
+                code = chr(len(_SKILL_CODES))
+                _SKILL_NAMES[code] = skill
+                _SKILL_CODES[skill] = code
+    return code
+
+
+class SkillsArray(MutableMapping):
+    """Compact skills container. Only skills the character has are stored,
+    as a string of interned one character skill codes in order of insertion
+    and a parallel array of 32 bit values.
+
+    Values are validated once, when they are set with ``skills[key] = value``
+    or ``update()``, like in :class:`SkillsDict`. Skills are iterated in
+    order of insertion, so ``get_json_format()`` returns the same dictionary,
+    key order included, as ``SkillsDict`` with the same content.
+    The generator writes values into the arrays without validation.
+
+    ``SkillsArray`` takes about a third of memory of ``SkillsDict``
+    and generating skills into it is about as fast. Reading a skill is
+    about 2 times slower, every lookup goes through Python level
+    ``__getitem__`` and a scan of the codes.
+
+    ``SkillsDict`` stays the default, pass an empty ``SkillsArray``
+    as ``skills`` to :meth:`SkillsGenerator.generate_skills`
+    or ``create_character()`` to generate skills into ``SkillsArray``.
+
+    :param skills: initial skills, defaults to ()
+    :type skills: Union[Mapping[str, int], Iterable[Tuple[str, int]]], optional
+
+    >>> skills = SkillsArray({"dodge": 40, "climb": 20})
+    >>> skills["climb"], list(skills)
+    (20, ['dodge', 'climb'])
+    >>> skills == SkillsDict({"dodge": 40, "climb": 20})
+    True
+    """
+
+    __slots__ = ("_codes", "_values")
+
+    def __init__(self, skills: Union[Mapping, Iterable[Tuple[str, int]]] = ()):
+        self._codes = ""
+        self._values = array("i")
+        self.update(skills)
+
+    def _position(self, key: str) -> int:
+        """Return position of the skill in the arrays, -1 if it's missing."""
+        return self._codes.find(_SKILL_CODES.get(key, _MISSING_CODE))
+
+    def __getitem__(self, key: str) -> int:
+        position = self._codes.find(_SKILL_CODES.get(key, _MISSING_CODE))
+        if position < 0:
+            raise KeyError(key)
+        return self._values[position]
+
+    def __setitem__(self, key: str, value: int) -> None:
+        key = str(key)
+        _validate_skill_value(key, value)
+        self._set(key, value)
+
+    def _set(self, key: str, value: int) -> None:
+        code = _skill_code(key)
+        position = self._codes.find(code)
+        if position < 0:
+            self._codes += code
+            self._values.append(value)
+        else:
+            self._values[position] = value
+
+    def _update_trusted(self, skills: Dict[str, int]) -> None:
+        """Set values without validation, for values produced by the generator."""
+        codes, values = self._codes, self._values
+        if not codes:
+            self._codes = "".join(
+                [_SKILL_CODES.get(key) or _skill_code(key) for key in skills]
+            )
+            self._values = array("i", skills.values())
+            return
+        new_codes = []
+        for key, value in skills.items():
+            code = _SKILL_CODES.get(key) or _skill_code(key)
+            position = codes.find(code)
+            if position < 0:
+                new_codes.append(code)
+                values.append(value)
+            else:
+                values[position] = value
+        self._codes = codes + "".join(new_codes)
+
+    def __delitem__(self, key: str) -> None:
+        position = self._position(key)
+        if position < 0:
+            raise KeyError(key)
+        self._codes = self._codes[:position] + self._codes[position + 1 :]
+        del self._values[position]
+
+    def __contains__(self, key: object) -> bool:
+        return self._position(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return map(_SKILL_NAMES.__getitem__, self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def get(self, key: str, default: int = None) -> int:
+        position = self._codes.find(_SKILL_CODES.get(key, _MISSING_CODE))
+        if position < 0:
+            return default
+        return self._values[position]
+
+    def copy(self) -> "SkillsArray":
+        """Return a copy of skills."""
+        skills = SkillsArray.__new__(SkillsArray)
+        skills._codes = self._codes
+        skills._values = array("i", self._values)
+        return skills
+
+    def get_json_format(self) -> Dict[str, int]:
+        """Return Skills as a dictionary"""
+        return dict(zip(map(_SKILL_NAMES.__getitem__, self._codes), self._values))
+
+    def __repr__(self) -> str:
+        return repr(self.get_json_format())
+
+
+class CategoryDraw(NamedTuple):
+    """Draw of ``k`` random skills from ``population``,
+    compiled from category option like ``"2l"`` or ``"firearms"``.
+    """
+
+    k: int
+    population: Tuple[str, ...]
+
+
+class ChoiceGroup(NamedTuple):
+    """Choice option from `occupations.json`, like
+    ``[2, "first aid", "mechanical repair", "1l"]``, with category
+    options already resolved to :class:`CategoryDraw`.
+    """
+
+    k: int
+    options: Tuple[Union[str, CategoryDraw], ...]
+
+    def draw(self, rng: random.Random = None) -> List[str]:
+        """Return ``k`` options, with drawn categories replaced
+        by skills drawn from them.
+
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :return: list of skills
+        :rtype: List[str]
+        """
+        rng = rng or random
+        picks = rng.sample(self.options, k=self.k)
+        result = [pick for pick in picks if isinstance(pick, str)]
+        for pick in picks:
+            if isinstance(pick, CategoryDraw):
+                result.extend(rng.sample(pick.population, k=pick.k))
+        return result
+
+
+class SkillPlan(NamedTuple):
+    """Skills list from `occupations.json` compiled into fixed skills,
+    choice options and category draws, so drawing skills for
+    a character is only sampling.
+    """
+
+    fixed: Tuple[str, ...]
+    choices: Tuple[ChoiceGroup, ...]
+    categories: Tuple[CategoryDraw, ...]
+
+    def draw(self, rng: random.Random = None) -> List[str]:
+        """Return list of skills: fixed skills, then skills from
+        choice options, then skills from categories.
+
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :return: list of skills
+        :rtype: List[str]
+        """
+        rng = rng or random
+        skills_list = list(self.fixed)
+        for choice_group in self.choices:
+            skills_list.extend(choice_group.draw(rng))
+        for category_draw in self.categories:
+            skills_list.extend(rng.sample(category_draw.population, k=category_draw.k))
+        return skills_list
+
+
 class SkillsGenerator:
+    """Generate character's skills from skills data of the interface.
+
+    Generator reads everything it needs from the interface and compiles
+    skill plans of all occupations on construction (or ``set_interface``).
+    Generating skills doesn't change the generator, so one instance can be
+    shared by many threads, as long as ``set_interface`` is not called
+    meanwhile. Later changes of the interface data, like a new version
+    read by :class:`cochar.interface.SkillsRedisInterface`, reach
+    the generator only when ``set_interface`` is called again.
+
+    :param interface: skills data interface
+    :type interface: cochar.interface.SkillsDataInterface
+    """
+
     def __init__(self, interface: cochar.interface.SkillsDataInterface):
         self.set_interface(interface)
 
@@ -75,6 +312,11 @@ class SkillsGenerator:
         self.skills_all = self.interface.get_all_skills_names()
         self.skills_basic = self.interface.get_basic_skills_names()
         self.skills_categories = self.interface.get_categories_names()
+        self._choice_groups: Dict[tuple, ChoiceGroup] = {}
+        self._skill_plans: Dict[str, SkillPlan] = {}
+        self.hobby_skill_plan = self._compile_skill_plan(self.skills_basic)
+        for occupation in cochar.OCCUPATIONS_DATA:
+            self.get_skill_plan(occupation)
 
     def generate_skills(
         self,
@@ -84,12 +326,17 @@ class SkillsGenerator:
         dexterity: int,
         education: int,
         skills: SkillsDict = None,
+        rng: random.Random = None,
     ) -> SkillsDict:
         """Return skills based on:
         occupation, occupation_points, hobby_points, dexterity and education
 
         If `skills` provided, return `skills`
 
+        Generated skills are returned in ``SkillsDict``, or in ``SkillsArray``
+        if `skills` is an empty ``SkillsArray``. Both hold the same values,
+        ``SkillsArray`` takes less memory but is slower to read.
+
         Each occupation has related skills, that are chosen randomly. Then
         each skill has randomly assigned skill level - number of points related
         with that skill.
@@ -107,22 +354,32 @@ class SkillsGenerator:
         :type dexterity: int
         :param education: education
         :type education: int
-        :param skills: skills, defaults to None
+        :param skills: skills, empty ``SkillsArray`` selects container
+            of generated skills, defaults to None
         :type skills: Skills, optional
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
         :return: skills with assigned skill level
         :rtype: Skills
         """
         if skills:
-            skills = SkillsDict(skills)
+            if isinstance(skills, SkillsArray):
+                skills = skills.copy()
+            else:
+                skills = SkillsDict(skills)
         else:
-            skills = SkillsDict()
+            # Empty SkillsArray selects container of generated skills
+            if isinstance(skills, SkillsArray):
+                skills = SkillsArray()
+            else:
+                skills = SkillsDict()
 
-            self.skills_data["dodge"] = dexterity // 2
-            self.skills_data["language (own)"] = education
+            # Character dependent default values
+            defaults = {"dodge": dexterity // 2, "language (own)": education}
 
             # Assigning points to credit rating
             credit_rating_points = generate_credit_rating_points(
-                occupation, occupation_points
+                occupation, occupation_points, rng=rng
             )
 
             occupation_points_to_distribute = occupation_points - credit_rating_points
@@ -130,167 +387,293 @@ class SkillsGenerator:
             if occupation_points_to_distribute < 0:
                 occupation_points_to_distribute = 0
 
-            default_occupations_skills: list = cochar.OCCUPATIONS_DATA[occupation][
-                "skills"
-            ].copy()
-            occupation_skills_list = self._get_skills_list(default_occupations_skills)
-
-            hobby_skills_list = self._get_skills_list(self.skills_basic)
+            occupation_skills_list = self.get_skill_plan(occupation).draw(rng)
+            hobby_skills_list = self.hobby_skill_plan.draw(rng)
 
             skills = self._assign_skill_points(
-                occupation_points, occupation_skills_list, skills
+                occupation_points,
+                occupation_skills_list,
+                skills,
+                rng=rng,
+                defaults=defaults,
+            )
+            skills = self._assign_skill_points(
+                hobby_points, hobby_skills_list, skills, rng=rng, defaults=defaults
             )
-            skills = self._assign_skill_points(hobby_points, hobby_skills_list, skills)
-            skills = self._filter_skills(skills)
+            skills = self._filter_skills(skills, defaults)
 
             skills.setdefault("credit rating", credit_rating_points)
 
         return skills
 
-    def _get_skills_list(self, input_list: list) -> List[str]:
-        """Parse an input list taken from `occupations.json` and
-        return list of skills
+    def get_skill_plan(self, occupation: str) -> SkillPlan:
+        """Return compiled skills list of the occupation.
+        Plans are compiled once per occupation and rebuilt
+        when the interface changes.
 
-        :param input_list: list of skills from `occupations.json`
-        :type input_list: list
-        :return: list of skills
-        :rtype: List[str]
+        :param occupation: occupation
+        :type occupation: str
+        :return: compiled skills list
+        :rtype: SkillPlan
         """
-        skills_list = []
-        skills_list += list(
-            filter(
-                lambda x: len(x) > 2
-                and isinstance(x, str)
-                and x not in self.skills_categories,
-                input_list,
+        skill_plan = self._skill_plans.get(occupation)
+        if skill_plan is None:
+            skill_plan = self._compile_skill_plan(
+                cochar.OCCUPATIONS_DATA[occupation]["skills"]
             )
-        )
-        skills_list += self._get_choice_skills(input_list)
-        skills_list += self._get_category_skills(input_list)
-        return skills_list
-
-    def _get_choice_skills(self, skills_list: list) -> List[str]:
-        """Parse a choice option from skills in `occupation.json` and
-        return list of skills
+            self._skill_plans[occupation] = skill_plan
+        return skill_plan
 
-        Example:
-        [1, "occult", "natural world"] -> ["occult"]
-        It means, return randomly one skills from the following options
+    def _compile_skill_plan(self, input_list: list) -> SkillPlan:
+        """Compile list of skills from `occupations.json`.
 
-        :param skills_list: list of skills to choose
-        :type skills_list: list
-        :return: list of skills
-        :rtype: List[str]
+        :param input_list: list of skills from `occupations.json`
+        :type input_list: list
+        :return: compiled skills list
+        :rtype: SkillPlan
         """
-        result = []
-        for item in skills_list:
+        fixed = []
+        choices = []
+        categories = []
+        for item in input_list:
             if isinstance(item, list):
-                population = item[1:]
-                k = item[0]
-                result.extend(random.sample(population, k=k))
-                result.extend(self._get_category_skills(result))
-                result = list(
-                    filter(
-                        lambda x: x not in self.interface.get_categories_names()
-                        and len(x) > 2,
-                        result,
-                    )
-                )
-
-        return result
-
-    def _get_category_skills(self, skills_list: list) -> List[str]:
-        """Parse a category skills, and return list of skills.
-
-        Example:
-        "1l" -> ["language (german)"]
-        It means, one random language from language group.
-        "2*" -> ["first aid", "listen"]
-        It means, two random skills of all available skills.
-
-        :param skills_list: list of category skill options
-        :type skills_list: list
-        :return: list of skills
-        :rtype: List[str]
+                choices.append(self._get_choice_group(item))
+                continue
+            category_draw = self._compile_category_option(item)
+            if category_draw is not None:
+                categories.append(category_draw)
+            elif len(item) > 2:
+                fixed.append(item)
+        return SkillPlan(tuple(fixed), tuple(choices), tuple(categories))
+
+    def _get_choice_group(self, item: list) -> ChoiceGroup:
+        """Return choice option compiled to :class:`ChoiceGroup`.
+        Compiled groups are cached.
+
+        :param item: choice option, like ``[1, "occult", "natural world"]``
+        :type item: list
+        :return: compiled choice option
+        :rtype: ChoiceGroup
         """
-        result = []
-        for item in skills_list:
-            if len(item) == 2 and isinstance(item, str):
-                k = int(item[0])
-                if item[1] == "*":
-                    population = self.skills_basic
-                else:
-                    population = self.interface.get_skills_from_category(
-                        cochar.utils.TRANSLATION_DICT.get(item[1])
-                    )
-                result.extend(random.sample(population, k=k))
-
-            elif item in self.skills_categories:
-                population = self.interface.get_skills_from_category(item)
-                result.extend([random.choice(population)])
-
-        return result
+        key = tuple(item)
+        choice_group = self._choice_groups.get(key)
+        if choice_group is None:
+            options = []
+            for option in item[1:]:
+                category_draw = self._compile_category_option(option)
+                options.append(option if category_draw is None else category_draw)
+            choice_group = ChoiceGroup(item[0], tuple(options))
+            self._choice_groups[key] = choice_group
+        return choice_group
+
+    def _compile_category_option(self, option: str) -> Optional[CategoryDraw]:
+        """Return :class:`CategoryDraw` for category option, like
+        ``"1l"``, ``"2*"`` or ``"firearms"``, None for a plain skill.
+
+        :param option: option from `occupations.json`
+        :type option: str
+        :return: compiled category option or None
+        :rtype: Optional[CategoryDraw]
+        """
+        if len(option) == 2:
+            if option[1] == "*":
+                population = self.skills_basic
+            else:
+                population = self.interface.get_skills_from_category(
+                    cochar.utils.TRANSLATION_DICT.get(option[1])
+                )
+            return CategoryDraw(int(option[0]), tuple(population))
+        if option in self.skills_categories:
+            return CategoryDraw(
+                1, tuple(self.interface.get_skills_from_category(option))
+            )
+        return None
 
     def _assign_skill_points(
-        self, points: int, skills_list: list, skills: SkillsDict
+        self,
+        points: int,
+        skills_list: list,
+        skills: SkillsDict,
+        rng: random.Random = None,
+        defaults: Dict[str, int] = None,
     ) -> SkillsDict:
         """Allocate randomly points to the skills from skills_list
         and store it in Skills object
 
+        Points are split with a Dirichlet draw over unique skills
+        (a skill listed twice gets twice the weight), clamped to
+        the headroom of each skill below ``cochar.MAX_SKILL_LEVEL``.
+        Points clamped away are split again between skills that still
+        have headroom. Every round but the last one fills up at least
+        one skill, so there are at most ``len(skills_list) + 1`` rounds.
+        If there is less headroom than points, all skills are filled up
+        and the rest of points is lost.
+
         :param points: points to allocate
         :type points: int
         :param skills_list: list of skills
         :type skills_list: list
         :param skills: Skills object
         :type skills: Skills
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :param defaults: default values of skills that override ``skills_data``, defaults to None
+        :type defaults: Dict[str, int], optional
         :return: None
         :rtype: None
         """
+        rng = rng or random
+        # Read plain dict, validation is needed only for writes
+        current = skills.data if isinstance(skills, UserDict) else skills
+        multiplicity: Dict[str, int] = {}
+        values: Dict[str, int] = {}
         for skill in skills_list:
-            if skill in self.skills_all:
-                skills.setdefault(skill, self.skills_data[skill])
+            if skill in multiplicity:
+                multiplicity[skill] += 1
+                continue
+            multiplicity[skill] = 1
+            value = current.get(skill)
+            if value is not None:
+                values[skill] = value
+            elif defaults and skill in defaults:
+                values[skill] = defaults[skill]
+            elif skill in self.skills_all:
+                values[skill] = self.skills_data[skill]
             else:
-                skills.setdefault(skill, 1)
+                values[skill] = 1
+
+        while points > 0:
+            headroom = {
+                skill: cochar.MAX_SKILL_LEVEL - value
+                for skill, value in values.items()
+                if value < cochar.MAX_SKILL_LEVEL
+            }
+            if sum(headroom.values()) <= points:
+                for skill in headroom:
+                    values[skill] = cochar.MAX_SKILL_LEVEL
+                break
 
-        while points:
-            skill = random.choice(skills_list)
-            if points <= cochar.MAX_SKILL_LEVEL - skills[skill]:
-                points_allocation = random.randint(0, points)
-            elif sum(list(skills.values())) % 90 == 0:
+            shares = {
+                skill: rng.expovariate(1)
+                if multiplicity[skill] == 1
+                else rng.gammavariate(multiplicity[skill], 1)
+                for skill in headroom
+            }
+            scale = points / sum(shares.values())
+            filled_up = False
+            for skill, share in shares.items():
+                share *= scale
+                points_allocation = int(share)
+                if points_allocation >= headroom[skill]:
+                    points_allocation = headroom[skill]
+                    filled_up = True
+                values[skill] += points_allocation
+                points -= points_allocation
+                shares[skill] = share - points_allocation
+
+            if not filled_up:
+                # Only rounding remainder is left. It's smaller than number
+                # of skills and each skill has at least one point of headroom,
+                # so it goes to skills with the largest fractional shares.
+                for skill in sorted(shares, key=shares.get, reverse=True)[:points]:
+                    values[skill] += 1
                 break
-            elif skills[skill] >= cochar.MAX_SKILL_LEVEL:
-                continue
-            else:
-                points_allocation = random.randint(
-                    0, cochar.MAX_SKILL_LEVEL - skills[skill]
-                )
-            skills[skill] += points_allocation
-            points -= points_allocation
+
+        if isinstance(skills, SkillsArray):
+            # Generated values are trusted, write them into the arrays
+            skills._update_trusted(values)
+        else:
+            skills.update(
+                {
+                    skill: value
+                    for skill, value in values.items()
+                    if current.get(skill) != value
+                }
+            )
 
         return skills
 
-    def _filter_skills(self, skills: Dict) -> SkillsDict:
+    def _filter_skills(
+        self, skills: Dict, defaults: Dict[str, int] = None
+    ) -> SkillsDict:
         """Filter out all skills with basic value form given dict.
 
+        ``defaults`` override default values from ``skills_data``.
+
         >>> example_dict = {'psychoanalysis': 1, 'language (spanish)': 66}
         >>> SkillsGenerator(skills_interface)._filter_skills(example_dict)
         {'language (spanish)': 66}
         """
+        defaults = defaults or {}
 
         def has_skill_default_value(item) -> bool:
             skill, value = item
-            default_value = self.skills_data.get(skill)
+            default_value = defaults.get(skill, self.skills_data.get(skill))
             if default_value is not None:
                 return default_value != value
 
             return False
 
-        skills = filter(has_skill_default_value, skills.items())
+        if isinstance(skills, SkillsArray):
+            result = SkillsArray()
+            result._update_trusted(
+                dict(filter(has_skill_default_value, skills.get_json_format().items()))
+            )
+            return result
+        return SkillsDict(filter(has_skill_default_value, skills.items()))
+
+
+DEFAULT_ERA: FrozenSet[str] = frozenset({"classic-1920", "modern"})
 
-        return SkillsDict(skills)
+# Generators by skills database and era, oldest first
+_GENERATORS: Dict[Tuple[str, FrozenSet[str]], SkillsGenerator] = {}
+_GENERATORS_LOCK = threading.Lock()
+_MAX_GENERATORS = 16
 
 
-def generate_credit_rating_points(occupation: str, occupation_points: int) -> int:
+def get_generator(era: Union[str, Iterable[str]] = None) -> SkillsGenerator:
+    """Return skills generator for the era.
+
+    One interface and one generator are built for each era set
+    and kept in a bounded cache, the oldest one is dropped first.
+    Cache hits don't take a lock. Generators don't change when
+    generating skills, so the returned instance can be shared,
+    also between threads.
+
+    :param era: era or eras of skills, defaults to "classic-1920" and "modern"
+    :type era: Union[str, Iterable[str]], optional
+    :return: skills generator
+    :rtype: SkillsGenerator
+
+    >>> get_generator(["modern", "classic-1920"]) is get_generator()
+    True
+    """
+    if not era:
+        era = DEFAULT_ERA
+    elif isinstance(era, str):
+        era = frozenset({era})
+    else:
+        era = frozenset(era)
+
+    key = (str(cochar.SKILLS_DATABASE), era)
+    generator = _GENERATORS.get(key)
+    if generator is not None:
+        return generator
+
+    with _GENERATORS_LOCK:
+        # Another thread may have built the generator meanwhile
+        generator = _GENERATORS.get(key)
+        if generator is None:
+            generator = SkillsGenerator(cochar.interface.SkillsJSONInterface(*key))
+            if len(_GENERATORS) >= _MAX_GENERATORS:
+                del _GENERATORS[next(iter(_GENERATORS))]
+            _GENERATORS[key] = generator
+        return generator
+
+
+def generate_credit_rating_points(
+    occupation: str, occupation_points: int, rng: random.Random = None
+) -> int:
     """For provided occupation, and it occupation points, return
     credit rating points.
 
@@ -298,6 +681,8 @@ def generate_credit_rating_points(occupation: str, occupation_points: int) -> in
     :type occupation: str
     :param occupation_points: occupation points
     :type occupation_points: int
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
     :return: credit rating points
     :rtype: int
     """
@@ -306,7 +691,7 @@ def generate_credit_rating_points(occupation: str, occupation_points: int) -> in
         credit_rating_range = [0, occupation_points]
     if occupation_points < max(credit_rating_range):
         credit_rating_range[1] = occupation_points
-    return random.randint(*credit_rating_range)
+    return (rng or random).randint(*credit_rating_range)
 
 
 def calc_skill_points(
@@ -344,17 +729,15 @@ def calc_skill_points(
         education * 2 + appearance * 2,  # 4
         education * 2 + strength * 2,  # 5
     )
-    group_index = [
-        index
-        for index, group in enumerate(cochar.OCCUPATIONS_GROUPS)
-        if occupation in group
-    ]
+    group_index = cochar.OCCUPATIONS_GROUPS_INDEX.get(occupation, ())
     points = [skill_points_groups[i] for i in group_index]
 
     return max(points)
 
 
-def skill_test(tested_value: int, repetition: int = 1) -> int:
+def skill_test(
+    tested_value: int, repetition: int = 1, rng: random.Random = None
+) -> int:
     """Perform skill test.
 
     Works like improvement test. Roll number between 1 to 100,
@@ -371,11 +754,57 @@ def skill_test(tested_value: int, repetition: int = 1) -> int:
     :type tested_value: int
     :param repetition: how many test to perform
     :type repetition: int
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
     :return: unchanged, or increased tested value
     :rtype: int
     """
+    rng = rng or random
     for _ in range(repetition):
-        test = random.randint(1, 100)
+        test = rng.randint(1, 100)
         if test > tested_value or test > 95:
-            tested_value += random.randint(1, 10)
+            tested_value += rng.randint(1, 10)
     return tested_value
+
+
+@functools.lru_cache(maxsize=4096)
+def skill_test_distribution(
+    tested_value: int, repetition: int
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Return exact distribution of :func:`skill_test` outcomes.
+
+    Tables are computed on first use and cached.
+
+    :param tested_value: tested value
+    :type tested_value: int
+    :param repetition: how many test to perform
+    :type repetition: int
+    :return: (outcomes, cumulative weights)
+    :rtype: Tuple[Tuple[int, ...], Tuple[int, ...]]
+    """
+    distribution = cochar.utils.improvement_test_distribution(
+        tested_value, repetition, lambda value: min(max(100 - value, 5), 100)
+    )
+    return tuple(distribution), tuple(itertools.accumulate(distribution.values()))
+
+
+def skill_test_from_table(
+    tested_value: int, repetition: int = 1, rng: random.Random = None
+) -> int:
+    """Perform skill test with a single draw.
+
+    Gives the same results as :func:`skill_test`, but draws the final
+    value from :func:`skill_test_distribution` instead of simulating
+    each round.
+
+    :param tested_value: tested value
+    :type tested_value: int
+    :param repetition: how many test to perform
+    :type repetition: int
+    :param rng: random number generator, defaults to ``random`` module
+    :type rng: random.Random, optional
+    :return: unchanged, or increased tested value
+    :rtype: int
+    """
+    values, cum_weights = skill_test_distribution(tested_value, repetition)
+    return (rng or random).choices(values, cum_weights=cum_weights)[0]
@@ -31,8 +31,10 @@
 - *: any
 
 """
+import random
 from bisect import bisect_left
-from typing import Dict, Tuple, Sequence
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple, Sequence
 
 TRANSLATION_DICT: Dict[str, str] = {
     "a": "art/craft",
@@ -104,6 +106,117 @@ def narrowed_bisect(a: Sequence[int], x: int) -> int:
     return i if i != len(a) else i - 1
 
 
+class AliasTable:
+    """Walker's alias table for drawing indexes from a discrete
+    distribution in constant time.
+
+    Table is built once with Vose's algorithm in O(n). Each draw
+    costs one random number, regardless of the number of weights.
+
+    :param weights: non negative weights, at least one must be positive
+    :type weights: Sequence[float]
+    :raises ValueError: when weights are empty or sum up to zero
+
+    >>> table = AliasTable([1, 0, 3])
+    >>> table.sample() in (0, 2)
+    True
+    """
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        total = sum(weights)
+        if n == 0 or total <= 0:
+            raise ValueError(f"weights must contain positive values: {weights}")
+
+        scaled = [weight * n / total for weight in weights]
+        self.probabilities: List[float] = [1.0] * n
+        self.aliases: List[int] = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+    def __len__(self) -> int:
+        return len(self.probabilities)
+
+    def sample(self, rng: random.Random = None) -> int:
+        """Return random index.
+
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :return: index of drawn weight
+        :rtype: int
+        """
+        rng = rng or random
+        u = rng.random() * len(self.probabilities)
+        i = int(u)
+        return i if u - i < self.probabilities[i] else self.aliases[i]
+
+    def sample_many(self, k: int, rng: random.Random = None) -> List[int]:
+        """Return `k` random indexes.
+
+        :param k: number of indexes to draw
+        :type k: int
+        :param rng: random number generator, defaults to ``random`` module
+        :type rng: random.Random, optional
+        :return: indexes of drawn weights
+        :rtype: List[int]
+        """
+        rng = rng or random
+        n = len(self.probabilities)
+        probabilities = self.probabilities
+        aliases = self.aliases
+        result = []
+        for u in (rng.random() * n for _ in range(k)):
+            i = int(u)
+            result.append(i if u - i < probabilities[i] else aliases[i])
+        return result
+
+
+def improvement_test_distribution(
+    tested_value: int, repetition: int, success_count: Callable[[int], int]
+) -> Dict[int, int]:
+    """Return exact distribution of improvement test outcomes.
+
+    Each round rolls 1D100, if the roll succeeds, tested value
+    is increased by 1D10. Instead of simulating rounds, probabilities
+    of all outcomes are counted. Weights are integers that sum up to
+    ``1000 ** repetition`` (100 sides of D100 times 10 sides of D10).
+
+    :param tested_value: tested value
+    :type tested_value: int
+    :param repetition: how many test to perform
+    :type repetition: int
+    :param success_count: number of D100 results (out of 100) that improve the value
+    :type success_count: Callable[[int], int]
+    :return: weights of outcomes, sorted by outcome
+    :rtype: Dict[int, int]
+
+    >>> improvement_test_distribution(98, 1, lambda value: 100 - value)
+    {98: 980, 99: 2, 100: 2, 101: 2, 102: 2, 103: 2, 104: 2, 105: 2, 106: 2, 107: 2, 108: 2}
+    """
+    distribution = {tested_value: 1}
+    for _ in range(repetition):
+        next_distribution = defaultdict(int)
+        for value, weight in distribution.items():
+            success = success_count(value)
+            if success < 100:
+                next_distribution[value] += weight * (100 - success) * 10
+            if success > 0:
+                for increase in range(1, 11):
+                    next_distribution[value + increase] += weight * success
+        distribution = next_distribution
+    return dict(sorted(distribution.items()))
+
+
 def is_skill_valid(skill_value: int) -> bool:
     """Check if skill value is int type and it is not
     below 0.
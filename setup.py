@@ -44,5 +44,6 @@ setup(
     packages=["cochar"],
     include_package_data=True,
     install_requires=["rname"],
+    extras_require={"batch": ["numpy"], "redis": ["redis"]},
     entry_points={"console_scripts": ["cochar=cochar.__main__:main"]},
 )
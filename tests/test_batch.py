@@ -0,0 +1,423 @@
+import random
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import cochar
+import cochar.batch
+import cochar.error
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(1925)
+
+
+@pytest.mark.parametrize(
+    "ages,result",
+    [
+        ([15, 19, 20, 39, 40, 85, 90, 99], [0, 0, 1, 1, 2, 6, 6, 6]),
+    ],
+)
+def test_age_modifiers_index(ages, result):
+    assert cochar.batch.age_modifiers_index(np.array(ages)).tolist() == result
+    assert result == [
+        cochar.utils.narrowed_bisect(cochar.MODIFIERS["age_range"], age) for age in ages
+    ]
+
+
+def test_generate_base_characteristics(rng):
+    ages = np.array(cochar.sample_ages(1925, "M", 10000))
+    c = cochar.batch.generate_base_characteristics(ages, rng)
+    assert c.dtype.names == cochar.batch.CHARACTERISTICS
+    assert len(c) == len(ages)
+    assert c["strength"].min() >= 1 and c["strength"].max() <= 90
+    assert c["condition"].min() >= 1 and c["condition"].max() <= 90
+    assert c["size"].min() >= 40 and c["size"].max() <= 90
+    assert c["dexterity"].min() >= 1 and c["dexterity"].max() <= 90
+    assert c["appearance"].min() >= 1 and c["appearance"].max() <= 90
+    assert c["education"].min() >= 40 and c["education"].max() <= 99
+    assert c["intelligence"].min() >= 40 and c["intelligence"].max() <= 90
+    assert c["power"].min() >= 15 and c["power"].max() <= 90
+    assert c["luck"].min() >= 15 and c["luck"].max() <= 90
+    assert set(np.unique(c["move_rate"])).issubset(range(2, 10))
+
+
+def test_generate_base_characteristics_seed():
+    ages = np.array([20, 45, 85])
+    first = cochar.batch.generate_base_characteristics(ages, rng=7)
+    second = cochar.batch.generate_base_characteristics(ages, rng=7)
+    assert (first == second).all()
+
+
+@pytest.mark.parametrize(
+    "strength,condition,dexterity,subtract_points,result",
+    [
+        (1, 1, 1, 3, (1, 1, 1)),
+        (2, 2, 2, 3, (1, 1, 1)),
+        (2, 2, 2, 9, (1, 1, 1)),
+        (50, 50, 50, 0, (50, 50, 50)),
+        (10, 1, 1, 5, (5, 1, 1)),
+    ],
+)
+def test_subtract_points_from_str_con_dex(
+    strength, condition, dexterity, subtract_points, result, rng
+):
+    values = cochar.batch.subtract_points_from_str_con_dex(
+        np.array([strength]),
+        np.array([condition]),
+        np.array([dexterity]),
+        np.array([subtract_points]),
+        rng,
+    )
+    assert tuple(int(v[0]) for v in values) == result
+
+
+def test_subtract_points_from_str_con_dex_total(rng):
+    n = 1000
+    strength, condition, dexterity = rng.integers(15, 91, (3, n))
+    points = rng.choice(cochar.MODIFIERS["mod_char_points"], n)
+    result = cochar.batch.subtract_points_from_str_con_dex(
+        strength, condition, dexterity, points, rng
+    )
+    before = strength + condition + dexterity
+    after = sum(result)
+    assert (np.minimum(before - 3, points) == before - after).all()
+    assert min(r.min() for r in result) >= 1
+
+
+def test_subtract_points_from_str_con_dex_distribution(rng):
+    n = 20000
+    result = cochar.batch.subtract_points_from_str_con_dex(
+        np.full(n, 16), np.full(n, 20), np.full(n, 60), np.full(n, 40), rng
+    )
+    py_rng = random.Random(40)
+    expected = np.array(
+        [
+            cochar.subtract_points_from_str_con_dex(16, 20, 60, 40, py_rng)
+            for _ in range(n)
+        ]
+    )
+    for i in range(3):
+        assert abs(result[i].mean() - expected[:, i].mean()) < 0.3
+        assert abs((result[i] == 1).mean() - (expected[:, i] == 1).mean()) < 0.02
+
+
+@pytest.mark.parametrize(
+    "n,available",
+    [
+        ([10], [[True, True, True]]),
+        ([10], [[False, True, False]]),
+        ([7, 0], [[True, False, True], [True, True, True]]),
+    ],
+)
+def test_uniform_multinomial(n, available, rng):
+    available = np.array(available)
+    result = cochar.batch.uniform_multinomial(np.array(n), available, rng)
+    assert result.sum(axis=1).tolist() == n
+    assert (result[~available] == 0).all()
+
+
+@pytest.mark.parametrize(
+    "tested_value,repetition,low,high",
+    [
+        (0, 0, 0, 0),
+        (50, 0, 50, 50),
+        (98, 1, 98, 99),
+        (99, 4, 99, 99),
+        (40, 4, 40, 80),
+    ],
+)
+def test_characteristic_test(tested_value, repetition, low, high, rng):
+    result = cochar.batch.characteristic_test(
+        np.full(100, tested_value), repetition, rng
+    )
+    assert result.min() >= low and result.max() <= high
+
+
+def test_characteristic_test_distribution(rng):
+    n = 50000
+    result = cochar.batch.characteristic_test(np.full(n, 98), 1, rng)
+    assert set(np.unique(result)) <= {98, 99}
+    assert abs((result == 99).mean() - 0.02) < 0.005
+
+
+def test_characteristic_test_mixed_pairs(rng):
+    tested_value = np.array([10, 99, 50, 10, 0])
+    repetition = np.array([0, 4, 0, 0, 0])
+    result = cochar.batch.characteristic_test(tested_value, repetition, rng)
+    assert result.tolist() == [10, 99, 50, 10, 0]
+
+
+def test_skill_test(rng):
+    n = 50000
+    result = cochar.batch.skill_test(np.full(n, 96), 1, rng)
+    assert result.min() >= 96 and result.max() <= 106
+    assert abs((result > 96).mean() - 0.05) < 0.01
+    assert len(cochar.batch.skill_test(np.array([], dtype=int), 1, rng)) == 0
+
+
+@pytest.mark.parametrize(
+    "strength,dexterity,size,result",
+    [
+        (0, 1, 1, 8),
+        (1, 0, 1, 8),
+        (0, 0, 1, 7),
+        (1, 1, 0, 9),
+        (1, 1, 1, 9),
+    ],
+)
+def test_calc_move_rate(strength, dexterity, size, result):
+    move_rate = cochar.batch.calc_move_rate(
+        np.array([strength]), np.array([dexterity]), np.array([size])
+    )
+    assert move_rate.tolist() == [result]
+
+
+def test_candidate_skills():
+    generator = cochar.SKILLS_GENERATOR
+    names, ids, base_values, multiplicity = cochar.batch.candidate_skills(
+        generator, [["history", "occult", "history"], ["unknown skill"], []]
+    )
+    assert names == ("history", "occult", "unknown skill")
+    assert ids.tolist() == [[0, 1], [2, -1], [-1, -1]]
+    assert multiplicity.tolist() == [[2, 1], [1, 0], [0, 0]]
+    assert base_values.tolist() == [
+        [generator.skills_data["history"], generator.skills_data["occult"]],
+        [1, 0],
+        [0, 0],
+    ]
+
+
+def test_candidate_skills_character_defaults():
+    generator = cochar.SKILLS_GENERATOR
+    names, ids, base_values, _ = cochar.batch.candidate_skills(
+        generator,
+        [["dodge", "history"], ["language (own)", "dodge"], ["history"]],
+        dexterity=np.array([41, 60, 70]),
+        education=np.array([50, 75, 80]),
+    )
+    assert names == ("dodge", "history", "language (own)")
+    assert base_values.tolist() == [
+        [20, generator.skills_data["history"]],
+        [75, 30],
+        [generator.skills_data["history"], 0],
+    ]
+
+    scalar = generator._assign_skill_points(
+        0,
+        ["language (own)", "dodge"],
+        {},
+        defaults={"dodge": 60 // 2, "language (own)": 75},
+    )
+    assert list(scalar.values()) == base_values[1].tolist()
+
+
+@pytest.mark.parametrize("points", [0, 1, 13, 100, 250, 1000])
+def test_allocate_skill_points(points, rng):
+    generator = cochar.SKILLS_GENERATOR
+    skills_lists = [
+        generator.get_skill_plan(occupation).draw(random.Random(i))
+        for i, occupation in enumerate(cochar.OCCUPATIONS_LIST)
+    ] + [generator.hobby_skill_plan.draw(random.Random(0)), []]
+    _, _, base_values, multiplicity = cochar.batch.candidate_skills(
+        generator, skills_lists
+    )
+    base_values[0, 0] = 95
+
+    values = cochar.batch.allocate_skill_points(
+        base_values, multiplicity, points, rng, chunk_size=10
+    )
+    headroom = np.where(
+        multiplicity > 0, np.maximum(cochar.MAX_SKILL_LEVEL - base_values, 0), 0
+    )
+    assert (
+        (values - base_values).sum(axis=1) == np.minimum(points, headroom.sum(1))
+    ).all()
+    assert (values >= base_values).all()
+    assert (values - base_values <= headroom).all()
+    assert values[0, 0] == 95
+
+
+def test_allocate_skill_points_distribution(rng):
+    n = 20000
+    base_values = np.tile([10, 10, 10, 0], (n, 1))
+    multiplicity = np.tile([1, 1, 2, 0], (n, 1))
+    values = cochar.batch.allocate_skill_points(base_values, multiplicity, 60, rng)
+    mean = (values - base_values).mean(axis=0)
+    assert np.allclose(mean, [15, 15, 30, 0], atol=0.5)
+
+    scalar_rng = random.Random(1)
+    generator = cochar.SKILLS_GENERATOR
+    scalar = [
+        generator._assign_skill_points(
+            60, ["a", "b", "c", "c"], {"a": 10, "b": 10, "c": 10}, rng=scalar_rng
+        )["c"]
+        - 10
+        for _ in range(5000)
+    ]
+    assert abs(sum(scalar) / len(scalar) - mean[2]) < 1
+
+
+def scalar_generate_skills(generator, occupation_skills, hobby_skills, points, n, rng):
+    occupation_plan = generator._compile_skill_plan(occupation_skills)
+    hobby_plan = generator._compile_skill_plan(hobby_skills)
+    with patch.object(
+        generator, "get_skill_plan", return_value=occupation_plan
+    ), patch.object(generator, "hobby_skill_plan", hobby_plan):
+        skills = [
+            generator.generate_skills("professor", *points, 60, 70, rng=rng)
+            for _ in range(n)
+        ]
+    for character_skills in skills:
+        del character_skills["credit rating"]
+    return skills
+
+
+def batch_generate_skills(generator, occupation_skills, hobby_skills, points, n, rng):
+    names, ids, base_values, values = cochar.batch.generate_skills(
+        generator,
+        [occupation_skills] * n,
+        [hobby_skills] * n,
+        np.full(n, points[0]),
+        np.full(n, points[1]),
+        dexterity=np.full(n, 60),
+        education=np.full(n, 70),
+        rng=rng,
+    )
+    return [
+        {
+            names[skill_id]: value
+            for skill_id, base_value, value in zip(*row)
+            if value != base_value
+        }
+        for row in zip(ids.tolist(), base_values.tolist(), values.tolist())
+    ]
+
+
+def test_generate_skills_fills_occupation_first(rng):
+    generator = cochar.SKILLS_GENERATOR
+    occupation_skills = ["history", "dodge"]
+    hobby_skills = ["dodge", "occult"]
+    scalar = scalar_generate_skills(
+        generator, occupation_skills, hobby_skills, (500, 20), 1, random.Random(1)
+    )
+    batch = batch_generate_skills(
+        generator, occupation_skills, hobby_skills, (500, 20), 3, rng
+    )
+    expected = {
+        "history": cochar.MAX_SKILL_LEVEL,
+        "dodge": cochar.MAX_SKILL_LEVEL,
+        "occult": generator.skills_data["occult"] + 20,
+    }
+    assert scalar == [expected]
+    assert batch == [expected] * 3
+
+
+def test_generate_skills_matches_scalar(rng):
+    generator = cochar.SKILLS_GENERATOR
+    occupation_skills = ["history", "occult", "dodge", "language (own)"]
+    hobby_skills = ["dodge", "history", "library use"]
+    scalar = scalar_generate_skills(
+        generator, occupation_skills, hobby_skills, (150, 100), 4000, random.Random(1)
+    )
+    batch = batch_generate_skills(
+        generator, occupation_skills, hobby_skills, (150, 100), 20000, rng
+    )
+
+    base_values = {"dodge": 30, "language (own)": 70}
+    for skill in set(occupation_skills + hobby_skills):
+        base_value = base_values.get(skill, generator.skills_data[skill])
+        scalar_mean = np.mean([skills.get(skill, base_value) for skills in scalar])
+        batch_mean = np.mean([skills.get(skill, base_value) for skills in batch])
+        assert abs(scalar_mean - batch_mean) < 1.5, skill
+
+
+def test_generate_skills_lists_length():
+    with pytest.raises(ValueError):
+        cochar.batch.generate_skills(
+            cochar.SKILLS_GENERATOR, [["history"]], [], [10], [10]
+        )
+
+
+@pytest.fixture
+def characters():
+    return cochar.create_characters(100, 1925, "US", seed=1)
+
+
+def test_character_batch_rows(characters):
+    batch = cochar.batch.CharacterBatch.from_characters(characters)
+    assert len(batch) == len(characters)
+    assert list(batch) == characters
+    assert batch[-1] == characters[-1]
+    assert list(batch[3].skills.items()) == list(characters[3].skills.items())
+    with pytest.raises(IndexError):
+        batch[len(characters)]
+
+
+def test_character_batch_encoding(characters):
+    batch = cochar.batch.CharacterBatch.from_characters(characters)
+    assert batch.columns["age"].dtype == np.int16
+    assert batch.columns["occupation"].dtype == np.int32
+    assert len(batch.categories["country"]) == 1
+    assert batch.skills_indptr[-1] == sum(len(c.skills) for c in characters)
+
+
+def test_character_batch_to_dict_of_columns(characters):
+    columns = cochar.batch.CharacterBatch.from_characters(
+        characters
+    ).to_dict_of_columns()
+    for i, character in enumerate(characters):
+        row = character.get_json_format()
+        skills = row.pop("skills")
+        assert {key: columns[key][i] for key in row} == row
+        assert {
+            key[len("skills.") :]: columns[key][i]
+            for key in columns
+            if key.startswith("skills.") and columns[key][i] >= 0
+        } == skills
+
+
+def test_character_batch_to_records(characters):
+    batch = cochar.batch.CharacterBatch.from_characters(characters)
+    records = batch.to_records()
+    assert len(records) == len(characters)
+    assert records["occupation"][5] == characters[5].occupation
+    assert (records["skills.dodge"] == batch.to_dict_of_columns()["skills.dodge"]).all()
+
+
+def test_character_batch_empty():
+    batch = cochar.batch.CharacterBatch.from_characters([])
+    assert len(batch) == 0
+    assert list(batch) == []
+    assert len(batch.to_records()) == 0
+
+
+@pytest.mark.parametrize(
+    "column,value",
+    [
+        ("strength", 32768),
+        ("hit_points", 50000),
+        ("dodge", 10**20),
+        ("skills", 40000),
+    ],
+)
+def test_character_batch_value_not_in_range(characters, column, value):
+    if column == "skills":
+        characters[3].skills["history"] = value
+    else:
+        setattr(characters[3], column, value)
+    with pytest.raises(cochar.error.BatchValueNotInRange) as error:
+        cochar.batch.CharacterBatch.from_characters(characters)
+    assert error.value.column == column
+    assert error.value.value == value
+
+
+def test_character_batch_int16_limits(characters):
+    characters[3].strength = 32767
+    characters[3].skills["history"] = 32767
+    batch = cochar.batch.CharacterBatch.from_characters(characters)
+    assert batch[3].strength == 32767
+    assert batch.skills(3)["history"] == 32767
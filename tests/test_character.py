@@ -2,6 +2,7 @@ import pytest
 
 import cochar
 import cochar.character
+import cochar.error
 
 
 @pytest.fixture
@@ -93,3 +94,58 @@ def test_get_json_format(example_characters_json):
     for character in example_characters_json:
         c = cochar.character.Character(**character)
         assert character == c.get_json_format()
+
+
+def test_compact_character_round_trip(example_characters_json):
+    for character in example_characters_json:
+        c = cochar.character.Character(**character)
+        compact = cochar.character.CompactCharacter.from_character(c)
+        assert compact.to_character() == c
+        assert list(compact.to_character().skills.items()) == list(c.skills.items())
+        assert compact.get_json_format() == character
+        assert compact.occupation == character["occupation"]
+        assert compact.dodge == character["dodge"]
+
+
+def test_compact_character_generated():
+    characters = cochar.create_characters(50, 1925, "US", seed=1)
+    compact = [cochar.character.CompactCharacter.from_character(c) for c in characters]
+    assert [c.to_character() for c in compact] == characters
+    assert compact[0] == cochar.character.CompactCharacter.from_character(characters[0])
+
+
+def test_compact_character_is_read_only(example_characters_json):
+    compact = cochar.character.CompactCharacter.from_character(
+        cochar.character.Character(**example_characters_json[0])
+    )
+    with pytest.raises(AttributeError):
+        compact.age = 30
+    with pytest.raises(AttributeError):
+        compact.nickname = "Oz"
+
+
+def test_symbol_table():
+    table = cochar.character.SymbolTable()
+    assert [table.id(value) for value in ("US", "farmer", "US", 0, "0")] == [
+        0,
+        1,
+        0,
+        2,
+        3,
+    ]
+    assert table.value(3) == "0"
+    assert len(table) == 4
+
+
+def test_from_trusted_equals_validated(example_characters_json):
+    for character in example_characters_json:
+        trusted = cochar.character.Character._from_trusted(**character)
+        assert trusted == cochar.character.Character(**character)
+        assert list(trusted.get_json_format()) == list(character)
+
+
+def test_create_character_validates_user_input():
+    with pytest.raises(cochar.error.InvalidCountryValue):
+        cochar.create_character(1925, "XX")
+    with pytest.raises(cochar.error.AgeNotInRange):
+        cochar.create_character(1925, "US", age=cochar.MAX_AGE + 1)
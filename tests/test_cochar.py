@@ -1,9 +1,11 @@
+import random
 import unittest
 from unittest.mock import patch
 
 import pytest
 
 import cochar
+import cochar.character
 import cochar.error
 import cochar.skill
 
@@ -122,6 +124,47 @@ def test_generate_age_invalid_year():
         cochar.generate_age("invalid", "F")
 
 
+@pytest.mark.parametrize(
+    "year,result",
+    [(1800, 1950), (1950, 1950), (1951, 1955), (2020, 2020), (2100, 2020)],
+)
+def test_correct_pyramid_year(year, result):
+    assert cochar.correct_pyramid_year(year) == result
+
+
+@pytest.mark.parametrize("year", [1925, 1990, 2022])
+@pytest.mark.parametrize("sex", ["M", "F"])
+def test_generate_age_in_range(year, sex):
+    for _ in range(100):
+        assert cochar.MIN_AGE <= cochar.generate_age(year, sex) <= cochar.MAX_AGE
+
+
+def test_age_sampler_is_cached():
+    sampler = cochar.get_age_sampler(1950, "M")
+    assert cochar.get_age_sampler(1950, "M") is sampler
+    assert sampler.age_ranges[-1][1] <= cochar.MAX_AGE
+    assert len(sampler.age_ranges) == len(sampler.alias_table)
+
+
+@pytest.mark.parametrize("n", [0, 1, 100])
+def test_sample_ages(n):
+    ages = cochar.sample_ages(1925, "M", n)
+    assert len(ages) == n
+    assert all(cochar.MIN_AGE <= age <= cochar.MAX_AGE for age in ages)
+
+
+def test_sample_ages_invalid_year():
+    with pytest.raises(cochar.error.InvalidYearValue):
+        cochar.sample_ages("invalid", "M", 1)
+
+
+def test_generate_age_without_file_access():
+    cochar.generate_age(1925, "F")
+    with patch("builtins.open", side_effect=AssertionError("file opened")):
+        for _ in range(10):
+            cochar.generate_age(1925, "F")
+
+
 # TODO: write better unit test
 def test_generate_base_characteristics():
     data = {
@@ -316,6 +359,46 @@ def test_subtract_points_from_str_con_dex(
     )
 
 
+def _subtract_point_by_point(strength, condition, dexterity, subtract_points, rng):
+    characteristics = [strength, condition, dexterity]
+    for _ in range(subtract_points):
+        available = [i for i, value in enumerate(characteristics) if value > 1]
+        if not available:
+            break
+        characteristics[rng.choice(available)] -= 1
+    return tuple(characteristics)
+
+
+@pytest.mark.parametrize(
+    "characteristics,subtract_points",
+    [((16, 20, 60), 40), ((15, 15, 15), 40), ((50, 50, 50), 20), ((3, 80, 2), 80)],
+)
+def test_subtract_points_from_str_con_dex_distribution(
+    characteristics, subtract_points
+):
+    rng = random.Random(80)
+    n = 5000
+    results = [
+        cochar.subtract_points_from_str_con_dex(
+            *characteristics, subtract_points, rng=rng
+        )
+        for _ in range(n)
+    ]
+    expected = [
+        _subtract_point_by_point(*characteristics, subtract_points, rng)
+        for _ in range(n)
+    ]
+    for i in range(3):
+        values = [r[i] for r in results]
+        expected_values = [e[i] for e in expected]
+        assert abs(sum(values) - sum(expected_values)) / n < 0.4
+        assert abs(values.count(1) - expected_values.count(1)) / n < 0.03
+    assert all(
+        sum(characteristics) - sum(r) == min(subtract_points, sum(characteristics) - 3)
+        for r in results
+    )
+
+
 @pytest.mark.parametrize(
     "tested_value,repetition,result",
     [
@@ -341,6 +424,30 @@ def test_characteristic_test(tested_value, repetition, result):
         assert cochar.characteristic_test(tested_value, repetition) == result
 
 
+@pytest.mark.parametrize(
+    "tested_value,repetition,result",
+    [
+        (0, 0, ((0,), (1,))),
+        (150, 0, ((99,), (1,))),
+        (99, 3, ((99,), (1000**3,))),
+        (98, 1, ((98, 99), (980, 1000))),
+    ],
+)
+def test_characteristic_test_distribution(tested_value, repetition, result):
+    assert cochar.characteristic_test_distribution(tested_value, repetition) == result
+
+
+def test_characteristic_test_from_table_matches_simulation():
+    rng = random.Random(7)
+    n = 20000
+    simulated = [cochar.characteristic_test(40, 4, rng=rng) for _ in range(n)]
+    from_table = [
+        cochar.characteristic_test_from_table(40, 4, rng=rng) for _ in range(n)
+    ]
+    assert abs(sum(simulated) / n - sum(from_table) / n) < 0.3
+    assert min(from_table) >= 40 and max(from_table) <= 80
+
+
 @pytest.mark.parametrize(
     "strength,dexterity,size,result",
     [
@@ -387,3 +494,67 @@ class TestCharacter(unittest.TestCase):
     def test_points_assignment_to_dodge(self):
         # TODO: Create a proper test
         pass
+
+
+@pytest.mark.parametrize("n", [0, 1, 10])
+def test_create_characters(n, year, country):
+    characters = cochar.create_characters(n, year, country)
+    assert len(characters) == n
+    assert all(isinstance(c, cochar.character.Character) for c in characters)
+
+
+def test_create_characters_shared_criteria(year, country):
+    characters = cochar.create_characters(5, year, country, sex="F", age=30)
+    assert all(c.sex == "F" and c.age == 30 for c in characters)
+
+
+@pytest.mark.parametrize(
+    "args,error",
+    [
+        ((-1, 1925, "US"), ValueError),
+        ((1, "1925", "US"), cochar.error.InvalidYearValue),
+        ((1, 1925, "T1"), cochar.error.InvalidCountryValue),
+    ],
+)
+def test_create_characters_invalid_input(args, error):
+    with pytest.raises(error):
+        cochar.create_characters(*args)
+
+
+def test_create_characters_invalid_age():
+    with pytest.raises(cochar.error.AgeNotInRange):
+        cochar.create_characters(1, 1925, "US", age=1000)
+
+
+def test_create_characters_names(year, country):
+    characters = cochar.create_characters(20, year, country, first_name="Jan", seed=1)
+    assert all(c.first_name == "Jan" for c in characters)
+    assert all(c.last_name for c in characters)
+
+
+def test_create_character_seed(year, country):
+    assert cochar.create_character(year, country, seed=42) == cochar.create_character(
+        year, country, seed=42
+    )
+
+
+def test_create_character_rng(year, country):
+    first = cochar.create_character(year, country, rng=random.Random(7))
+    second = cochar.create_character(year, country, rng=random.Random(7))
+    assert first == second
+
+
+def test_create_characters_seed(year, country):
+    first = cochar.create_characters(5, year, country, seed=3)
+    second = cochar.create_characters(5, year, country, seed=3)
+    assert first == second
+
+
+@pytest.mark.parametrize("name_type", ["first_names", "last_names"])
+def test_generate_name_rng(name_type):
+    generate = {
+        "first_names": cochar.generate_first_name,
+        "last_names": cochar.generate_last_name,
+    }[name_type]
+    names = [generate(1925, "M", "US", True, rng=random.Random(1)) for _ in range(2)]
+    assert names[0] == names[1]
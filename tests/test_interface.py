@@ -0,0 +1,238 @@
+import random
+from unittest.mock import patch
+
+import pytest
+
+import cochar
+import cochar.interface
+import cochar.skill
+
+
+@pytest.fixture
+def skills_interface():
+    return cochar.interface.SkillsJSONInterface(cochar.SKILLS_DATABASE)
+
+
+def test_default_era(skills_interface):
+    assert skills_interface.era == {"classic-1920", "modern"}
+
+
+@pytest.mark.parametrize(
+    "era", [["classic-1920"], ["modern"], ["classic-1920", "modern"]]
+)
+def test_indexes_match_skills_data(skills_interface, era):
+    skills_interface.era = era
+    data = skills_interface.skills_data
+    available = [
+        skill for skill, item in data.items() if set(item["era"]).issuperset(era)
+    ]
+
+    assert skills_interface.get_skills() == {
+        skill: data[skill]["value"] for skill in available
+    }
+    assert skills_interface.get_all_skills_names() == set(available)
+    assert list(skills_interface.get_basic_skills_names()) == [
+        skill for skill in available if "basic" in data[skill]["categories"]
+    ]
+    for category in skills_interface.get_categories_names():
+        assert list(skills_interface.get_skills_from_category(category)) == [
+            skill for skill in available if category in data[skill]["categories"]
+        ]
+
+
+def test_era_change_rebuilds_indexes(skills_interface):
+    skills_interface.era = ["classic-1920"]
+    classic = skills_interface.get_all_skills_names()
+    skills_interface.era = ["modern"]
+    assert skills_interface.get_all_skills_names() != classic
+
+
+def test_getters_without_rescanning(skills_interface):
+    with patch.object(skills_interface, "skills_data", None):
+        skills_interface.get_skills()
+        skills_interface.get_all_skills_names()
+        skills_interface.get_basic_skills_names()
+        skills_interface.get_skills_from_category("language")
+
+
+def test_get_skills_returns_copy(skills_interface):
+    skills_interface.get_skills()["dodge"] = 99
+    assert skills_interface.get_skills()["dodge"] != 99
+
+
+def test_get_skills_from_unknown_category(skills_interface):
+    assert skills_interface.get_skills_from_category("unknown") == ()
+
+
+@pytest.fixture
+def sql_interface(tmp_path):
+    database = tmp_path / "skills.db"
+    cochar.interface.import_skills_to_sql(cochar.SKILLS_DATABASE, database)
+    interface = cochar.interface.SkillsSQLInterface(database)
+    yield interface
+    interface.close()
+
+
+@pytest.mark.parametrize(
+    "era", [["classic-1920"], ["modern"], ["classic-1920", "modern"]]
+)
+def test_sql_interface_matches_json(sql_interface, skills_interface, era):
+    sql_interface.era = era
+    skills_interface.era = era
+    assert list(sql_interface.get_skills().items()) == list(
+        skills_interface.get_skills().items()
+    )
+    assert sql_interface.get_all_skills_names() == (
+        skills_interface.get_all_skills_names()
+    )
+    assert sql_interface.get_basic_skills_names() == (
+        skills_interface.get_basic_skills_names()
+    )
+    assert set(sql_interface.get_categories_names()) == set(
+        skills_interface.get_categories_names()
+    )
+    for category in skills_interface.get_categories_names():
+        assert sql_interface.get_skills_from_category(category) == (
+            skills_interface.get_skills_from_category(category)
+        )
+
+
+def test_sql_interface_cache(sql_interface):
+    sql_interface.get_skills_from_category("language")
+    with patch.object(sql_interface, "connection", None):
+        sql_interface.get_skills_from_category("language")
+    sql_interface.era = ["modern"]
+    assert sql_interface._skills is None and not sql_interface._categories
+
+
+def test_import_skills_to_sql_updates(tmp_path, sql_interface):
+    house_rules = tmp_path / "house_rules.json"
+    house_rules.write_text(
+        '{"accounting": {"era": ["modern"], "categories": ["basic"], "value": 10},'
+        ' "piloting": {"era": ["classic-1920", "modern"],'
+        ' "categories": ["special"], "value": 3}}'
+    )
+    cochar.interface.import_skills_to_sql(house_rules, sql_interface.database)
+    sql_interface.clear_cache()
+
+    assert "accounting" not in sql_interface.get_all_skills_names()
+    assert sql_interface.get_skills()["piloting"] == 3
+    assert sql_interface.get_skills_from_category("special")[-1] == "piloting"
+    sql_interface.era = ["modern"]
+    assert sql_interface.get_skills()["accounting"] == 10
+    assert next(iter(sql_interface.get_skills())) == "accounting"
+
+
+def test_skills_generator_with_sql_interface(sql_interface):
+    generator = cochar.skill.SkillsGenerator(sql_interface)
+    skills = generator.generate_skills(
+        "professor", 300, 120, 60, 80, rng=random.Random(1)
+    )
+    json_generator = cochar.skill.SkillsGenerator(
+        cochar.interface.SkillsJSONInterface(cochar.SKILLS_DATABASE)
+    )
+    assert skills == json_generator.generate_skills(
+        "professor", 300, 120, 60, 80, rng=random.Random(1)
+    )
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis(decode_responses=True)
+    cochar.interface.import_skills_to_redis(cochar.SKILLS_DATABASE, client)
+    return client
+
+
+@pytest.fixture
+def redis_interface(redis_client):
+    return cochar.interface.SkillsRedisInterface(client=redis_client)
+
+
+@pytest.mark.parametrize(
+    "era", [["classic-1920"], ["modern"], ["classic-1920", "modern"]]
+)
+def test_redis_interface_matches_json(redis_interface, skills_interface, era):
+    redis_interface.era = era
+    skills_interface.era = era
+    assert list(redis_interface.get_skills().items()) == list(
+        skills_interface.get_skills().items()
+    )
+    assert redis_interface.get_all_skills_names() == (
+        skills_interface.get_all_skills_names()
+    )
+    assert set(redis_interface.get_categories_names()) == set(
+        skills_interface.get_categories_names()
+    )
+    for category in skills_interface.get_categories_names():
+        assert redis_interface.get_skills_from_category(category) == (
+            skills_interface.get_skills_from_category(category)
+        )
+
+
+def test_redis_interface_getters_without_network(redis_interface):
+    redis_interface.check_interval = 3600
+    redis_interface.reload()
+    with patch.object(redis_interface, "client", None):
+        redis_interface.get_skills()
+        redis_interface.get_all_skills_names()
+        redis_interface.get_basic_skills_names()
+        redis_interface.get_skills_from_category("language")
+
+
+def test_redis_interface_reloads_new_version(tmp_path, redis_client):
+    redis_interface = cochar.interface.SkillsRedisInterface(
+        client=redis_client, check_interval=0
+    )
+    house_rules = tmp_path / "house_rules.json"
+    house_rules.write_text(
+        '{"accounting": {"era": ["modern"], "categories": ["basic"], "value": 10},'
+        ' "piloting": {"era": ["classic-1920", "modern"],'
+        ' "categories": ["special"], "value": 3}}'
+    )
+    cochar.interface.import_skills_to_redis(house_rules, redis_client)
+
+    assert "accounting" not in redis_interface.get_all_skills_names()
+    assert redis_interface.get_skills()["piloting"] == 3
+    assert redis_interface.get_skills_from_category("special")[-1] == "piloting"
+    redis_interface.era = ["modern"]
+    assert redis_interface.get_skills()["accounting"] == 10
+    assert next(iter(redis_interface.get_skills())) == "accounting"
+
+
+def test_redis_interface_empty_era(redis_interface):
+    redis_interface.era = []
+    assert redis_interface.get_skills() == {}
+    assert redis_interface.get_all_skills_names() == frozenset()
+    assert redis_interface.get_basic_skills_names() == ()
+
+
+def test_skills_generator_reads_new_version_on_set_interface(tmp_path, redis_client):
+    redis_interface = cochar.interface.SkillsRedisInterface(
+        client=redis_client, check_interval=0
+    )
+    generator = cochar.skill.SkillsGenerator(redis_interface)
+    house_rules = tmp_path / "house_rules.json"
+    house_rules.write_text(
+        '{"piloting": {"era": ["classic-1920", "modern"],'
+        ' "categories": ["basic"], "value": 3}}'
+    )
+    cochar.interface.import_skills_to_redis(house_rules, redis_client)
+
+    assert "piloting" not in generator.skills_data
+    generator.set_interface(redis_interface)
+    assert generator.skills_data["piloting"] == 3
+    assert "piloting" in generator.skills_basic
+
+
+def test_skills_generator_with_redis_interface(redis_interface):
+    generator = cochar.skill.SkillsGenerator(redis_interface)
+    skills = generator.generate_skills(
+        "professor", 300, 120, 60, 80, rng=random.Random(1)
+    )
+    json_generator = cochar.skill.SkillsGenerator(
+        cochar.interface.SkillsJSONInterface(cochar.SKILLS_DATABASE)
+    )
+    assert skills == json_generator.generate_skills(
+        "professor", 300, 120, 60, 80, rng=random.Random(1)
+    )
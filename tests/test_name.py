@@ -0,0 +1,125 @@
+import random
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import cochar
+import cochar.name
+
+
+@pytest.fixture
+def pool():
+    return cochar.name.NamePool()
+
+
+def test_name_dataset():
+    dataset = cochar.name.NameDataset(["a", "b", "c"], [0, 0, 5])
+    assert len(dataset) == 3
+    assert dataset.draw(True) == "c"
+    assert dataset.draw_many(10, True) == ["c"] * 10
+    assert set(dataset.draw_many(50, False)) <= {"a", "b", "c"}
+
+
+def test_name_pool_available_years(pool):
+    assert pool.available_years("first_names", "US") == (2018,)
+
+
+def test_name_pool_loads_dataset_once(pool):
+    pool.draw("first_names", 1925, "M", "US", True)
+    with patch("builtins.open", side_effect=AssertionError("file opened")):
+        pool.draw("first_names", 1925, "M", "US", True)
+        pool.draw_many(100, "first_names", 1925, "M", "US", False)
+    assert len(pool) == 1
+
+
+def test_name_pool_year_bucket(pool):
+    first = pool.dataset("last_names", 1900, "N", "US")
+    second = pool.dataset("last_names", 2050, "N", "US")
+    assert first is second
+
+
+def test_name_pool_eviction():
+    pool = cochar.name.NamePool(memory_budget=1)
+    first = pool.dataset("first_names", 1925, "M", "US")
+    pool.dataset("first_names", 1925, "F", "US")
+    assert len(pool) == 1
+    assert pool.memory_usage > pool.memory_budget
+    assert pool.dataset("first_names", 1925, "M", "US") is not first
+
+
+def test_name_pool_lru_order(pool):
+    last = cochar.name.NamePool().dataset("last_names", 1925, "N", "US")
+    male = pool.dataset("first_names", 1925, "M", "US")
+    pool.dataset("first_names", 1925, "F", "US")
+    pool.dataset("first_names", 1925, "M", "US")
+    pool.memory_budget = male.size + last.size
+    pool.dataset("last_names", 1925, "N", "US")
+    assert len(pool) == 2
+    with patch("builtins.open", side_effect=AssertionError("file opened")):
+        assert pool.dataset("first_names", 1925, "M", "US") is male
+    pool.clear()
+    assert len(pool) == 0 and pool.memory_usage == 0
+
+
+def test_name_pool_threads(pool):
+    barrier = threading.Barrier(8)
+    results = []
+
+    def load():
+        barrier.wait()
+        results.append(pool.dataset("first_names", 1925, "M", "US"))
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(pool) == 1
+    assert all(dataset is results[0] for dataset in results)
+    assert pool.memory_usage == results[0].size
+
+
+def test_name_pool_rng(pool):
+    first = pool.draw_many(5, "last_names", 1925, "F", "PL", True, random.Random(1))
+    second = pool.draw_many(5, "last_names", 1925, "F", "PL", True, random.Random(1))
+    assert first == second
+
+
+def test_name_pool_warning(pool):
+    with patch("cochar.SHOW_WARNINGS", True):
+        with pytest.warns(UserWarning):
+            pool.draw("first_names", 1925, "M", "US", True)
+
+
+def test_show_data():
+    data = cochar.name.show_data()
+    assert data["US"] == {"first_names": ("M", "F"), "last_names": ("N",)}
+    assert cochar.name.show_data(cochar.DATABASE) is data
+
+
+def test_available_countries():
+    assert cochar.name.available_countries() == {"ES", "PL", "US"}
+
+
+def test_metadata_without_file_access():
+    cochar.name.show_data()
+    cochar.name.available_countries()
+    with patch("os.listdir", side_effect=AssertionError("listdir")), patch(
+        "builtins.open", side_effect=AssertionError("file opened")
+    ):
+        cochar.name.show_data()
+        cochar.name.available_countries()
+
+
+def test_invalidate_metadata(tmp_path):
+    (tmp_path / "XX").mkdir()
+    (tmp_path / "XX" / "info.json").write_text(
+        '{"country": "XX", "first_names": ["M"], "last_names": ["N"]}'
+    )
+    assert cochar.name.available_countries(str(tmp_path)) == {"XX"}
+    (tmp_path / "YY").mkdir()
+    assert cochar.name.available_countries(str(tmp_path)) == {"XX"}
+    cochar.name.invalidate_metadata()
+    assert cochar.name.available_countries(str(tmp_path)) == {"XX", "YY"}
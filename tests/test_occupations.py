@@ -1,4 +1,7 @@
 #!/usr/bin/python3
+import random
+from unittest.mock import patch
+
 import pytest
 
 import cochar
@@ -244,3 +247,108 @@ def xfail_selected_combinations(request):
 def test_generate_occupation_none_occupation_meets_criteria(occup_type, era, tags):
     with pytest.raises(cochar.error.NoneOccupationMeetsCriteria):
         cochar.occup.generate_occupation(occup_type=occup_type, era=era, tags=tags)
+
+
+def test_generate_occupation_rng():
+    occupations = [
+        cochar.occup.generate_occupation(education=60, rng=random.Random(5))
+        for _ in range(2)
+    ]
+    assert occupations[0] == occupations[1]
+
+
+@pytest.mark.parametrize(
+    "criteria,result",
+    [
+        ((None, None, None), (None, None, None)),
+        (("", [], []), (None, None, None)),
+        (
+            ("classic", ["modern", "classic-1920", "modern"], ["a", "b"]),
+            ("classic", ("classic-1920", "modern"), frozenset({"a", "b"})),
+        ),
+        ((None, "modern", None), (None, "modern", None)),
+    ],
+)
+def test_normalise_criteria(criteria, result):
+    assert cochar.occup._normalise_criteria(*criteria) == result
+
+
+def test_filter_occupation_groups_cached():
+    first = cochar.occup.filter_occupation_groups(None, None, frozenset({"criminal"}))
+    second = cochar.occup.filter_occupation_groups(None, None, frozenset({"criminal"}))
+    assert first is second
+    assert len(first) == len(cochar.OCCUPATIONS_GROUPS)
+    assert {o for group in first for o in group} == {"gangster boss", "criminal"}
+
+
+def test_filter_occupation_groups_without_criteria():
+    groups = cochar.occup.filter_occupation_groups()
+    assert [list(group) for group in groups] == cochar.OCCUPATIONS_GROUPS
+
+
+def test_candidate_occupation_groups():
+    criteria = (None, None, frozenset({"criminal"}))
+    candidates = cochar.occup.candidate_occupation_groups(*criteria)
+    assert candidates is cochar.occup.candidate_occupation_groups(*criteria)
+    groups = cochar.occup.filter_occupation_groups(*criteria)
+    assert candidates == tuple(
+        (group_id, group) for group_id, group in enumerate(groups) if group
+    )
+    assert cochar.occup.candidate_occupation_groups("unknown") == ()
+
+
+def test_generate_occupation_uses_cached_candidates():
+    cochar.occup.generate_occupation(80, 50, 50, 50, 50, tags=["criminal"])
+    with patch("cochar.occup.filter_occupation_groups", None):
+        occupation = cochar.occup.generate_occupation(
+            80, 50, 50, 50, 50, tags=["criminal"]
+        )
+    assert occupation in {"gangster boss", "criminal"}
+
+
+@pytest.mark.parametrize(
+    "occup_type,era,tags",
+    [
+        (None, None, None),
+        ("classic", None, None),
+        ("expansion", ["classic-1920"], None),
+        (None, "modern", None),
+        (None, "classic", None),
+        (None, None, ["lovecraftian"]),
+        ("classic", ["classic-1920", "modern"], ["criminal"]),
+        (None, None, ["lovecraftian", "criminal"]),
+        ("unknown", None, None),
+    ],
+)
+def test_occupation_index_query(occup_type, era, tags):
+    index = cochar.occup.OCCUPATIONS_INDEX
+    expected = tuple(
+        occupation
+        for occupation, data in cochar.OCCUPATIONS_DATA.items()
+        if (not occup_type or data["type"] == occup_type)
+        and (not era or data["era"] in era)
+        and (not tags or set(tags) <= set(data["tags"]))
+    )
+    mask = index.query(occup_type, era, tags)
+    assert index.occupations(mask) == expected
+    assert index.count(occup_type, era, tags) == len(expected)
+
+
+def test_occupation_index_groups():
+    index = cochar.occup.OCCUPATIONS_INDEX
+    groups = [list(index.occupations(group)) for group in index.groups]
+    assert groups == cochar.OCCUPATIONS_GROUPS
+
+
+def test_occupation_index_custom_data():
+    index = cochar.occup.OccupationIndex(
+        {
+            "a": {"type": "t", "era": "e", "tags": ["x"], "groups": ["edu"]},
+            "b": {"type": "t", "era": "f", "tags": [], "groups": ["edu", "edustr"]},
+        }
+    )
+    assert index.all == 0b11
+    assert index.groups == (0b11, 0, 0, 0, 0b10)
+    assert index.count(tags=["x"]) == 1
+    assert index.count(era=["f"]) == 1
+    assert index.count(occup_type="t", tags=["y"]) == 0
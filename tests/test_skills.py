@@ -1,5 +1,7 @@
+import random
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import cochar
 import cochar.skill
@@ -19,6 +21,19 @@ def test_skill_test():
         assert cochar.skill.skill_test(100, 1) == 196
 
 
+def test_skill_test_distribution():
+    values, cum_weights = cochar.skill.skill_test_distribution(96, 1)
+    assert values == tuple(range(96, 107))
+    assert cum_weights == tuple(range(950, 1001, 5))
+    assert cochar.skill.skill_test_distribution(20, 0) == ((20,), (1,))
+
+
+def test_skill_test_from_table():
+    assert cochar.skill.skill_test_from_table(50, 0) == 50
+    results = {cochar.skill.skill_test_from_table(96, 1) for _ in range(1000)}
+    assert results <= set(range(96, 107))
+
+
 @pytest.mark.parametrize(
     "tested_input,points",
     [
@@ -116,7 +131,7 @@ def test_filter_skills_dodge_language_own(skills_interface):
     [
         ([1, ["dodge"], {}], {"dodge": 1}),
         ([1, ["non existing skill"], {}], {"non existing skill": 2}),
-        ([100, ["dodge"], {}], {"dodge": 0}),  # TODO: fix this edge case
+        ([100, ["dodge"], {}], {"dodge": 90}),
         ([100, ["electronics"], {}], {"electronics": 90}),  # That's good case
         ([0, [], {}], {}),
         ([0, ["dodge", "nothing"], {}], {"dodge": 0, "nothing": 1}),
@@ -130,6 +145,37 @@ def test_assign_skill_points(args, output_skills, skills_interface):
     )
 
 
+@pytest.mark.parametrize("points", [0, 1, 7, 50, 200, 400, 1000])
+def test_assign_skill_points_total(points, skills_interface):
+    skills_generator = cochar.skill.SkillsGenerator(skills_interface)
+    skills_list = ["dodge", "history", "occult", "occult", "spot hidden", "xyz"]
+    rng = random.Random(points)
+    for _ in range(50):
+        skills = skills_generator._assign_skill_points(
+            points, skills_list, cochar.skill.SkillsDict({"history": 85}), rng=rng
+        )
+        initial = {
+            skill: skills_generator.skills_data.get(skill, 1)
+            for skill in skills_list
+            if skill != "history"
+        }
+        initial["history"] = 85
+        headroom = sum(cochar.MAX_SKILL_LEVEL - value for value in initial.values())
+        assert sum(skills.values()) - sum(initial.values()) == min(points, headroom)
+        assert all(
+            initial[skill] <= value <= cochar.MAX_SKILL_LEVEL
+            for skill, value in skills.items()
+        )
+
+
+def test_assign_skill_points_over_max(skills_interface):
+    skills = cochar.skill.SkillsGenerator(skills_interface)._assign_skill_points(
+        50, ["history", "occult"], cochar.skill.SkillsDict({"history": 95})
+    )
+    assert skills["history"] == 95
+    assert skills["occult"] == skills_interface.get_skills()["occult"] + 50
+
+
 @pytest.mark.parametrize(
     "input_skills,output_skills",
     [
@@ -164,9 +210,12 @@ def test_assign_skill_points(args, output_skills, skills_interface):
     ],
 )
 def test_category_skills(input_skills, output_skills, skills_interface):
-    skills = cochar.skill.SkillsGenerator(skills_interface)._get_category_skills(
+    plan = cochar.skill.SkillsGenerator(skills_interface)._compile_skill_plan(
         input_skills
     )
+    skills = plan.draw()
+
+    assert not plan.fixed and not plan.choices
 
     assert set(skills).issubset(output_skills)
 
@@ -196,10 +245,37 @@ def test_category_skills(input_skills, output_skills, skills_interface):
         ([], {}),
     ],
 )
-def test_get_choice_skills(input_list, output_skills, skills_interface):
-    assert set(
-        cochar.skill.SkillsGenerator(skills_interface)._get_choice_skills(input_list)
-    ).issubset(output_skills)
+def test_choice_skills(input_list, output_skills, skills_interface):
+    plan = cochar.skill.SkillsGenerator(skills_interface)._compile_skill_plan(
+        input_list
+    )
+    skills = [skill for group in plan.choices for skill in group.draw()]
+
+    assert len(plan.choices) == sum(isinstance(item, list) for item in input_list)
+    assert set(skills).issubset(output_skills)
+
+
+def test_get_choice_group(skills_interface):
+    generator = cochar.skill.SkillsGenerator(skills_interface)
+    choice_group = generator._get_choice_group([2, "first aid", "1i", "firearms"])
+    assert choice_group.k == 2
+    assert choice_group.options[0] == "first aid"
+    assert choice_group.options[1] == cochar.skill.CategoryDraw(
+        1, skills_interface.get_skills_from_category("interpersonal")
+    )
+    assert choice_group.options[2] == cochar.skill.CategoryDraw(
+        1, skills_interface.get_skills_from_category("firearms")
+    )
+    assert generator._get_choice_group([2, "first aid", "1i", "firearms"]) is (
+        choice_group
+    )
+
+
+def test_choice_group_draw():
+    choice_group = cochar.skill.ChoiceGroup(
+        2, ("occult", cochar.skill.CategoryDraw(2, ("a", "b")))
+    )
+    assert sorted(choice_group.draw()) == ["a", "b", "occult"]
 
 
 @pytest.mark.parametrize(
@@ -218,9 +294,11 @@ def test_get_choice_skills(input_list, output_skills, skills_interface):
         ([], {}),
     ],
 )
-def test_get_skills_list(input_list, output_skills, skills_interface):
+def test_skill_plan_draw(input_list, output_skills, skills_interface):
     assert set(
-        cochar.skill.SkillsGenerator(skills_interface)._get_skills_list(input_list)
+        cochar.skill.SkillsGenerator(skills_interface)
+        ._compile_skill_plan(input_list)
+        .draw()
     ).issubset(output_skills)
 
 
@@ -262,3 +340,243 @@ def test_generate_credit_rating_points_all_occupations():
                 occupation, points
             )
             assert 0 <= credit_rating <= points
+
+
+def test_occupations_groups_index():
+    assert cochar.occup.SKILL_POINTS_GROUPS is cochar.SKILL_POINTS_GROUPS
+    for occupation in cochar.OCCUPATIONS_LIST:
+        assert cochar.OCCUPATIONS_GROUPS_INDEX[occupation] == tuple(
+            i
+            for i, group in enumerate(cochar.OCCUPATIONS_GROUPS)
+            if occupation in group
+        )
+
+
+def test_calc_skill_points_unknown_occupation():
+    with pytest.raises(ValueError):
+        cochar.skill.calc_skill_points("unknown", 50, 50, 50, 50, 50)
+
+
+def test_compile_skill_plan(skills_interface):
+    generator = cochar.skill.SkillsGenerator(skills_interface)
+    plan = generator._compile_skill_plan(
+        ["history", [1, "occult", "natural world"], "2l", "firearms"]
+    )
+    assert plan.fixed == ("history",)
+    assert plan.choices == (cochar.skill.ChoiceGroup(1, ("occult", "natural world")),)
+    assert plan.categories == (
+        cochar.skill.CategoryDraw(
+            2, skills_interface.get_skills_from_category("language")
+        ),
+        cochar.skill.CategoryDraw(
+            1, skills_interface.get_skills_from_category("firearms")
+        ),
+    )
+    skills = plan.draw()
+    assert len(skills) == 5 and skills[0] == "history"
+
+
+def test_get_skill_plan(skills_interface):
+    generator = cochar.skill.SkillsGenerator(skills_interface)
+    for occupation, data in cochar.OCCUPATIONS_DATA.items():
+        plan = generator.get_skill_plan(occupation)
+        assert plan == generator._compile_skill_plan(data["skills"])
+        skills = plan.draw(random.Random(occupation))
+        assert skills[: len(plan.fixed)] == list(plan.fixed)
+        for category_draw in reversed(plan.categories):
+            drawn = [skills.pop() for _ in range(category_draw.k)]
+            assert set(drawn) <= set(category_draw.population)
+
+
+def test_get_skill_plan_cached(skills_interface):
+    generator = cochar.skill.SkillsGenerator(skills_interface)
+    plan = generator.get_skill_plan("soldier")
+    assert generator.get_skill_plan("soldier") is plan
+    assert (
+        cochar.skill.SkillsGenerator(skills_interface).get_skill_plan("soldier") == plan
+    )
+
+
+@pytest.mark.parametrize("era", [None, "modern"])
+def test_skill_plan_does_not_depend_on_era_form(skills_interface, era):
+    interface = Mock(wraps=skills_interface, era=era)
+    generator = cochar.skill.SkillsGenerator(interface)
+    assert generator.get_skill_plan("soldier") == cochar.skill.SkillsGenerator(
+        skills_interface
+    ).get_skill_plan("soldier")
+
+
+def test_hobby_skill_plan(skills_interface):
+    generator = cochar.skill.SkillsGenerator(skills_interface)
+    skills = generator.hobby_skill_plan.draw()
+    assert len(skills) == len(generator.skills_basic)
+    assert set(skills) <= generator.skills_all
+
+
+def test_generate_skills_does_not_change_generator(skills_interface):
+    generator = cochar.skill.SkillsGenerator(skills_interface)
+    skills_data = generator.skills_data.copy()
+    skill_plans = generator._skill_plans.copy()
+    skills = generator.generate_skills("professor", 300, 120, 70, 80)
+    assert generator.skills_data == skills_data
+    assert generator._skill_plans == skill_plans
+    assert skills.get("dodge", 35) >= 35
+    assert skills.get("language (own)", 80) >= 80
+
+
+def test_generate_skills_shared_between_threads(skills_interface):
+    from concurrent.futures import ThreadPoolExecutor
+
+    generator = cochar.skill.SkillsGenerator(skills_interface)
+
+    def generate(seed):
+        return generator.generate_skills(
+            cochar.OCCUPATIONS_LIST[seed % len(cochar.OCCUPATIONS_LIST)],
+            250,
+            120,
+            seed % 90,
+            90 - seed % 90,
+            rng=random.Random(seed),
+        )
+
+    expected = [generate(seed) for seed in range(200)]
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(generate, range(200))) == expected
+
+
+@pytest.mark.parametrize(
+    "era,expected",
+    [
+        (None, {"classic-1920", "modern"}),
+        ([], {"classic-1920", "modern"}),
+        ("modern", {"modern"}),
+        (["modern"], {"modern"}),
+        (("modern", "classic-1920", "modern"), {"classic-1920", "modern"}),
+    ],
+)
+def test_get_generator(era, expected):
+    generator = cochar.skill.get_generator(era)
+    assert generator.interface.era == expected
+    assert cochar.skill.get_generator(era) is generator
+
+
+def test_get_generator_eras_are_independent():
+    modern = cochar.skill.get_generator(["modern"])
+    classic = cochar.skill.get_generator(["classic-1920"])
+    assert modern is not classic
+    assert modern.skills_all != classic.skills_all
+    assert cochar.SKILLS_INTERFACE.era == {"classic-1920", "modern"}
+
+
+def test_get_generator_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    cochar.skill._GENERATORS.clear()
+    with ThreadPoolExecutor(8) as executor:
+        generators = list(executor.map(cochar.skill.get_generator, [["modern"]] * 32))
+    assert all(generator is generators[0] for generator in generators)
+
+
+def test_get_generator_cache_hit_without_lock():
+    generator = cochar.skill.get_generator(["modern"])
+    with patch("cochar.skill._GENERATORS_LOCK", None):
+        assert cochar.skill.get_generator(["modern"]) is generator
+
+
+def test_get_generator_bounded_cache():
+    cochar.skill._GENERATORS.clear()
+    with patch("cochar.skill._MAX_GENERATORS", 2):
+        first = cochar.skill.get_generator(["modern"])
+        cochar.skill.get_generator(["classic-1920"])
+        cochar.skill.get_generator()
+        assert len(cochar.skill._GENERATORS) == 2
+        assert cochar.skill.get_generator(["modern"]) is not first
+
+
+def test_skills_array_mapping():
+    skills = cochar.skill.SkillsArray({"dodge": 40, "climb": 20, "house rule": 5})
+    assert skills == cochar.skill.SkillsDict(
+        {"dodge": 40, "climb": 20, "house rule": 5}
+    )
+    assert len(skills) == 3
+    assert "climb" in skills and "swim" not in skills
+    assert skills.get("swim") is None
+    with pytest.raises(KeyError):
+        skills["swim"]
+    del skills["climb"]
+    del skills["house rule"]
+    assert skills.get_json_format() == {"dodge": 40}
+    with pytest.raises(KeyError):
+        del skills["climb"]
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [
+        ("20", cochar.error.SkillValueNotAnInt),
+        (-1, cochar.error.SkillPointsBelowZero),
+    ],
+)
+def test_skills_array_validation(value, error):
+    with pytest.raises(error):
+        cochar.skill.SkillsArray({"climb": value})
+
+
+def test_skills_array_insertion_order():
+    items = [
+        ("spot hidden", 50),
+        ("house rule", 5),
+        ("climb", 20),
+        ("table rule", 3),
+        ("dodge", 40),
+    ]
+    skills = cochar.skill.SkillsArray(items)
+    expected = cochar.skill.SkillsDict(items)
+    for container in (skills, expected):
+        container["climb"] = 25
+        del container["spot hidden"]
+        container["spot hidden"] = 60
+        del container["house rule"]
+        container["house rule"] = 6
+        container["table rule"] = 4
+    assert list(skills) == list(expected)
+    assert list(skills.get_json_format().items()) == list(
+        expected.get_json_format().items()
+    )
+    assert list(skills.copy()) == list(expected)
+
+
+def test_skills_array_copy():
+    skills = cochar.skill.SkillsArray({"climb": 20})
+    copy = skills.copy()
+    copy["climb"] = 30
+    assert skills["climb"] == 20
+
+
+def test_generate_skills_into_skills_array():
+    generator = cochar.SKILLS_GENERATOR
+    skills = generator.generate_skills(
+        "professor",
+        300,
+        120,
+        60,
+        80,
+        cochar.skill.SkillsArray(),
+        rng=random.Random(1),
+    )
+    assert isinstance(skills, cochar.skill.SkillsArray)
+    expected = generator.generate_skills(
+        "professor", 300, 120, 60, 80, rng=random.Random(1)
+    )
+    assert list(skills.get_json_format().items()) == list(
+        expected.get_json_format().items()
+    )
+    assert list(skills) == list(expected)
+
+
+def test_character_with_skills_array():
+    character = cochar.create_character(
+        1925, "US", skills=cochar.skill.SkillsArray(), seed=1
+    )
+    assert isinstance(character.skills, cochar.skill.SkillsArray)
+    assert character == cochar.create_character(1925, "US", seed=1)
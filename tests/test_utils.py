@@ -27,3 +27,40 @@ def test_narrowed_bisect(a, x, result):
 )
 def test_is_skill_valid(skill_value, result):
     assert cochar.utils.is_skill_valid(skill_value) == result
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [[1], [1, 1], [1, 0, 3], [0, 0, 5], [5, 1, 1, 1, 1, 1]],
+)
+def test_alias_table_distribution(weights):
+    table = cochar.utils.AliasTable(weights)
+    n = 20000
+    draws = table.sample_many(n)
+    total = sum(weights)
+    for i, weight in enumerate(weights):
+        assert abs(draws.count(i) / n - weight / total) < 0.02
+    assert table.sample() in range(len(weights))
+
+
+@pytest.mark.parametrize(
+    "tested_value,repetition,result",
+    [
+        (50, 0, {50: 1}),
+        (100, 1, {100: 1000}),
+        (0, 1, {i: 100 for i in range(1, 11)}),
+        (98, 1, {98: 980, **{i: 2 for i in range(99, 109)}}),
+    ],
+)
+def test_improvement_test_distribution(tested_value, repetition, result):
+    distribution = cochar.utils.improvement_test_distribution(
+        tested_value, repetition, lambda value: min(max(100 - value, 0), 100)
+    )
+    assert distribution == result
+    assert sum(distribution.values()) == 1000**repetition
+
+
+@pytest.mark.parametrize("weights", [[], [0], [0, 0]])
+def test_alias_table_invalid_weights(weights):
+    with pytest.raises(ValueError):
+        cochar.utils.AliasTable(weights)
@@ -22,6 +22,7 @@ from flask_restful import Api, Resource, reqparse
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import cochar
 import cochar.occup
+import cochar.skill
 from cochar import error
 
 _THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
@@ -153,8 +154,21 @@ class GenerateCharacter(Resource):
 
                 occup_type = advanced_args.occup_type
 
-                cochar.SKILLS_INTERFACE.era = era
-                skills_generator = cochar.skill.SkillsGenerator(cochar.SKILLS_INTERFACE)
+                if (
+                    not kwargs.get("occupation")
+                    and not kwargs.get("random_mode")
+                    and not cochar.occup.OCCUPATIONS_INDEX.count(occup_type, era, tags)
+                ):
+                    return {
+                        "status": "fail",
+                        "origin": "cochar",
+                        "message": (
+                            f"None occupation meets following criteria: "
+                            f"type: {occup_type}, era: {era}, tags: {tags}"
+                        ),
+                    }, 400
+
+                skills_generator = cochar.skill.get_generator(era)
 
                 character = cochar.create_character(
                     era=era,